@@ -27,6 +27,7 @@ from .capture import (
     get_citation,
     get_selected_text,
     ocr_image,
+    ocr_images,
     parse_browser_citation,
     parse_pdf_citation,
     take_screenshot,
@@ -70,6 +71,7 @@ __all__ = [
     "copy_to_clipboard",
     "take_screenshot",
     "ocr_image",
+    "ocr_images",
     "create_temp_screenshot",
     "ScreenshotCapture",
     # Citation
@@ -20,6 +20,7 @@ from .screenshot import (
     ScreenshotCapture,
     create_temp_screenshot,
     ocr_image,
+    ocr_images,
     take_screenshot,
 )
 from .text import copy_to_clipboard, get_active_window_title, get_selected_text
@@ -32,6 +33,7 @@ __all__ = [
     # Screenshot capture
     "take_screenshot",
     "ocr_image",
+    "ocr_images",
     "create_temp_screenshot",
     "ScreenshotCapture",
     # Citation
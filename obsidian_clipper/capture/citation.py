@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from .text import get_active_window_title
@@ -16,11 +19,11 @@ logger = logging.getLogger(__name__)
 # Pre-compiled regex patterns
 # ---------------------------------------------------------------------------
 
-IGNORED_WINDOW_TITLE_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"flameshot", re.IGNORECASE),
-    re.compile(r"obsidian\s*clipper", re.IGNORECASE),
-    re.compile(r"gnome\s*shell", re.IGNORECASE),
-]
+# Transient windows that briefly take focus when the capture hotkey fires;
+# matched anywhere in the title, since e.g. Flameshot windows carry suffixes.
+IGNORED_WINDOW_TITLE_PATTERN = re.compile(
+    r"flameshot|obsidian\s*clipper|gnome\s*shell", re.IGNORECASE
+)
 
 # Combined: matches any page-number representation in reader titles.
 #   "page 42" | "p. 42" | "pg. 42" | "(42/100)" | "42/100" | "42 of 100"
@@ -51,11 +54,19 @@ EPUB_APP_PATTERN = re.compile(
 
 # Browser title patterns: "Page Title — BrowserName"
 BROWSER_PATTERN = re.compile(
-    r"(.+?)\s*[—\-–]\s*"
-    r"(Google Chrome|Chrome|Mozilla Firefox|Firefox|Microsoft Edge|Edge"
-    r"|Brave|Chromium|Vivaldi)"
+    r"(?P<title>.+?)\s*[—\-–]\s*"
+    r"(?P<browser>Google Chrome|Chrome|Mozilla Firefox|Firefox|Microsoft Edge"
+    r"|Edge|Brave|Chromium|Vivaldi)"
 )
 
+# Short browser names as they appear in some title bars, mapped to the
+# vendor-qualified names used elsewhere
+_BROWSER_CANONICAL_NAMES = {
+    "Chrome": "Google Chrome",
+    "Firefox": "Mozilla Firefox",
+    "Edge": "Microsoft Edge",
+}
+
 # JetBrains IDE title patterns: "file — project — IDEName"
 JETBRAINS_PATTERN = re.compile(
     r"(.+?)\s*[—\-–]\s*(.+?)\s*[—\-–]\s*"
@@ -96,10 +107,99 @@ PDF_READER_APP_PATTERN = re.compile(
     r"(Atril|Xreader|MuPDF|Acrobat|Foxit)", re.IGNORECASE
 )
 
+
+
+@functools.cache
+def _document_reader_pattern() -> re.Pattern[str]:
+    """Return the document reader title pattern, compiled on first use.
+
+    Alternatives are tried as one anchored alternation, ordered by
+    precedence; the outermost named group identifies the reader:
+
+        Evince:          "Document.pdf — Page 42"
+        Zathura:         "Document.pdf (42/100)"
+        Okular (file):   "Doc.pdf : Page 42 - Okular"
+        Okular (title):  "Title — Page 42 — Okular"
+        Okular (other):  "Title — Okular" with the page elsewhere in the title
+
+    This is the largest pattern in the module and plain Evince titles never
+    need it, so it is not compiled at import.
+    """
+    return re.compile(
+        r"(?P<evince>(?P<evince_title>.+\.pdf)\s*[—\-–]\s*Page\s*"
+        r"(?P<evince_page>\d+))"
+        r"|(?P<zathura>(?P<zathura_title>.+\.pdf)\s*\((?P<zathura_page>\d+)/\d+\))"
+        r"|(?P<okular_file>(?P<okular_file_title>.+\.pdf)\s*:\s*Page\s*"
+        r"(?P<okular_file_page>\d+)\s*-\s*Okular)"
+        r"|(?P<okular_paged>(?P<okular_paged_title>.+?)\s*[—\-–]\s*Page\s*"
+        r"(?P<okular_paged_page>\d+)\s*[—\-–]\s*Okular)"
+        r"|(?P<okular>(?P<okular_title>.+?)\s*[—\-–]\s*Okular)",
+        re.IGNORECASE,
+    )
+
+
+# Separator of the most common Evince title, "Paper.pdf — Page 42", which
+# parse_pdf_citation recognises with plain string operations
+_EVINCE_PAGE_SEPARATOR = " — Page "
+
+_DOCUMENT_READER_SOURCES: dict[str, str] = {
+    "evince": "Evince",
+    "zathura": "Zathura",
+    "okular_file": "Okular",
+    "okular_paged": "Okular",
+}
+
+# EPUB reader: "Title — Page 9 — Foliate" / "Title — p. 9"
+EPUB_TITLE_PAGE_PATTERN = re.compile(
+    r"(.+?)\s*[—\-–]\s*(?:Page|p\.)\s*\d+", re.IGNORECASE
+)
+
+# Trailing EPUB reader app segment: "Title — Foliate …"
+EPUB_APP_SUFFIX_PATTERN = re.compile(
+    r"\s*[—\-–]\s*(Foliate|Calibre|Thorium|FBReader|Atris|Xreader|MuPDF).*",
+    re.IGNORECASE,
+)
+
+# Generic file-extension matches for the document fallback
+PDF_FILE_PATTERN = re.compile(r"([^\n]+\.pdf)", re.IGNORECASE)
+EPUB_FILE_PATTERN = re.compile(r"([^\n]+\.epub)", re.IGNORECASE)
+
+# Known PDF reader app named in a title without a file extension
+PDF_READER_NAME_PATTERN = re.compile(r"(Okular|Evince|Zathura)", re.IGNORECASE)
+PDF_READER_SUFFIX_PATTERN = re.compile(
+    r"\s*[—\-–]\s*(Okular|Evince|Zathura).*", re.IGNORECASE
+)
+
+# VSCode: "filename.py - project - Visual Studio Code"
+VSCODE_PATTERN = re.compile(r"(.+?)\s*-\s*(.+?)\s*-\s*Visual Studio Code")
+
+# Generic editor: "filename.py - ProjectName"
+EDITOR_FILE_PATTERN = re.compile(r"(.+?\.\w+)\s*-\s*(.+)")
+
+# Generic fallback: "Title — Source"
+GENERIC_DASH_PATTERN = re.compile(r"(.+?)\s*[—\-–]\s*(.+)$")
+
+# Separators between title segments ("Title — App"); every parser except the
+# PDF/EPUB ones requires one of these.
+_TITLE_SEPARATORS = ("—", "-", "–")
+
+# Literal substrings that must appear in a title before the PDF or browser
+# regexes can possibly match. Checked with plain ``in`` to skip regex work on
+# titles from unrelated applications.
+_PDF_TITLE_MARKERS = (".pdf", "okular", "evince", "zathura")
+_BROWSER_TITLE_MARKERS = ("Chrome", "Chromium", "Firefox", "Edge", "Brave", "Vivaldi")
+
+# Placeholder source names that are omitted from formatted citations
+_GENERIC_SOURCE_NAMES = frozenset({"PDF Reader", "Browser", "Unknown"})
+
 # Citation detection retry configuration
-CITATION_RETRY_ATTEMPTS = 6
-CITATION_RETRY_DELAY = 0.12  # seconds between attempts
-CITATION_RETRY_BACKOFF = 1.0  # constant delay (no exponential backoff)
+# Poll quickly at first (the real window usually returns within a few tens of
+# milliseconds), then back off. Delays of 0.02, 0.04, 0.08, 0.15, 0.15 and
+# 0.15s keep the worst-case wait at 0.59s, within the old 6 x 0.12s budget.
+CITATION_RETRY_ATTEMPTS = 7
+CITATION_RETRY_DELAY = 0.02  # seconds before the second attempt
+CITATION_RETRY_BACKOFF = 2.0  # exponential backoff factor
+CITATION_RETRY_MAX_DELAY = 0.15  # cap on the delay between attempts
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -120,6 +220,29 @@ def _strip_trailing_page_segment(title: str) -> str:
     return TRAILING_PAGE_PATTERN.sub("", title).strip()
 
 
+def _has_pdf_marker(window_title: str) -> bool:
+    """Cheap check for a PDF file name or PDF reader name in *window_title*."""
+    lowered = window_title.lower()
+    return any(marker in lowered for marker in _PDF_TITLE_MARKERS)
+
+
+def _has_epub_marker(window_title: str) -> bool:
+    """Cheap check for an EPUB file name or EPUB reader name in *window_title*."""
+    return ".epub" in window_title.lower() or bool(
+        EPUB_APP_PATTERN.search(window_title)
+    )
+
+
+def _has_browser_marker(window_title: str) -> bool:
+    """Cheap check for a supported browser name in *window_title*."""
+    return any(marker in window_title for marker in _BROWSER_TITLE_MARKERS)
+
+
+def _has_title_separator(window_title: str) -> bool:
+    """Check for any dash-style separator used between title segments."""
+    return any(sep in window_title for sep in _TITLE_SEPARATORS)
+
+
 def _looks_like_pdf_or_epub_context(window_title: str) -> bool:
     """Check whether a title appears to come from PDF/EPUB context."""
     return bool(PDF_EPUB_CONTEXT_PATTERN.search(window_title))
@@ -139,16 +262,21 @@ class SourceType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Citation:
     """Represents a citation from a source document.
 
+    Citations are immutable and slotted: they are created once per parsed
+    window title and shared read-only, so identical titles yield the same
+    instance.
+
     Attributes:
         title: Document or page title.
         page: Page number (for PDFs).
         url: URL (for web sources).
         source: Source application name.
         source_type: Type of source (PDF, browser, etc.).
+        extra: Read-only source-specific details (e.g. editor project).
     """
 
     title: str
@@ -156,19 +284,26 @@ class Citation:
     url: str | None = None
     source: str | None = None
     source_type: SourceType = SourceType.UNKNOWN
-    extra: dict[str, Any] = field(default_factory=dict)
+    # Left out of the hash: a mappingproxy is unhashable, and the other
+    # fields already identify the citation. It still takes part in ==.
+    extra: Mapping[str, Any] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self) -> None:
+        # Freeze a private copy so shared instances cannot be changed.
+        if not isinstance(self.extra, MappingProxyType):
+            object.__setattr__(self, "extra", MappingProxyType(dict(self.extra)))
 
     def format_markdown(self) -> str:
         """Format citation as markdown string."""
         parts: list[str] = []
         if self.title:
-            citation_title = self.title
             if self.page:
-                citation_title = f"{citation_title}, p. {self.page}"
-            parts.append(f"*{citation_title}*")
-        if self.source and self.source not in ("PDF Reader", "Browser", "Unknown"):
+                parts.append(f"*{self.title}, p. {self.page}*")
+            else:
+                parts.append(f"*{self.title}*")
+        if self.source and self.source not in _GENERIC_SOURCE_NAMES:
             parts.append(self.source)
-        return " — " + " · ".join(parts) if parts else ""
+        return f" — {' · '.join(parts)}" if parts else ""
 
     def __str__(self) -> str:
         return self.format_markdown()
@@ -202,62 +337,21 @@ def _parse_document_citation(
 
     page_number = _extract_page_number(window_title)
 
-    # -- Evince: "Document.pdf — Page 42" ---------------------------------
-    evince_match = re.match(
-        r"(.+\.pdf)\s*[—\-–]\s*Page\s*(\d+)", window_title, re.IGNORECASE
-    )
-    if evince_match:
-        return Citation(
-            title=evince_match.group(1).strip(),
-            page=evince_match.group(2),
-            source="Evince",
-            source_type=source_type,
-        )
-
-    # -- Zathura: "Document.pdf (42/100)" ----------------------------------
-    zathura_match = re.match(
-        r"(.+\.pdf)\s*\((\d+)/\d+\)", window_title, re.IGNORECASE
-    )
-    if zathura_match:
-        return Citation(
-            title=zathura_match.group(1).strip(),
-            page=zathura_match.group(2),
-            source="Zathura",
-            source_type=source_type,
-        )
-
-    # -- Okular: "Doc.pdf : Page 42 - Okular" ------------------------------
-    okular_match = re.match(
-        r"(.+\.pdf)\s*:\s*Page\s*(\d+)\s*-\s*Okular", window_title, re.IGNORECASE
-    )
-    if okular_match:
-        return Citation(
-            title=okular_match.group(1).strip(),
-            page=okular_match.group(2),
-            source="Okular",
-            source_type=source_type,
-        )
-
-    # -- Okular: "Title — Page 42 — Okular" --------------------------------
-    okular_tp = re.match(
-        r"(.+?)\s*[—\-–]\s*Page\s*(\d+)\s*[—\-–]\s*Okular",
-        window_title,
-        re.IGNORECASE,
-    )
-    if okular_tp:
-        return Citation(
-            title=okular_tp.group(1).strip(),
-            page=okular_tp.group(2),
-            source="Okular",
-            source_type=source_type,
+    # -- Evince / Zathura / Okular, resolved in a single pass --------------
+    document_match = _document_reader_pattern().match(window_title)
+    if document_match:
+        reader = document_match.lastgroup or ""
+        if reader in _DOCUMENT_READER_SOURCES:
+            return Citation(
+                title=document_match.group(f"{reader}_title").strip(),
+                page=document_match.group(f"{reader}_page"),
+                source=_DOCUMENT_READER_SOURCES[reader],
+                source_type=source_type,
+            )
+        # Okular (generic): "Title — Okular" with page elsewhere
+        title = _strip_trailing_page_segment(
+            document_match.group("okular_title").strip()
         )
-
-    # -- Okular (generic): "Title — Okular" with page elsewhere -------------
-    okular_generic = re.match(
-        r"(.+?)\s*[—\-–]\s*Okular", window_title, re.IGNORECASE
-    )
-    if okular_generic:
-        title = _strip_trailing_page_segment(okular_generic.group(1).strip())
         if title and len(title) > 3 and page_number:
             return Citation(
                 title=title,
@@ -271,21 +365,12 @@ def _parse_document_citation(
         epub_app_match = EPUB_APP_PATTERN.search(window_title)
         if epub_app_match and page_number:
             source = epub_app_match.group(1)
-            title_match = re.match(
-                r"(.+?)\s*[—\-–]\s*(?:Page|p\.)\s*\d+",
-                window_title,
-                re.IGNORECASE,
-            )
+            title_match = EPUB_TITLE_PAGE_PATTERN.match(window_title)
             if title_match:
                 title = _strip_trailing_page_segment(title_match.group(1).strip())
             else:
                 title = _strip_trailing_page_segment(
-                    re.sub(
-                        r"\s*[—\-–]\s*(Foliate|Calibre|Thorium|FBReader|Atris|Xreader|MuPDF).*",
-                        "",
-                        window_title,
-                        flags=re.IGNORECASE,
-                    ).strip()
+                    EPUB_APP_SUFFIX_PATTERN.sub("", window_title).strip()
                 )
             if title and len(title) > 3:
                 return Citation(
@@ -296,10 +381,10 @@ def _parse_document_citation(
                 )
 
     # -- Generic file extension match (.pdf / .epub) -----------------------
-    ext = r"\.pdf" if source_type is SourceType.PDF else r"\.epub"
-    generic_match = re.search(
-        rf"([^\n]+{ext})", window_title, re.IGNORECASE
+    file_pattern = (
+        PDF_FILE_PATTERN if source_type is SourceType.PDF else EPUB_FILE_PATTERN
     )
+    generic_match = file_pattern.search(window_title)
     if generic_match:
         if not page_number:
             return None
@@ -312,15 +397,10 @@ def _parse_document_citation(
 
     # -- Known reader app in title without file extension -------------------
     if source_type is SourceType.PDF:
-        reader_match = re.search(r"(Okular|Evince|Zathura)", window_title, re.IGNORECASE)
+        reader_match = PDF_READER_NAME_PATTERN.search(window_title)
         if reader_match and page_number:
             title = _strip_trailing_page_segment(
-                re.sub(
-                    r"\s*[—\-–]\s*(Okular|Evince|Zathura).*",
-                    "",
-                    window_title,
-                    flags=re.IGNORECASE,
-                ).strip()
+                PDF_READER_SUFFIX_PATTERN.sub("", window_title).strip()
             )
             if title and len(title) > 3:
                 return Citation(
@@ -338,6 +418,25 @@ def parse_pdf_citation(window_title: str) -> Citation | None:
 
     Supports Evince, Zathura, Okular, and generic PDF patterns.
     """
+    if not window_title or not _has_pdf_marker(window_title):
+        return None
+
+    # Fast path for the plain Evince form; anything else uses the regexes.
+    head, sep, page = window_title.rpartition(_EVINCE_PAGE_SEPARATOR)
+    if (
+        sep
+        and len(head) > 4
+        and head.endswith(".pdf")
+        and page.isascii()
+        and page.isdigit()
+    ):
+        return Citation(
+            title=head.strip(),
+            page=page,
+            source="Evince",
+            source_type=SourceType.PDF,
+        )
+
     return _parse_document_citation(window_title, SourceType.PDF)
 
 
@@ -346,13 +445,8 @@ def parse_epub_citation(window_title: str) -> Citation | None:
 
     Supports Foliate, Calibre, Thorium, FBReader, and generic EPUB patterns.
     """
-    if not window_title:
-        return None
     # Guard: only proceed if this looks like an EPUB context
-    if (
-        ".epub" not in window_title.lower()
-        and not EPUB_APP_PATTERN.search(window_title)
-    ):
+    if not window_title or not _has_epub_marker(window_title):
         return None
     return _parse_document_citation(window_title, SourceType.EPUB)
 
@@ -367,13 +461,14 @@ def parse_browser_citation(window_title: str) -> Citation | None:
 
     Supports Chrome, Firefox, Edge, Brave, Chromium, and Vivaldi.
     """
-    if not window_title:
+    if not window_title or not _has_browser_marker(window_title):
         return None
     match = BROWSER_PATTERN.match(window_title)
     if match:
+        browser = match.group("browser")
         return Citation(
-            title=match.group(1).strip(),
-            source=match.group(2),
+            title=match.group("title").strip(),
+            source=_BROWSER_CANONICAL_NAMES.get(browser, browser),
             source_type=SourceType.BROWSER,
         )
     return None
@@ -407,9 +502,7 @@ def parse_code_editor_citation(window_title: str) -> Citation | None:
         return None
 
     # VSCode: "filename.py - project - Visual Studio Code"
-    vscode_match = re.match(
-        r"(.+?)\s*-\s*(.+?)\s*-\s*Visual Studio Code", window_title
-    )
+    vscode_match = VSCODE_PATTERN.match(window_title)
     if vscode_match:
         return Citation(
             title=vscode_match.group(1).strip(),
@@ -419,7 +512,7 @@ def parse_code_editor_citation(window_title: str) -> Citation | None:
         )
 
     # Generic: "filename.py - ProjectName"
-    generic_match = re.match(r"(.+?\.\w+)\s*-\s*(.+)", window_title)
+    generic_match = EDITOR_FILE_PATTERN.match(window_title)
     if generic_match:
         return Citation(
             title=generic_match.group(1).strip(),
@@ -510,7 +603,7 @@ def parse_generic_citation(window_title: str) -> Citation | None:
         return None
     if READER_APP_PATTERN.search(window_title):
         return None
-    match = re.match(r"(.+?)\s*[—\-–]\s*(.+)$", window_title)
+    match = GENERIC_DASH_PATTERN.match(window_title)
     if not match:
         return None
     title, source = match.group(1).strip(), match.group(2).strip()
@@ -523,28 +616,50 @@ def parse_generic_citation(window_title: str) -> Citation | None:
 # Parser list and top-level dispatch
 # ---------------------------------------------------------------------------
 
-_PARSERS = [
-    parse_pdf_citation,
-    parse_epub_citation,
-    parse_browser_citation,
-    parse_jetbrains_citation,
-    parse_code_editor_citation,
-    parse_sublime_citation,
-    parse_zotero_citation,
-    parse_libreoffice_citation,
-    parse_texstudio_citation,
-    parse_generic_citation,
-]
+# Each parser is paired with a cheap prefilter; the parser only runs when its
+# prefilter accepts the title. Reader titles such as "Notes.pdf (15/200)" need
+# no separator, but every other parser requires a dash between segments.
+_ParserEntry = tuple[Callable[[str], bool], Callable[[str], Citation | None]]
+
+_PARSERS: tuple[_ParserEntry, ...] = (
+    (_has_pdf_marker, parse_pdf_citation),
+    (_has_epub_marker, parse_epub_citation),
+    (_has_browser_marker, parse_browser_citation),
+    (_has_title_separator, parse_jetbrains_citation),
+    (_has_title_separator, parse_code_editor_citation),
+    (_has_title_separator, parse_sublime_citation),
+    (_has_title_separator, parse_zotero_citation),
+    (_has_title_separator, parse_libreoffice_citation),
+    (_has_title_separator, parse_texstudio_citation),
+    (_has_title_separator, parse_generic_citation),
+)
+
+
+# Number of distinct window titles whose parse results are memoized.
+CITATION_CACHE_SIZE = 256
 
 
 def parse_citation_from_window_title(window_title: str) -> Citation | None:
-    """Parse a citation directly from a given window title."""
+    """Parse a citation directly from a given window title.
+
+    Results are memoized per title, so repeated polls of the same window
+    skip the regex work and return the same immutable citation.
+    """
     if not window_title:
         return None
-
-    for parser in _PARSERS:
-        citation = parser(window_title)
-        if citation:
+    return _parse_citation_cached(window_title)
+
+
+@functools.lru_cache(maxsize=CITATION_CACHE_SIZE)
+def _parse_citation_cached(window_title: str) -> Citation | None:
+    """Uncached body of :func:`parse_citation_from_window_title`."""
+    # Several parsers share a prefilter; evaluate each one once per title.
+    prefilter_results: dict[Callable[[str], bool], bool] = {}
+    for applies, parser in _PARSERS:
+        accepted = prefilter_results.get(applies)
+        if accepted is None:
+            accepted = prefilter_results[applies] = applies(window_title)
+        if accepted and (citation := parser(window_title)):
             return citation
 
     # PDF/EPUB context detected but no parser matched — return None so the
@@ -565,7 +680,7 @@ def parse_citation_from_window_title(window_title: str) -> Citation | None:
 
 def _is_ignored_window(window_title: str) -> bool:
     """Check if window title should be ignored."""
-    return any(p.search(window_title) for p in IGNORED_WINDOW_TITLE_PATTERNS)
+    return bool(IGNORED_WINDOW_TITLE_PATTERN.search(window_title))
 
 
 def _try_get_citation() -> Citation | None:
@@ -593,4 +708,5 @@ def get_citation() -> Citation | None:
         max_attempts=CITATION_RETRY_ATTEMPTS,
         delay=CITATION_RETRY_DELAY,
         backoff=CITATION_RETRY_BACKOFF,
+        max_delay=CITATION_RETRY_MAX_DELAY,
     )
@@ -3,22 +3,111 @@
 from __future__ import annotations
 
 import contextlib
+import fcntl
+import functools
+import io
 import logging
 import os
+import select
+import selectors
+import struct
 import subprocess
+import sys
 import tempfile
+import threading
 import time
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ..config import get_config
 from ..exceptions import OCRError, ScreenshotError
-from ..utils.command import CommandError, run_command_safely
+from ..utils.command import (
+    CommandError,
+    find_executable,
+    run_command_safely,
+    spawn_options,
+)
+from .text import _detect_display_server
+
+if TYPE_CHECKING:
+    import ctypes
+    from concurrent.futures import Future
 
 logger = logging.getLogger(__name__)
 
+# inotify(7) flags and the fixed-size header of each event read from the fd
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def _file_has_content(filepath: str | Path) -> bool:
+    """Return True if *filepath* exists and is non-empty, using one stat call."""
+    try:
+        return os.stat(filepath).st_size > 0
+    except OSError:
+        return False
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL | None:
+    """Return libc if it provides inotify, else None (non-Linux platforms)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    # Imported here so a capture that never waits on a file skips ctypes
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1  # noqa: B018 - probe for the symbol
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _inotify_watch(directory: Path) -> int | None:
+    """Watch *directory* for files being closed after writing or moved in.
+
+    Returns:
+        The inotify file descriptor, or None if inotify is unavailable
+        (non-Linux, missing directory, or watch limit reached).
+    """
+    libc = _libc()
+    if libc is None:
+        return None
+    fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_TO
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _inotify_names(fd: int) -> set[bytes]:
+    """Drain pending inotify events and return the file names they name."""
+    names: set[bytes] = set()
+    try:
+        data = os.read(fd, 4096)
+    except BlockingIOError:
+        return names
+    offset = 0
+    while offset + _INOTIFY_EVENT.size <= len(data):
+        _, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+        offset += _INOTIFY_EVENT.size
+        names.add(data[offset : offset + length].rstrip(b"\0"))
+        offset += length
+    return names
+
 
 def _wait_for_file(filepath: str | Path, timeout: float = 3.0) -> bool:
-    """Wait for file to exist with exponential backoff.
+    """Wait for file to exist and have content.
+
+    On Linux this blocks on an inotify watch of the parent directory, so it
+    wakes as soon as the screenshot tool closes the file. Elsewhere, or if
+    the watch cannot be set up, it polls with exponential backoff.
 
     Args:
         filepath: Path to wait for.
@@ -27,43 +116,65 @@ def _wait_for_file(filepath: str | Path, timeout: float = 3.0) -> bool:
     Returns:
         True if file exists and has content, False otherwise.
     """
-    filepath = Path(filepath)
-    start_time = time.time()
+    path = Path(filepath)
+    fd = _inotify_watch(path.parent)
+    if fd is None:
+        return _poll_for_file(path, timeout)
+
+    try:
+        # Checked after the watch is in place so a write in between is not missed
+        if _file_has_content(path):
+            return True
+        name = os.fsencode(path.name)
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+            if name in _inotify_names(fd) and _file_has_content(path):
+                return True
+    finally:
+        os.close(fd)
+
+    return _file_has_content(path)
+
+
+def _poll_for_file(
+    filepath: str | Path,
+    timeout: float,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """Poll for *filepath* to have content, backing off between checks.
+
+    The deadline is on the monotonic clock, so a wall-clock change (NTP
+    step, suspend/resume) cannot cut the wait short or stretch it.
+    *clock* and *sleep* are injectable so tests can run on a fake clock.
+    """
+    deadline = clock() + timeout
     poll_interval = 0.05  # Start with 50ms
     max_interval = 0.5  # Max 500ms between polls
 
-    while time.time() - start_time < timeout:
-        try:
-            if filepath.stat().st_size > 0:
-                return True
-        except FileNotFoundError:
-            pass
-        time.sleep(poll_interval)
+    while (remaining := deadline - clock()) > 0:
+        if _file_has_content(filepath):
+            return True
+        sleep(min(poll_interval, remaining))
         poll_interval = min(poll_interval * 1.5, max_interval)
 
-    try:
-        return filepath.stat().st_size > 0
-    except FileNotFoundError:
-        return False
+    return _file_has_content(filepath)
 
 
-def _detect_display_server() -> str:
-    """Detect the current display server type.
+# Programs each screenshot tool needs on PATH
+_TOOL_PROGRAMS = {
+    "flameshot": ("flameshot",),
+    "grim": ("grim", "slurp"),
+    "scrot": ("scrot",),
+}
 
-    Returns:
-        'x11', 'wayland', or 'unknown'.
-    """
-    session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
-    if session_type == "x11":
-        return "x11"
-    if session_type == "wayland":
-        return "wayland"
-    # Fallback heuristics
-    if os.environ.get("WAYLAND_DISPLAY"):
-        return "wayland"
-    if os.environ.get("DISPLAY"):
-        return "x11"
-    return "unknown"
+
+def _tool_installed(tool: str) -> bool:
+    """Return True if every program *tool* needs is on PATH."""
+    return all(find_executable(program) for program in _TOOL_PROGRAMS[tool])
 
 
 def take_screenshot(
@@ -84,23 +195,42 @@ def take_screenshot(
     Raises:
         ScreenshotError: If screenshot capture fails.
     """
-    filepath = Path(filepath)
     filepath_str = str(filepath)
 
+    try:
+        _dispatch_screenshot(filepath_str, tool, annotate)
+    except _SelectionCancelledError:
+        # Falling through to the next tool would put a second selection
+        # prompt in front of a user who just dismissed the first one.
+        raise ScreenshotError("Screenshot cancelled") from None
+
+    # Every capture helper verifies the output file before reporting success.
+    return True
+
+
+def _dispatch_screenshot(filepath_str: str, tool: str, annotate: bool) -> None:
+    """Run the capture helper(s) for *tool*, raising ScreenshotError on failure."""
     if tool == "auto":
         display = _detect_display_server()
         # Try the native tool first based on detected display server
+        candidates: list[tuple[str, Callable[[str], bool]]]
         if display == "wayland":
-            success = _capture_with_grim(filepath_str)
-            if not success:
-                success = _capture_with_flameshot(filepath_str)
+            candidates = [
+                ("grim", _capture_with_grim),
+                ("flameshot", _capture_with_flameshot),
+            ]
         else:
-            # X11 or unknown — try flameshot first, then scrot
-            success = _capture_with_flameshot(filepath_str)
-            if not success:
-                success = _capture_with_grim(filepath_str)
-            if not success:
-                success = _capture_with_scrot(filepath_str)
+            # X11 or unknown — try flameshot first, then grim, then scrot
+            candidates = [
+                ("flameshot", _capture_with_flameshot),
+                ("grim", _capture_with_grim),
+                ("scrot", _capture_with_scrot),
+            ]
+        # Skip tools that are not installed rather than spawning them to find out
+        success = any(
+            _tool_installed(name) and capture(filepath_str)
+            for name, capture in candidates
+        )
         if not success:
             raise ScreenshotError(
                 f"No compatible screenshot tool available (detected: {display}). "
@@ -121,8 +251,6 @@ def take_screenshot(
     else:
         raise ScreenshotError(f"Unknown screenshot tool: {tool}")
 
-    return filepath.exists()
-
 
 def _capture_with_flameshot(filepath: str, annotate: bool = False) -> bool:
     """Capture screenshot using Flameshot (X11).
@@ -165,41 +293,135 @@ def _capture_with_flameshot(filepath: str, annotate: bool = False) -> bool:
         return False
 
 
-def _capture_with_flameshot_raw(filepath: str) -> bool:
-    """Capture screenshot using Flameshot raw PNG output."""
-    try:
-        result = subprocess.run(
-            ["flameshot", "gui", "--raw", "--accept-on-select"],
-            capture_output=True,
-            timeout=60,
-            check=False,
-        )
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_RAW_CAPTURE_TIMEOUT = 60  # Give user time to select area
+_RAW_CHUNK_SIZE = 64 * 1024
+# Pipe buffer requested for flameshot's stdout (the unprivileged maximum), so
+# a multi-megabyte PNG needs few wakeups and flameshot rarely blocks on it
+_RAW_PIPE_SIZE = 1024 * 1024
 
-        if result.returncode != 0 or not result.stdout:
-            return False
 
-        png_header = b"\x89PNG\r\n\x1a\n"
-        if not result.stdout.startswith(png_header):
-            return False
+def _wait_readable(
+    selector: selectors.BaseSelector, deadline: float, command: list[str]
+) -> None:
+    """Block until the pipe in *selector* is readable or *deadline* passes.
+
+    Raises:
+        subprocess.TimeoutExpired: If *deadline* passes first.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0 or not selector.select(remaining):
+        raise subprocess.TimeoutExpired(command, _RAW_CAPTURE_TIMEOUT)
+
+
+def _read_until(
+    selector: selectors.BaseSelector,
+    fd: int,
+    size: int,
+    deadline: float,
+    command: list[str],
+) -> bytes:
+    """Read up to *size* bytes from *fd*, raising TimeoutExpired past *deadline*."""
+    _wait_readable(selector, deadline, command)
+    return os.read(fd, size)
+
+
+def _copy_until(
+    selector: selectors.BaseSelector,
+    fd: int,
+    out_fd: int,
+    deadline: float,
+    command: list[str],
+) -> int:
+    """Move one chunk from pipe *fd* to *out_fd* and return its length.
+
+    Uses splice(2) where available so the data goes from the pipe to the
+    page cache without passing through Python.
+    """
+    _wait_readable(selector, deadline, command)
+    if hasattr(os, "splice"):
+        return os.splice(fd, out_fd, _RAW_PIPE_SIZE, flags=os.SPLICE_F_MOVE)
+    chunk = os.read(fd, _RAW_CHUNK_SIZE)
+    os.write(out_fd, chunk)
+    return len(chunk)
 
-        with open(filepath, "wb") as output:
-            output.write(result.stdout)
 
-        return os.path.exists(filepath) and os.path.getsize(filepath) > 0
+def _capture_with_flameshot_raw(filepath: str) -> bool:
+    """Capture screenshot using Flameshot raw PNG output.
+
+    The PNG is streamed from flameshot's stdout to *filepath* in chunks, so
+    a large capture is never held in memory whole, and written through an
+    unbuffered descriptor so no chunk is copied twice. Output that does not
+    start with the PNG signature is rejected after its first eight bytes.
+    """
+    command = ["flameshot", "gui", "--raw", "--accept-on-select"]
+    deadline = time.monotonic() + _RAW_CAPTURE_TIMEOUT
+    written = False
+    try:
+        with (
+            subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                **spawn_options(command),
+            ) as process,
+            selectors.DefaultSelector() as selector,
+        ):
+            fd = process.stdout.fileno()  # type: ignore[union-attr]
+            if hasattr(fcntl, "F_SETPIPE_SZ"):
+                with contextlib.suppress(OSError):
+                    fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, _RAW_PIPE_SIZE)
+            selector.register(fd, selectors.EVENT_READ)
+            try:
+                header = b""
+                while len(header) < len(_PNG_SIGNATURE):
+                    size = len(_PNG_SIGNATURE) - len(header)
+                    chunk = _read_until(selector, fd, size, deadline, command)
+                    if not chunk:
+                        break
+                    header += chunk
+                # A bytes compare is one memcmp; unpacking to an int is slower
+                if header != _PNG_SIGNATURE:
+                    return False
+
+                written = True
+                out_fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(out_fd, header)
+                    while _copy_until(selector, fd, out_fd, deadline, command):
+                        pass
+                finally:
+                    os.close(out_fd)
+                remaining = max(deadline - time.monotonic(), 0)
+                returncode = process.wait(timeout=remaining)
+            finally:
+                if process.poll() is None:
+                    process.kill()
+
+        if returncode != 0:
+            with contextlib.suppress(OSError):
+                os.unlink(filepath)
+            return False
+        return True
     except (subprocess.SubprocessError, OSError):
+        if written:
+            with contextlib.suppress(OSError):
+                os.unlink(filepath)
         return False
 
 
 def _save_clipboard_image(filepath: str) -> bool:
     """Try saving PNG image data from clipboard into filepath."""
     try:
+        command = ["xclip", "-selection", "clipboard", "-t", "image/png", "-o"]
         with open(filepath, "wb") as output:
             result = subprocess.run(
-                ["xclip", "-selection", "clipboard", "-t", "image/png", "-o"],
+                command,
                 stdout=output,
                 stderr=subprocess.PIPE,
                 timeout=5,
                 check=False,
+                **spawn_options(command),
             )
 
         if result.returncode != 0 or os.path.getsize(filepath) == 0:
@@ -216,34 +438,67 @@ def _save_clipboard_image(filepath: str) -> bool:
         return False
 
 
+# What slurp prints to stderr when the user dismisses the selection
+_SLURP_CANCELLED = "selection cancelled"
+
+
+class _SelectionCancelledError(Exception):
+    """The user dismissed a screenshot tool's area selection."""
+
+
+_SLURP_TIMEOUT = 60  # Give user time to select area
+_GRIM_TIMEOUT = 10
+
+
 def _capture_with_grim(filepath: str) -> bool:
     """Capture screenshot using grim+slurp (Wayland).
 
-    This uses slurp for area selection and grim for capture.
+    slurp's selection is piped straight into ``grim -g -``, so grim has
+    already started by the time the user finishes selecting.
+
+    Raises:
+        _SelectionCancelledError: If the user dismissed the slurp selection.
     """
+    slurp_cmd = ["slurp"]
+    grim_cmd = ["grim", "-g", "-", filepath]
+    slurp: subprocess.Popen[str] | None = None
+    grim: subprocess.Popen[bytes] | None = None
     try:
-        # First get the selection area from slurp
-        slurp_result = subprocess.run(
-            ["slurp"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        if slurp_result.returncode != 0 or not slurp_result.stdout.strip():
-            return False
-
-        # Use the selection area with grim
-        area = slurp_result.stdout.strip()
-        grim_result = subprocess.run(
-            ["grim", "-g", area, filepath],
-            capture_output=True,
-            timeout=10,
-        )
-
-        return grim_result.returncode == 0 and os.path.exists(filepath)
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        read_fd, write_fd = os.pipe()
+        try:
+            slurp = subprocess.Popen(
+                slurp_cmd,
+                stdout=write_fd,
+                stderr=subprocess.PIPE,
+                text=True,
+                **spawn_options(slurp_cmd),
+            )
+            grim = subprocess.Popen(
+                grim_cmd,
+                stdin=read_fd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **spawn_options(grim_cmd),
+            )
+        finally:
+            # The children hold their own copies; grim sees EOF when slurp exits
+            os.close(read_fd)
+            os.close(write_fd)
+        _, slurp_errors = slurp.communicate(timeout=_SLURP_TIMEOUT)
+        grim_returncode = grim.wait(timeout=_GRIM_TIMEOUT)
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    finally:
+        for process in (slurp, grim):
+            if process is not None and process.poll() is None:
+                process.kill()
+                process.wait()
+
+    if slurp.returncode != 0:
+        if _SLURP_CANCELLED in slurp_errors:
+            raise _SelectionCancelledError("slurp")
         return False
+    return grim_returncode == 0 and _file_has_content(filepath)
 
 
 def _capture_with_scrot(filepath: str) -> bool:
@@ -253,54 +508,151 @@ def _capture_with_scrot(filepath: str) -> bool:
     interactive area selection with -s.
     """
     try:
+        command = ["scrot", "-s", filepath]
         result = subprocess.run(
-            ["scrot", "-s", filepath],
+            command,
             capture_output=True,
             timeout=60,
+            **spawn_options(command),
         )
-        return result.returncode == 0 and os.path.exists(filepath)
+        return result.returncode == 0 and _file_has_content(filepath)
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 
-def _preprocess_for_ocr(img_path: Path) -> Path:
-    """Preprocess image for better OCR accuracy.
+# Leading bytes of the image formats the screenshot tools write (PNG, JPEG)
+_IMAGE_SIGNATURES = (_PNG_SIGNATURE, b"\xff\xd8\xff")
+
+
+def _is_supported_image(img_path: Path) -> bool:
+    """Check that *img_path* exists and starts with a PNG or JPEG signature.
+
+    A cancelled screenshot tool can leave a missing, empty or partial file
+    behind; checking the header avoids spawning tesseract for it.
+    """
+    try:
+        with open(img_path, "rb") as image:
+            header = image.read(len(_IMAGE_SIGNATURES[0]))
+    except FileNotFoundError:
+        logger.warning("Image file not found: %s", img_path)
+        return False
+    except OSError as e:
+        logger.warning("Cannot read image file %s: %s", img_path, e)
+        return False
+
+    if not header.startswith(_IMAGE_SIGNATURES):
+        logger.warning("Not a PNG or JPEG image, skipping OCR: %s", img_path)
+        return False
+    return True
+
+
+# Per-image tesseract budget: a base plus time per pixel, capped
+_OCR_BASE_TIMEOUT = 5.0
+_OCR_PIXELS_PER_SECOND = 2_000_000
+_OCR_MAX_TIMEOUT = 30.0
+# Width and height in a PNG's IHDR chunk, right after the signature
+_PNG_SIZE = struct.Struct(">II")
+
+
+def _ocr_timeout(img_path: Path) -> float:
+    """Return how long tesseract may spend on *img_path*.
+
+    Scales with the pixel count read from the PNG header, so a small
+    selection that makes tesseract stall gives up in seconds rather than
+    holding the capture hotkey for the full cap. Non-PNG images get the cap.
+    """
+    try:
+        with open(img_path, "rb") as image:
+            header = image.read(24)
+    except OSError:
+        return _OCR_MAX_TIMEOUT
+    if not header.startswith(_PNG_SIGNATURE) or len(header) < 24:
+        return _OCR_MAX_TIMEOUT
+    width, height = _PNG_SIZE.unpack_from(header, 16)
+    timeout: float = _OCR_BASE_TIMEOUT + width * height / _OCR_PIXELS_PER_SECOND
+    return min(timeout, _OCR_MAX_TIMEOUT)
+
+
+def _grayscale_for_ocr(img_path: Path) -> Any | None:
+    """Convert an image to 8-bit grayscale for OCR.
 
-    Converts to grayscale and increases contrast. Saves the enhanced
-    image to a temp path and returns it. Falls back to the original
-    if Pillow is unavailable or processing fails.
+    Only the colour channels are dropped: the grey levels, including
+    anti-aliasing, are left for tesseract's own thresholding.
 
     Args:
         img_path: Path to the original image.
 
     Returns:
-        Path to the preprocessed image (or original on failure).
+        The grayscale PIL image, or None if Pillow is unavailable or
+        processing fails (OCR then reads the original).
     """
     try:
-        from PIL import Image, ImageEnhance, ImageFilter
+        from PIL import Image
     except ImportError:
-        return img_path
+        return None
 
     try:
         with Image.open(img_path) as img:
-            # Convert to grayscale for cleaner OCR
-            if img.mode != "L":
-                img = img.convert("L")  # type: ignore[assignment]
+            return img.convert("L")
+    except Exception as e:
+        logger.debug("Image preprocessing failed, using original: %s", e)
+        return None
 
-            # Increase contrast
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.5)  # type: ignore[assignment]
 
-            # Slight sharpening
-            img = img.filter(ImageFilter.SHARPEN)  # type: ignore[assignment]
+def _preprocess_for_ocr(img_path: Path) -> bytes | None:
+    """Return the grayscale image as PNG bytes for tesseract's stdin.
+
+    Piping the bytes straight into the CLI avoids writing a second file.
+
+    Args:
+        img_path: Path to the original image.
+
+    Returns:
+        PNG bytes of the grayscale image, or None to OCR the original.
+    """
+    gray = _grayscale_for_ocr(img_path)
+    if gray is None:
+        return None
+    buffer = io.BytesIO()
+    gray.save(buffer, "PNG")
+    return buffer.getvalue()
 
-            # Save to temp file
-            out_path = img_path.with_suffix(".ocr.png")
-            img.save(out_path, "PNG")
-            return out_path
-    except Exception as e:
-        logger.debug("Image preprocessing failed, using original: %s", e)
-        return img_path
+
+# TessBaseAPI is not thread-safe, and background OCR runs on its own thread
+_TESSERACT_LOCK = threading.Lock()
+
+
+@functools.cache
+def _tesseract_api(lang: str) -> Any | None:
+    """Return a loaded tesserocr API for *lang*, or None to use the CLI.
+
+    Loading a language model costs a few hundred milliseconds per tesseract
+    process, so with the optional tesserocr binding installed the model is
+    loaded once and kept for the life of the process.
+    """
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+    try:
+        return tesserocr.PyTessBaseAPI(lang=lang)
+    except RuntimeError as e:
+        logger.debug("tesserocr could not load %r, using the CLI: %s", lang, e)
+        return None
+
+
+def _ocr_in_process(api: Any, img_path: Path, gray: Any | None) -> str:
+    """Run OCR through a cached tesserocr *api*.
+
+    *gray* is handed over as a PIL image, so this path never encodes or
+    decodes a PNG.
+    """
+    with _TESSERACT_LOCK:
+        if gray is not None:
+            api.SetImage(gray)
+        else:
+            api.SetImageFile(str(img_path))
+        return str(api.GetUTF8Text()).strip()
 
 
 def ocr_image(
@@ -322,45 +674,126 @@ def ocr_image(
     Raises:
         OCRError: If OCR fails and image exists.
     """
+    return _ocr_image(img_path, language, tessconfig, in_process=True)
+
+
+def _ocr_image(
+    img_path: str | Path,
+    language: str | None,
+    tessconfig: str | None,
+    in_process: bool,
+) -> str:
+    """Body of :func:`ocr_image`; *in_process* allows the tesserocr path."""
     img_path = Path(img_path)
 
-    if not img_path.exists():
-        logger.warning("Image file not found: %s", img_path)
+    if not _is_supported_image(img_path):
         return ""
 
     config = get_config()
     lang = language or config.ocr_language
 
-    # Preprocess image for better OCR results
-    ocr_path = _preprocess_for_ocr(img_path)
+    # Custom tesseract configs are CLI arguments, so they always use the CLI
+    api = _tesseract_api(lang) if in_process and tessconfig is None else None
 
     try:
-        cmd = ["tesseract", str(ocr_path), "stdout", "-l", lang]
+        if api is not None:
+            return _ocr_in_process(api, img_path, _grayscale_for_ocr(img_path))
+
+        # The grayscale image goes to tesseract on stdin
+        preprocessed = _preprocess_for_ocr(img_path)
+        source = "stdin" if preprocessed is not None else str(img_path)
+        cmd = ["tesseract", source, "stdout", "-l", lang]
         if tessconfig:
             cmd.append(tessconfig)
 
         result = run_command_safely(
             cmd,
             capture_output=True,
-            timeout=30,
+            timeout=_ocr_timeout(img_path),
             check=True,
+            input_text=preprocessed,
+            text=preprocessed is None,
         )
-        return str(result.stdout.strip())
+        output: bytes | str = result.stdout
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", "replace")
+        return str(output.strip())
+    except subprocess.TimeoutExpired as e:
+        # Degrade to no text rather than failing the whole capture
+        logger.warning("OCR gave up after %.1fs: %s", e.timeout, img_path)
+        return ""
     except FileNotFoundError:
-        # Clean up preprocessed file
-        if ocr_path != img_path and ocr_path.exists():
-            ocr_path.unlink(missing_ok=True)
         raise OCRError(
             "Tesseract not found. Install: sudo apt install tesseract-ocr"
         ) from None
     except Exception as e:
-        # Clean up preprocessed file
-        if ocr_path != img_path and ocr_path.exists():
-            ocr_path.unlink(missing_ok=True)
         logger.error("OCR failed: %s", e)
         raise OCRError(f"OCR processing failed: {e}") from e
 
 
+def ocr_images(
+    img_paths: Sequence[str | Path],
+    language: str | None = None,
+    tessconfig: str | None = None,
+) -> list[str]:
+    """Perform OCR on several images at once, e.g. one per monitor or region.
+
+    Each image gets its own tesseract process, run from a thread pool
+    sized to the CPU count, so N regions take about as long as the
+    slowest one rather than the sum. A batch always uses the CLI: the
+    cached tesserocr API is shared behind a lock, which would run the
+    pool one image at a time. A single image goes through
+    :func:`ocr_image` and may use the API.
+
+    Args:
+        img_paths: Paths to the image files.
+        language: Language code for OCR. Defaults to config setting.
+        tessconfig: Optional Tesseract configuration string.
+
+    Returns:
+        Extracted text for each image, in the order given.
+
+    Raises:
+        OCRError: If OCR fails for any image that exists.
+    """
+    if len(img_paths) <= 1:
+        return [ocr_image(path, language, tessconfig) for path in img_paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(len(img_paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as pool:
+        return list(
+            pool.map(
+                lambda path: _ocr_image(path, language, tessconfig, in_process=False),
+                img_paths,
+            )
+        )
+
+
+# Subdirectory of $XDG_RUNTIME_DIR that holds screenshots awaiting OCR/upload
+_RUNTIME_SUBDIR = "obsidian-clipper"
+
+
+def _screenshot_dir() -> Path:
+    """Return a RAM-backed directory for screenshots when one is available.
+
+    $XDG_RUNTIME_DIR is a per-user tmpfs on systemd desktops, so the PNG
+    goes from the screenshot tool to OCR and upload without touching the
+    disk. Elsewhere the regular temp dir is used.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        directory = Path(runtime_dir) / _RUNTIME_SUBDIR
+        try:
+            directory.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        else:
+            return directory
+    return Path(tempfile.gettempdir())
+
+
 def create_temp_screenshot(prefix: str = "obsidian_capture") -> Path:
     """Create a temporary file path for screenshots.
 
@@ -371,7 +804,7 @@ def create_temp_screenshot(prefix: str = "obsidian_capture") -> Path:
 
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{prefix}_{timestamp}.png"
-    return Path(tempfile.gettempdir()) / filename
+    return _screenshot_dir() / filename
 
 
 class ScreenshotCapture:
@@ -385,6 +818,15 @@ class ScreenshotCapture:
         # Temp file automatically cleaned up
     """
 
+    __slots__ = (
+        "tool",
+        "ocr_language",
+        "perform_ocr",
+        "annotate",
+        "_temp_file",
+        "_ocr_future",
+    )
+
     def __init__(
         self,
         tool: str = "auto",
@@ -397,14 +839,22 @@ class ScreenshotCapture:
         self.perform_ocr = perform_ocr
         self.annotate = annotate
         self._temp_file: Path | None = None
+        self._ocr_future: Future[str] | None = None
 
-    def capture(self) -> tuple[Path | None, str]:
+    def capture(self, blocking: bool = True) -> tuple[Path | None, str]:
         """Capture screenshot and optionally perform OCR.
 
+        Args:
+            blocking: Run OCR before returning. When False, OCR runs on a
+                background thread and its text is collected with
+                :meth:`wait_ocr`, letting the caller overlap other work
+                with tesseract.
+
         Returns:
             Tuple of (screenshot_path, ocr_text).
             screenshot_path is None if capture failed.
-            ocr_text is empty string if OCR not performed or failed.
+            ocr_text is empty string if OCR not performed, failed, or
+            deferred with ``blocking=False``.
         """
         self._temp_file = create_temp_screenshot()
 
@@ -415,16 +865,44 @@ class ScreenshotCapture:
 
             ocr_text = ""
             if self.perform_ocr:
-                with contextlib.suppress(OCRError):
-                    ocr_text = ocr_image(self._temp_file, self.ocr_language)
+                if blocking:
+                    ocr_text = self._run_ocr(self._temp_file)
+                else:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="ocr"
+                    )
+                    self._ocr_future = executor.submit(self._run_ocr, self._temp_file)
+                    executor.shutdown(wait=False)
 
             return self._temp_file, ocr_text
         except ScreenshotError:
             self.cleanup()
             return None, ""
 
+    def _run_ocr(self, img_path: Path) -> str:
+        """Run OCR on *img_path*, treating OCR failures as no text."""
+        try:
+            return ocr_image(img_path, self.ocr_language)
+        except OCRError:
+            return ""
+
+    def wait_ocr(self) -> str:
+        """Wait for background OCR started by ``capture(blocking=False)``.
+
+        Returns:
+            OCR text, or empty string if no background OCR is pending.
+        """
+        future, self._ocr_future = self._ocr_future, None
+        if future is None:
+            return ""
+        return future.result()
+
     def cleanup(self) -> None:
         """Remove temporary screenshot file if it exists."""
+        # Let pending OCR finish before its input file disappears.
+        self.wait_ocr()
         if self._temp_file and self._temp_file.exists():
             self._temp_file.unlink()
             self._temp_file = None
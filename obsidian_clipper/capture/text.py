@@ -4,104 +4,167 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import re
 import subprocess
+from collections.abc import Callable
 
-logger = logging.getLogger(__name__)
+from ..utils.command import (
+    CommandError,
+    find_executable,
+    run_command_safely,
+    spawn_options,
+)
 
+logger = logging.getLogger(__name__)
 
-def get_selected_text() -> str:
-    """Grab currently highlighted text from primary selection.
 
-    Tries X11 (xclip) first, then falls back to Wayland (wl-paste).
-    Only returns primary selection - never falls back to clipboard.
+def _detect_display_server() -> str:
+    """Detect the current display server type.
 
     Returns:
-        Selected text, or empty string if nothing selected or tools unavailable.
+        'x11', 'wayland', or 'unknown'.
     """
-    # Try xclip first (X11 primary selection)
-    try:
-        result = subprocess.run(
-            ["xclip", "-o", "-selection", "primary"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5,
-        )
-        text = result.stdout.strip()
-        if text:
-            return text
-    except FileNotFoundError:
-        logger.debug("xclip not found (install: sudo apt install xclip)")
-    except (
-        subprocess.CalledProcessError,
-        subprocess.TimeoutExpired,
-    ):
-        pass
+    session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
+    if session_type == "x11":
+        return "x11"
+    if session_type == "wayland":
+        return "wayland"
+    # Fallback heuristics
+    if os.environ.get("WAYLAND_DISPLAY"):
+        return "wayland"
+    if os.environ.get("DISPLAY"):
+        return "x11"
+    return "unknown"
+
+
+# Primary-selection readers as (command, install hint), X11 first.
+_SELECTION_READERS: tuple[tuple[list[str], str], ...] = (
+    (
+        ["xclip", "-o", "-selection", "primary"],
+        "xclip not found (install: sudo apt install xclip)",
+    ),
+    (
+        ["wl-paste", "-p"],
+        "wl-paste not found (install: sudo apt install wl-clipboard)",
+    ),
+)
 
-    # Fallback to wl-paste (Wayland primary selection)
+
+# Seconds to wait on a selection reader before trying the next one
+_SELECTION_TIMEOUT = 5
+
+# First byte that bytes.strip() would keep
+_NON_BLANK_PATTERN = re.compile(rb"[^ \t\n\r\x0b\x0c]")
+_ASCII_BLANKS = b" \t\n\r\x0b\x0c"
+
+
+def _decode_stripped(data: bytes) -> str:
+    """Decode *data* as UTF-8 without its surrounding whitespace.
+
+    The ASCII whitespace is trimmed by decoding a memoryview slice, so a
+    large selection is copied once, into the decoded string, rather than
+    again by ``str.strip()``.
+    """
+    match = _NON_BLANK_PATTERN.search(data)
+    if match is None:
+        return ""
+    start = match.start()
+    end = len(data)
+    while data[end - 1] in _ASCII_BLANKS:
+        end -= 1
+    # Still strip Unicode whitespace; a no-op returns the same string
+    return str(memoryview(data)[start:end], "utf-8", "replace").strip()
+
+
+def _read_selection(command: list[str], missing_hint: str) -> str:
+    """Run a single selection reader and return its stripped output.
+
+    Output is read as bytes and decoded once, so large selections skip the
+    text-mode newline translation and invalid UTF-8 cannot raise.
+    """
     try:
-        result = subprocess.run(
-            ["wl-paste", "-p"],
-            capture_output=True,
-            text=True,
+        result = run_command_safely(
+            command,
             check=True,
-            timeout=5,
+            timeout=_SELECTION_TIMEOUT,
+            text=False,
         )
-        text = result.stdout.strip()
-        if text:
-            return text
+        output: bytes | str = result.stdout
+        if isinstance(output, bytes):
+            return _decode_stripped(output)
+        return str(output.strip())
     except FileNotFoundError:
-        logger.debug("wl-paste not found (install: sudo apt install wl-clipboard)")
-    except (
-        subprocess.CalledProcessError,
-        subprocess.TimeoutExpired,
-    ):
+        logger.debug(missing_hint)
+    except (CommandError, subprocess.TimeoutExpired):
         pass
-
     return ""
 
 
-def get_active_window_title() -> str:
-    """Get the title of the currently active window.
+def get_selected_text() -> str:
+    """Grab currently highlighted text from primary selection.
 
-    Tries xdotool (X11), then falls back to Wayland tools (hyprctl, swaymsg).
+    Tries X11 (xclip) first, then falls back to Wayland (wl-paste). On a
+    Wayland session the order is reversed so the native tool is spawned
+    first. Only returns primary selection - never falls back to clipboard.
 
     Returns:
-        Window title, or empty string if unavailable.
+        Selected text, or empty string if nothing selected or tools unavailable.
     """
-    # Try xdotool (X11)
+    readers = _SELECTION_READERS
+    if _detect_display_server() == "wayland":
+        readers = readers[::-1]
+
+    for command, missing_hint in readers:
+        if find_executable(command[0]) is None:
+            logger.debug(missing_hint)
+            continue
+        text = _read_selection(command, missing_hint)
+        if text:
+            return text
+
+    return ""
+
+
+def _title_from_xdotool() -> str:
+    """Read the active window title with xdotool (X11)."""
+    if find_executable("xdotool") is None:
+        logger.debug("xdotool not found (install: sudo apt install xdotool)")
+        return ""
     try:
+        command = ["xdotool", "getactivewindow", "getwindowname"]
         result = subprocess.run(
-            ["xdotool", "getactivewindow", "getwindowname"],
+            command,
             capture_output=True,
             text=True,
             check=True,
             timeout=5,
+            **spawn_options(command),
         )
-        title = result.stdout.strip()
-        if title:
-            return title
-    except FileNotFoundError:
-        logger.debug("xdotool not found (install: sudo apt install xdotool)")
+        return str(result.stdout.strip())
     except (
+        FileNotFoundError,
         subprocess.CalledProcessError,
         subprocess.TimeoutExpired,
     ):
         pass
+    return ""
+
 
-    # Try hyprctl (Hyprland)
+def _title_from_hyprctl() -> str:
+    """Read the active window title with hyprctl (Hyprland)."""
     try:
+        command = ["hyprctl", "activewindow", "-j"]
         result = subprocess.run(
-            ["hyprctl", "activewindow", "-j"],
+            command,
             capture_output=True,
             text=True,
             check=True,
             timeout=5,
+            **spawn_options(command),
         )
         data = json.loads(result.stdout)
-        title = str(data.get("title", "")).strip()
-        if title:
-            return title
+        return str(data.get("title", "")).strip()
     except FileNotFoundError:
         logger.debug("hyprctl not found (install Hyprland window manager)")
     except (
@@ -111,15 +174,20 @@ def get_active_window_title() -> str:
         KeyError,
     ):
         pass
+    return ""
+
 
-    # Try swaymsg (Sway)
+def _title_from_swaymsg() -> str:
+    """Read the focused window title with swaymsg (Sway)."""
     try:
+        command = ["swaymsg", "-t", "get_tree"]
         result = subprocess.run(
-            ["swaymsg", "-t", "get_tree"],
+            command,
             capture_output=True,
             text=True,
             check=True,
             timeout=5,
+            **spawn_options(command),
         )
         data = json.loads(result.stdout)
 
@@ -136,9 +204,7 @@ def get_active_window_title() -> str:
                     return title
             return ""
 
-        title = _find_focused(data).strip()
-        if title:
-            return title
+        return _find_focused(data).strip()
     except FileNotFoundError:
         logger.debug("swaymsg not found (install: sudo apt install sway)")
     except (
@@ -147,6 +213,35 @@ def get_active_window_title() -> str:
         json.JSONDecodeError,
     ):
         pass
+    return ""
+
+
+def _window_title_readers() -> tuple[Callable[[], str], ...]:
+    """Order window-title readers so the running compositor's tool goes first.
+
+    Citation detection polls the active window several times per capture;
+    asking the right tool first avoids spawning ones that cannot answer.
+    """
+    if os.environ.get("HYPRLAND_INSTANCE_SIGNATURE"):
+        return (_title_from_hyprctl, _title_from_xdotool, _title_from_swaymsg)
+    if os.environ.get("SWAYSOCK"):
+        return (_title_from_swaymsg, _title_from_xdotool, _title_from_hyprctl)
+    return (_title_from_xdotool, _title_from_hyprctl, _title_from_swaymsg)
+
+
+def get_active_window_title() -> str:
+    """Get the title of the currently active window.
+
+    Tries xdotool (X11), then falls back to Wayland tools (hyprctl, swaymsg).
+    Under Hyprland or Sway the compositor's own tool is tried first.
+
+    Returns:
+        Window title, or empty string if unavailable.
+    """
+    for reader in _window_title_readers():
+        title = reader()
+        if title:
+            return title
 
     return ""
 
@@ -163,11 +258,14 @@ def copy_to_clipboard(text: str, clipboard: str = "clipboard") -> bool:
     """
     # Try xclip first
     try:
+        cmd = ["xclip", "-selection", clipboard]
         subprocess.run(
-            ["xclip", "-selection", clipboard],
+            cmd,
             input=text.encode(),
             check=True,
             capture_output=True,
+            # xclip and wl-copy fork to keep serving the clipboard
+            **spawn_options(cmd, long_lived=True),
         )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
@@ -183,6 +281,8 @@ def copy_to_clipboard(text: str, clipboard: str = "clipboard") -> bool:
             input=text.encode(),
             check=True,
             capture_output=True,
+            # xclip and wl-copy fork to keep serving the clipboard
+            **spawn_options(cmd, long_lived=True),
         )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
+from collections.abc import Sequence
 from pathlib import Path
 
 from .._version import __version__
@@ -33,8 +35,9 @@ def setup_logging(verbose: bool = False, debug: bool = False) -> None:
     )
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parsing does not mutate it."""
     parser = argparse.ArgumentParser(
         prog="obsidian-clipper",
         description="Capture content to Obsidian via Local REST API.",
@@ -186,8 +189,17 @@ Environment variables:
         action="version",
         version=f"%(prog)s {__version__}",
     )
+    return parser
 
-    args = parser.parse_args()
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Arguments to parse, excluding the program name. Defaults to
+            ``sys.argv[1:]``.
+    """
+    args = _build_parser().parse_args(argv)
 
     # Handle log file from CLI args (overrides environment)
     if args.log_file:
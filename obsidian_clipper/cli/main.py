@@ -19,7 +19,7 @@ from ..exceptions import (
 )
 from ..obsidian import ObsidianClient
 from ..utils import notify_error, notify_success
-from ..utils.command import run_command_safely
+from ..utils.command import run_command_safely, spawn_options
 from ..workflow import CaptureSession, prepare_capture_session, process_and_save_content
 from .args import parse_args, setup_logging
 
@@ -135,11 +135,14 @@ def _save_via_uri(session: CaptureSession, vault_name: str | None = None) -> boo
     uri = f"obsidian://new?vault={quote(vault)}&content={encoded_content}"
 
     try:
+        command = ["xdg-open", uri]
         result = subprocess.run(
-            ["xdg-open", uri],
+            command,
             capture_output=True,
             timeout=5,
             check=False,
+            # May start Obsidian itself, which outlives the clipper
+            **spawn_options(command, long_lived=True),
         )
         if result.returncode == 0:
             notify_success("Obsidian Capture", "Saved via Obsidian URI (API unavailable)")
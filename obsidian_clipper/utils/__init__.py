@@ -1,13 +1,15 @@
 """Utility functions for Obsidian Clipper."""
 
-from .command import CommandError, run_command_safely
+from .command import CommandError, find_executable, run_command_safely, spawn_options
 from .logging import get_logger, setup_logging
 from .notification import notify, notify_error, notify_success, notify_warning
 from .retry import retry_with_backoff
 
 __all__ = [
     "CommandError",
+    "find_executable",
     "run_command_safely",
+    "spawn_options",
     "notify",
     "notify_success",
     "notify_error",
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import shlex
+import shutil
 import subprocess
+from collections.abc import Sequence
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +21,74 @@ class CommandError(Exception):
         self.returncode = returncode
 
 
+@functools.cache
+def find_executable(name: str) -> str | None:
+    """Look *name* up on PATH, caching the answer for the life of the process.
+
+    Callers use this to skip tools that are not installed instead of
+    discovering it from a failed spawn. Tests can reset it with
+    ``find_executable.cache_clear()``.
+
+    Args:
+        name: Program name, e.g. ``"flameshot"``.
+
+    Returns:
+        Absolute path to the program, or None if it is not on PATH.
+    """
+    return shutil.which(name)
+
+
+def spawn_options(command: Sequence[str], long_lived: bool = False) -> dict[str, Any]:
+    """Return subprocess keyword arguments that allow the posix_spawn fast path.
+
+    CPython only spawns with ``posix_spawn`` (instead of fork+exec) when the
+    executable is given as a path and ``close_fds`` is off. Descriptors
+    Python opens are non-inheritable, but any inheritable descriptor the
+    clipper itself inherited from its launcher (hotkey daemon, terminal,
+    socket activation) is then passed on to the child. That is acceptable
+    for helpers that exit before the clipper does; pass *long_lived* for
+    tools that daemonize or may outlive it, such as ``xclip`` serving a
+    selection, so they keep ``close_fds`` and hold nothing open. argv is
+    left untouched.
+
+    Args:
+        command: The argv that will be run.
+        long_lived: The program may keep running after the clipper exits.
+
+    Returns:
+        ``executable`` and, unless *long_lived*, ``close_fds`` overrides, or
+        an empty dict if the program is not on PATH (so the usual
+        FileNotFoundError is raised).
+    """
+    executable = find_executable(command[0])
+    if executable is None:
+        return {}
+    if long_lived:
+        return {"executable": executable}
+    return {"executable": executable, "close_fds": False}
+
+
 def run_command_safely(
     command: list[str],
     capture_output: bool = True,
-    timeout: int | None = None,
+    timeout: float | None = None,
     check: bool = False,
-    input_text: str | None = None,
+    input_text: str | bytes | None = None,
     text: bool = True,
 ) -> subprocess.CompletedProcess[str]:
-    """Run a command safely without shell injection risk."""
+    """Run a command safely without shell injection risk.
+
+    Args:
+        command: Program and arguments; never passed through a shell.
+        capture_output: Capture stdout and stderr.
+        timeout: Seconds to wait before TimeoutExpired.
+        check: Raise CommandError on a non-zero exit status.
+        input_text: Data written to the command's stdin.
+        text: Decode stdin/stdout as text rather than bytes.
+
+    Returns:
+        The completed process.
+    """
     logger.debug("Running command: %s", shlex.join(command))
 
     result = subprocess.run(
@@ -35,6 +98,7 @@ def run_command_safely(
         timeout=timeout,
         check=False,
         input=input_text,
+        **spawn_options(command),
     )
 
     if check and result.returncode != 0:
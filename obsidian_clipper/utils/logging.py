@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 # ANSI color codes
@@ -52,7 +51,9 @@ def setup_logging(
     logger = logging.getLogger("obsidian_clipper")
     logger.setLevel(level if isinstance(level, int) else getattr(logging, level.upper()))
 
-    # Clear existing handlers
+    # Clear existing handlers, closing any log file they hold open
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Console handler with colors
@@ -64,6 +65,9 @@ def setup_logging(
 
     # Optional file handler with rotation
     if log_file:
+        # logging.handlers pulls in socket, pickle and queue; only load it here
+        from logging.handlers import RotatingFileHandler
+
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = RotatingFileHandler(
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import logging
-import subprocess
 
-from .command import run_command_safely
+from .command import CommandError, run_command_safely
 
 logger = logging.getLogger(__name__)
 
+# notify-send urgency levels
+URGENCY_LOW = "low"
+URGENCY_NORMAL = "normal"
+URGENCY_CRITICAL = "critical"
+
 
 def notify(
     title: str,
     message: str,
-    urgency: str = "normal",
+    urgency: str = URGENCY_NORMAL,
     app_name: str = "Obsidian Clipper",
     icon: str | None = None,
 ) -> bool:
@@ -25,21 +29,21 @@ def notify(
         cmd.extend([title, message])
         run_command_safely(cmd, check=True)
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (CommandError, FileNotFoundError):
         print(f"[{urgency.upper()}] {title}: {message}")
         return False
 
 
 def notify_success(title: str, message: str, icon: str | None = None) -> bool:
     """Send a success notification."""
-    return notify(title, message, "normal", icon=icon)
+    return notify(title, message, URGENCY_NORMAL, icon=icon)
 
 
 def notify_error(title: str, message: str) -> bool:
     """Send an error notification."""
-    return notify(title, message, "critical")
+    return notify(title, message, URGENCY_CRITICAL)
 
 
 def notify_warning(title: str, message: str) -> bool:
     """Send a warning notification."""
-    return notify(title, message, "low")
+    return notify(title, message, URGENCY_LOW)
@@ -12,12 +12,20 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def _next_delay(current: float, backoff: float, max_delay: float | None) -> float:
+    """Apply *backoff* to *current*, capped at *max_delay* when given."""
+    delay = current * backoff
+    return delay if max_delay is None else min(delay, max_delay)
+
+
 def retry_with_backoff(
     func: Callable[[], T | None],
     max_attempts: int = 3,
     delay: float = 0.1,
     backoff: float = 1.0,
     should_retry: Callable[[T | None], bool] | None = None,
+    max_delay: float | None = None,
+    sleep: Callable[[float], None] | None = None,
 ) -> T | None:
     """Execute a function with retry and optional backoff.
 
@@ -28,10 +36,15 @@ def retry_with_backoff(
         backoff: Multiplier for delay after each attempt.
         should_retry: Optional function to determine if retry is needed.
                       If None, retries when result is None or falsy.
+        max_delay: Optional upper bound on the delay between retries.
+        sleep: Called with each delay; tests pass a recorder instead of
+               waiting in real time. Defaults to time.sleep, looked up
+               per call so patching the module's time.sleep still works.
 
     Returns:
         Result of func if successful, None otherwise.
     """
+    pause = time.sleep if sleep is None else sleep
     current_delay = delay
 
     for attempt in range(max_attempts):
@@ -49,8 +62,8 @@ def retry_with_backoff(
                     max_attempts,
                     current_delay,
                 )
-                time.sleep(current_delay)
-                current_delay *= backoff
+                pause(current_delay)
+                current_delay = _next_delay(current_delay, backoff, max_delay)
                 continue
 
             return result
@@ -63,8 +76,8 @@ def retry_with_backoff(
                     max_attempts,
                     e,
                 )
-                time.sleep(current_delay)
-                current_delay *= backoff
+                pause(current_delay)
+                current_delay = _next_delay(current_delay, backoff, max_delay)
             else:
                 logger.warning("All %d retry attempts failed", max_attempts)
                 raise
@@ -99,7 +99,15 @@ def _capture_screenshot_session(
     )
 
     try:
-        screenshot_path, ocr_text = capture.capture()
+        # OCR runs in the background while the citation retry polls below.
+        screenshot_path, _ = capture.capture(blocking=False)
+
+        # Retry citation after screenshot if still missing
+        if session.citation is None:
+            session.citation = get_citation()
+
+        # Optimization rewrites the image, so it must wait for OCR to finish.
+        ocr_text = capture.wait_ocr()
         if screenshot_path:
             # Optimize image
             screenshot_path = _optimize_screenshot(
@@ -111,10 +119,6 @@ def _capture_screenshot_session(
             session.ocr_text = ocr_text
             session.img_filename = screenshot_path.name
 
-        # Retry citation after screenshot if still missing
-        if session.citation is None:
-            session.citation = get_citation()
-
         # Use fallback window citation if still no citation
         if session.citation is None:
             session.citation = _get_fallback_citation(pre_capture_window_title)
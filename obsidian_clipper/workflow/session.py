@@ -10,11 +10,26 @@ from pathlib import Path
 
 from ..capture import Citation
 
+# Template block syntax: {{#each tags}}…{{/each}}, {{#if f}}…{{/if}}, etc.
+TEMPLATE_EACH_PATTERN = re.compile(
+    r"\{\{#each\s+(\w+)\}\}(.*?)\{\{/each\}\}", re.DOTALL
+)
+TEMPLATE_IF_PATTERN = re.compile(r"\{\{#if\s+(\w+)\}\}(.*?)\{\{/if\}\}", re.DOTALL)
+TEMPLATE_UNLESS_PATTERN = re.compile(
+    r"\{\{#unless\s+(\w+)\}\}(.*?)\{\{/unless\}\}", re.DOTALL
+)
 
-@dataclass
+# Simple placeholders such as {{text}} or {{date}}
+TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+
+@dataclass(slots=True)
 class CaptureSession:
     """Represents a capture session with all captured content.
 
+    The session is slotted: it is filled in field by field during a
+    capture, but carries no per-instance ``__dict__``.
+
     Attributes:
         timestamp: Timestamp string for the capture.
         text: Captured text from selection.
@@ -143,7 +158,7 @@ class CaptureSession:
                 return ""
             return "".join(body.replace("{{this}}", item) for item in items)
 
-        content = re.sub(r"\{\{#each\s+(\w+)\}\}(.*?)\{\{/each\}\}", _eval_each, content, flags=re.DOTALL)
+        content = TEMPLATE_EACH_PATTERN.sub(_eval_each, content)
 
         # Process {{#if field}}...{{/if}}
         def _eval_if(match: re.Match[str]) -> str:
@@ -152,7 +167,7 @@ class CaptureSession:
             value = subs.get(field, "")
             return body if value else ""
 
-        content = re.sub(r"\{\{#if\s+(\w+)\}\}(.*?)\{\{/if\}\}", _eval_if, content, flags=re.DOTALL)
+        content = TEMPLATE_IF_PATTERN.sub(_eval_if, content)
 
         # Process {{#unless field}}...{{/unless}}
         def _eval_unless(match: re.Match[str]) -> str:
@@ -161,13 +176,12 @@ class CaptureSession:
             value = subs.get(field, "")
             return body if not value else ""
 
-        content = re.sub(r"\{\{#unless\s+(\w+)\}\}(.*?)\{\{/unless\}\}", _eval_unless, content, flags=re.DOTALL)
+        content = TEMPLATE_UNLESS_PATTERN.sub(_eval_unless, content)
 
-        # Replace all placeholders
-        for key, value in subs.items():
-            content = content.replace("{{" + key + "}}", value)
-
-        return content
+        # Replace all placeholders in one pass; unknown ones are left as-is
+        return TEMPLATE_PLACEHOLDER_PATTERN.sub(
+            lambda m: subs.get(m.group(1), m.group(0)), content
+        )
 
     def _render_frontmatter(self, tags: list[str]) -> str:
         if not tags:
@@ -248,10 +262,9 @@ class CaptureSession:
 
     def get_preview(self, max_length: int = 50) -> str:
         """Get a short preview of captured content."""
-        if self.text:
-            preview = self.text[:max_length]
-            return preview + "..." if len(self.text) > max_length else preview
-        if self.ocr_text:
-            preview = self.ocr_text[:max_length]
-            return preview + "..." if len(self.ocr_text) > max_length else preview
-        return "Screenshot"
+        source = self.text or self.ocr_text
+        if not source:
+            return "Screenshot"
+        if len(source) > max_length:
+            return source[:max_length] + "..."
+        return source
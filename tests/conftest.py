@@ -0,0 +1,143 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from typing import IO, Any, cast
+
+import pytest
+
+import obsidian_clipper.capture.screenshot as screenshot_module
+import obsidian_clipper.config as config_module
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_singleton(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test an empty config singleton and restore it afterwards.
+
+    A config cached by one test (e.g. via an unpatched ``get_config()``)
+    would otherwise leak into later tests, making results depend on order.
+    """
+    monkeypatch.setattr(config_module, "_config", None)
+
+
+@pytest.fixture(autouse=True)
+def _without_tesserocr(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Send OCR through the mocked tesseract CLI even if tesserocr is installed.
+
+    ``_tesseract_api`` caches a loaded model per language, so a test that
+    reached the real binding would otherwise change what later tests see.
+    """
+    monkeypatch.setattr(screenshot_module, "_tesseract_api", lambda lang: None)
+
+
+@pytest.fixture(scope="session")
+def png_bytes() -> bytes:
+    """Return a minimal payload that passes the PNG signature check."""
+    return b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+@pytest.fixture(scope="session")
+def eng_ocr_config() -> SimpleNamespace:
+    """Return a config stand-in with English OCR."""
+    return SimpleNamespace(ocr_language="eng")
+
+
+@pytest.fixture
+def img_file(tmp_path: Path, png_bytes: bytes) -> Path:
+    """Write the dummy PNG into this test's temporary directory."""
+    path = tmp_path / "test.png"
+    path.write_bytes(png_bytes)
+    return path
+
+
+class FakeTools:
+    """In-process stand-in for ``subprocess.run``, keyed by ``argv[0]``.
+
+    Each ``register`` call queues one response for a program; responses are
+    consumed in order and the last one repeats. Programs that were never
+    registered raise FileNotFoundError, as a missing tool would.
+    """
+
+    def __init__(self) -> None:
+        self._responses: dict[str, list[Any]] = {}
+        self.calls: list[list[str]] = []
+
+    def register(
+        self,
+        program: str,
+        returncode: int = 0,
+        stdout: str | bytes = "",
+        stderr: str | bytes = "",
+        *,
+        raises: BaseException | None = None,
+    ) -> None:
+        """Queue a result for *program*, or an exception to raise instead."""
+        response = raises or subprocess.CompletedProcess(
+            [program], returncode, stdout, stderr
+        )
+        self._responses.setdefault(program, []).append(response)
+
+    @property
+    def programs(self) -> list[str]:
+        """Return the programs spawned so far, in order."""
+        return [argv[0] for argv in self.calls]
+
+    def __call__(self, args: list[str], **kwargs: Any) -> Any:
+        self.calls.append(list(args))
+        queue = self._responses.get(args[0])
+        if not queue:
+            raise FileNotFoundError(args[0])
+        response = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(response, BaseException):
+            raise response
+        # Mirror subprocess.run writing into a caller-supplied file
+        sink = kwargs.get("stdout")
+        if (
+            isinstance(response.stdout, bytes)
+            and sink is not None
+            and hasattr(sink, "write")
+        ):
+            cast(IO[bytes], sink).write(response.stdout)
+        if kwargs.get("check") and response.returncode != 0:
+            raise subprocess.CalledProcessError(
+                response.returncode, args, response.stdout, response.stderr
+            )
+        return response
+
+
+@pytest.fixture
+def fake_subprocess(monkeypatch: pytest.MonkeyPatch) -> FakeTools:
+    """Route ``subprocess.run`` to a FakeTools responder for this test."""
+    fake = FakeTools()
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps on it.
+
+    Pass ``monotonic`` and ``sleep`` to code that takes an injectable clock;
+    nothing is patched, and every requested sleep is recorded.
+    """
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record *seconds* and advance the clock by that much."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """Return a fresh FakeClock for this test."""
+    return FakeClock()
@@ -16,6 +16,9 @@ from obsidian_clipper.exceptions import (
 )
 from obsidian_clipper.obsidian import ObsidianClient, validate_path
 
+# Patch target for the HTTP session every client request goes through
+SESSION_TARGET = "obsidian_clipper.obsidian.api.requests.Session"
+
 
 class TestValidatePath:
     """Tests for path validation."""
@@ -137,7 +140,7 @@ class TestObsidianClient:
         url = client._build_url("Notes/My Note.md")
         assert "/vault/Notes/My%20Note.md" in url
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_check_connection_success(self, mock_session, client):
         """Test successful connection check."""
         mock_response = Mock()
@@ -149,7 +152,7 @@ class TestObsidianClient:
         result = client.check_connection()
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_check_connection_failure(self, mock_session, client):
         """Test failed connection check."""
         mock_session_instance = MagicMock()
@@ -161,7 +164,7 @@ class TestObsidianClient:
         result = client.check_connection()
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_append_to_note_success(self, mock_session, client):
         """Test successful note append."""
         mock_response = Mock()
@@ -171,7 +174,7 @@ class TestObsidianClient:
         result = client.append_to_note("Notes/Test.md", "New content")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_append_to_note_failure(self, mock_session, client):
         """Test failed note append."""
         mock_response = Mock()
@@ -181,7 +184,7 @@ class TestObsidianClient:
         result = client.append_to_note("Notes/Test.md", "New content")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_ensure_note_exists_already_exists(self, mock_session, client):
         """Test ensure_note_exists when note exists."""
         mock_response = Mock()
@@ -191,7 +194,7 @@ class TestObsidianClient:
         result = client.ensure_note_exists("Notes/Test.md")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_ensure_note_exists_creates(self, mock_session, client):
         """Test ensure_note_exists creates note when missing."""
         # First call (GET) returns 404, second call (PUT) returns 201
@@ -220,7 +223,7 @@ class TestObsidianClient:
         client.close()
         assert client._session is None
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_execute_request_timeout(self, mock_session, client):
         """Test _execute_request raises APIRequestError on timeout."""
         mock_session_instance = MagicMock()
@@ -231,7 +234,7 @@ class TestObsidianClient:
             client._execute_request("GET", "https://test.com")
         assert "timed out" in str(exc_info.value).lower()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_execute_request_general_error(self, mock_session, client):
         """Test _execute_request raises APIRequestError on general error."""
         mock_session_instance = MagicMock()
@@ -244,7 +247,7 @@ class TestObsidianClient:
             client._execute_request("GET", "https://test.com")
         assert "failed" in str(exc_info.value).lower()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_ensure_note_exists_exception(self, mock_session, client):
         """Test ensure_note_exists returns False on exception."""
         mock_session_instance = MagicMock()
@@ -256,7 +259,7 @@ class TestObsidianClient:
         result = client.ensure_note_exists("Notes/Test.md")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_ensure_note_exists_create_fails(self, mock_session, client):
         """Test ensure_note_exists returns False when create returns error."""
         mock_get = Mock()
@@ -269,7 +272,7 @@ class TestObsidianClient:
         result = client.ensure_note_exists("Notes/New.md")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_ensure_note_exists_unexpected_status(self, mock_session, client):
         """Test ensure_note_exists returns False on unexpected status."""
         mock_response = Mock()
@@ -280,7 +283,7 @@ class TestObsidianClient:
         result = client.ensure_note_exists("Notes/Test.md")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_append_to_note_exception(self, mock_session, client):
         """Test append_to_note returns False on exception."""
         mock_session_instance = MagicMock()
@@ -297,7 +300,7 @@ class TestObsidianClient:
         result = client.upload_image("/nonexistent/path/image.png")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_upload_image_success(self, mock_session, client):
         """Test successful image upload."""
         # Create a temporary image file
@@ -315,7 +318,7 @@ class TestObsidianClient:
         finally:
             Path(temp_path).unlink()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_upload_image_with_custom_dest(self, mock_session, client):
         """Test image upload with custom destination."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -336,7 +339,7 @@ class TestObsidianClient:
         finally:
             Path(temp_path).unlink()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_upload_image_failure(self, mock_session, client):
         """Test upload_image returns False on API failure."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -353,7 +356,7 @@ class TestObsidianClient:
         finally:
             Path(temp_path).unlink()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_upload_image_connection_error(self, mock_session, client):
         """Test upload_image returns False on connection error."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -372,7 +375,7 @@ class TestObsidianClient:
         finally:
             Path(temp_path).unlink()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_upload_image_os_error(self, mock_session, client):
         """Test upload_image returns False on OS error reading file."""
         # Create a mock that will fail when trying to read
@@ -391,7 +394,7 @@ class TestObsidianClient:
             finally:
                 Path(temp_path).unlink()
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_get_session_adds_keep_alive(self, mock_session, client):
         """Test _get_session adds keep-alive header."""
         mock_session_instance = MagicMock()
@@ -407,7 +410,7 @@ class TestObsidianClient:
         )
         assert found
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_check_connection_404(self, mock_session, client):
         """Test check_connection returns True on 404."""
         mock_response = Mock()
@@ -419,7 +422,7 @@ class TestObsidianClient:
         result = client.check_connection()
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_check_connection_api_error(self, mock_session, client):
         """Test check_connection returns False on APIRequestError."""
         mock_session_instance = MagicMock()
@@ -429,7 +432,7 @@ class TestObsidianClient:
         result = client.check_connection()
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_append_to_note_created(self, mock_session, client):
         """Test append_to_note returns True on 201."""
         mock_response = Mock()
@@ -439,7 +442,7 @@ class TestObsidianClient:
         result = client.append_to_note("Notes/Test.md", "Content")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_append_to_note_no_content(self, mock_session, client):
         """Test append_to_note returns True on 204."""
         mock_response = Mock()
@@ -449,7 +452,7 @@ class TestObsidianClient:
         result = client.append_to_note("Notes/Test.md", "Content")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_ensure_note_exists_created_204(self, mock_session, client):
         """Test ensure_note_exists returns True on 204."""
         mock_get = Mock()
@@ -462,7 +465,7 @@ class TestObsidianClient:
         result = client.ensure_note_exists("Notes/New.md")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_create_note_success(self, mock_session, client):
         """Test successful note creation."""
         mock_response = Mock()
@@ -472,7 +475,7 @@ class TestObsidianClient:
         result = client.create_note("Notes/NewNote.md", "# Hello")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_create_note_success_200(self, mock_session, client):
         """Test note creation with 200 status."""
         mock_response = Mock()
@@ -482,7 +485,7 @@ class TestObsidianClient:
         result = client.create_note("Notes/Note.md", "Content")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_create_note_success_204(self, mock_session, client):
         """Test note creation with 204 status."""
         mock_response = Mock()
@@ -492,7 +495,7 @@ class TestObsidianClient:
         result = client.create_note("Notes/Note.md", "Content")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_create_note_server_error(self, mock_session, client):
         """Test note creation fails on 500."""
         mock_response = Mock()
@@ -502,7 +505,7 @@ class TestObsidianClient:
         result = client.create_note("Notes/Note.md", "Content")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_create_note_connection_error(self, mock_session, client):
         """Test note creation returns False on connection error."""
         mock_session_instance = MagicMock()
@@ -514,7 +517,7 @@ class TestObsidianClient:
         result = client.create_note("Notes/Note.md", "Content")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
+    @patch(SESSION_TARGET)
     def test_create_note_sends_put_request(self, mock_session, client):
         """Test create_note sends PUT request with correct content type."""
         mock_response = Mock()
@@ -531,6 +534,7 @@ class TestObsidianClient:
         assert "text/markdown" in str(call_args)
 
 
+@patch(SESSION_TARGET)
 class TestSearchAPI:
     """Tests for search, tags, and directory listing methods."""
 
@@ -539,7 +543,6 @@ class TestSearchAPI:
         config = Config(api_key="testkey1234567890", _loaded=True)
         return ObsidianClient(config)
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_search_returns_results(self, mock_session, client):
         """Test structured search returns matching results."""
         mock_response = Mock()
@@ -554,7 +557,6 @@ class TestSearchAPI:
         assert len(results) == 1
         assert results[0]["filename"] == "Notes/Test.md"
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_search_empty_results(self, mock_session, client):
         """Test search with no matches returns empty list."""
         mock_response = Mock()
@@ -566,7 +568,6 @@ class TestSearchAPI:
         results = client.search("nonexistent")
         assert results == []
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_search_connection_error(self, mock_session, client):
         """Test search returns empty list on connection error."""
         mock_session_instance = MagicMock()
@@ -576,7 +577,6 @@ class TestSearchAPI:
         results = client.search("query")
         assert results == []
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_search_simple_returns_paths(self, mock_session, client):
         """Test simple search returns file paths."""
         mock_response = Mock()
@@ -588,7 +588,6 @@ class TestSearchAPI:
         results = client.search_simple("test query")
         assert len(results) == 2
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_get_tags_returns_dict(self, mock_session, client):
         """Test get_tags returns tag dict."""
         mock_response = Mock()
@@ -601,7 +600,6 @@ class TestSearchAPI:
         assert "research" in tags
         assert tags["research"]["count"] == 5
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_list_directory_root(self, mock_session, client):
         """Test listing root vault directory."""
         mock_response = Mock()
@@ -613,7 +611,6 @@ class TestSearchAPI:
         files = client.list_directory()
         assert "README.md" in files
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_list_directory_subpath(self, mock_session, client):
         """Test listing a subdirectory."""
         mock_response = Mock()
@@ -626,6 +623,7 @@ class TestSearchAPI:
         assert len(files) == 2
 
 
+@patch(SESSION_TARGET)
 class TestAdvancedAPI:
     """Tests for open, active file, and periodic note endpoints."""
 
@@ -634,7 +632,6 @@ class TestAdvancedAPI:
         config = Config(api_key="testkey1234567890", _loaded=True)
         return ObsidianClient(config)
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_open_note_success(self, mock_session, client):
         """Test opening a note in Obsidian."""
         mock_response = Mock()
@@ -644,7 +641,6 @@ class TestAdvancedAPI:
         result = client.open_note("Notes/Test.md")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_open_note_with_new_leaf(self, mock_session, client):
         """Test opening a note in a new pane."""
         mock_response = Mock()
@@ -656,7 +652,6 @@ class TestAdvancedAPI:
         result = client.open_note("Notes/Test.md", new_leaf=True)
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_open_note_connection_error(self, mock_session, client):
         """Test open_note returns False on connection error."""
         mock_session_instance = MagicMock()
@@ -666,7 +661,6 @@ class TestAdvancedAPI:
         result = client.open_note("Notes/Test.md")
         assert result is False
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_get_active_file(self, mock_session, client):
         """Test getting the currently active file."""
         mock_response = Mock()
@@ -677,7 +671,6 @@ class TestAdvancedAPI:
         filepath = client.get_active_file()
         assert filepath == "Notes/Daily.md"
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_get_active_file_none(self, mock_session, client):
         """Test get_active_file returns None when no file active."""
         mock_response = Mock()
@@ -687,7 +680,6 @@ class TestAdvancedAPI:
         filepath = client.get_active_file()
         assert filepath is None
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_get_periodic_note(self, mock_session, client):
         """Test getting daily note content."""
         mock_response = Mock()
@@ -698,7 +690,6 @@ class TestAdvancedAPI:
         content = client.get_periodic_note("daily")
         assert "Today's Note" in content
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_get_periodic_note_not_found(self, mock_session, client):
         """Test get_periodic_note returns None for 404."""
         mock_response = Mock()
@@ -708,7 +699,6 @@ class TestAdvancedAPI:
         content = client.get_periodic_note("daily")
         assert content is None
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_append_periodic_note_success(self, mock_session, client):
         """Test appending to a daily note."""
         mock_response = Mock()
@@ -718,7 +708,6 @@ class TestAdvancedAPI:
         result = client.append_periodic_note("daily", "- new task")
         assert result is True
 
-    @patch("obsidian_clipper.obsidian.api.requests.Session")
     def test_append_periodic_note_failure(self, mock_session, client):
         """Test append_periodic_note returns False on error."""
         mock_response = Mock()
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
 import subprocess
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+import obsidian_clipper.capture.citation as citation_module
 from obsidian_clipper.capture import (
     Citation,
     ScreenshotCapture,
@@ -27,6 +30,18 @@ from obsidian_clipper.capture import (
     take_screenshot,
 )
 from obsidian_clipper.exceptions import ScreenshotError
+from obsidian_clipper.utils import retry as retry_module
+
+
+@pytest.fixture(scope="module")
+def pdf_citation():
+    """Shared PDF citation; citations are frozen, so one instance is safe."""
+    return Citation(
+        title="Document.pdf",
+        page="42",
+        source="Evince",
+        source_type=SourceType.PDF,
+    )
 
 
 class TestCitationParsing:
@@ -41,6 +56,14 @@ class TestCitationParsing:
         assert citation.source == "Evince"
         assert citation.source_type == SourceType.PDF
 
+    def test_parse_pdf_citation_evince_trailing_text(self):
+        """Test Evince titles outside the plain form still parse."""
+        citation = parse_pdf_citation("Research Paper.pdf - page 42 (edited)")
+        assert citation is not None
+        assert citation.title == "Research Paper.pdf"
+        assert citation.page == "42"
+        assert citation.source == "Evince"
+
     def test_parse_pdf_citation_zathura(self):
         """Test parsing Zathura PDF citation."""
         citation = parse_pdf_citation("Notes.pdf (15/200)")
@@ -134,6 +157,20 @@ class TestCitationParsing:
         assert citation.title == "News Site"
         assert citation.source == "Brave"
 
+    def test_parse_browser_citation_chromium(self):
+        """Test parsing Chromium browser citation."""
+        citation = parse_browser_citation("Release Notes - Chromium")
+        assert citation is not None
+        assert citation.title == "Release Notes"
+        assert citation.source == "Chromium"
+
+    def test_parse_browser_citation_canonical_name(self):
+        """Test short browser names are mapped to their full names."""
+        citation = parse_browser_citation("Search Results - Firefox")
+        assert citation is not None
+        assert citation.title == "Search Results"
+        assert citation.source == "Mozilla Firefox"
+
     def test_parse_browser_citation_no_match(self):
         """Test when window title doesn't match browser pattern."""
         citation = parse_browser_citation("Document.pdf — Page 42")
@@ -247,16 +284,10 @@ class TestCitationParsing:
         assert citation.source == "VSCode"
         assert citation.extra.get("project") == "myproject"
 
-    def test_citation_format_markdown(self):
+    def test_citation_format_markdown(self, pdf_citation):
         """Test markdown formatting of citations."""
-        citation = Citation(
-            title="Document.pdf",
-            page="42",
-            source="Evince",
-            source_type=SourceType.PDF,
-        )
         expected = " — *Document.pdf, p. 42* · Evince"
-        assert citation.format_markdown() == expected
+        assert pdf_citation.format_markdown() == expected
 
     def test_citation_format_markdown_minimal(self):
         """Test markdown formatting with minimal info."""
@@ -267,6 +298,11 @@ class TestCitationParsing:
         expected = " — *Article*"
         assert citation.format_markdown() == expected
 
+    def test_citation_is_immutable(self, pdf_citation):
+        """Test citations cannot be modified after creation."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pdf_citation.title = "Other"
+
     def test_citation_format_markdown_empty(self):
         """Test markdown formatting with no info."""
         citation = Citation(title="")
@@ -296,6 +332,34 @@ class TestCitationParsing:
         assert citation.page == "10"
         assert citation.source_type == SourceType.PDF
 
+    def test_parse_citation_from_window_title_without_separator(self):
+        """Test reader titles without a dash separator still parse."""
+        citation = parse_citation_from_window_title("Notes.pdf (15/200)")
+        assert citation is not None
+        assert citation.page == "15"
+        assert citation.source == "Zathura"
+
+    def test_parse_citation_from_window_title_shares_instances(self):
+        """Test memoized parsing hands out one read-only citation per title."""
+        first = parse_citation_from_window_title("Main.java — core — PyCharm")
+        with pytest.raises(TypeError):
+            first.extra["project"] = "changed"
+        second = parse_citation_from_window_title("Main.java — core — PyCharm")
+        assert second is first
+        assert second.extra["project"] == "core"
+
+    def test_parse_citation_from_window_title_hashable(self):
+        """Test memoized citations can be hashed and compared by value."""
+        title = "Main.java — core — PyCharm"
+        first = parse_citation_from_window_title(title)
+        citation_module._parse_citation_cached.cache_clear()
+        second = parse_citation_from_window_title(title)
+
+        assert second is not first
+        assert second == first
+        assert hash(second) == hash(first)
+        assert {first, second} == {first}
+
     def test_parse_citation_from_window_title_raw_fallback(self):
         """Test raw-title fallback for unknown title formats."""
         citation = parse_citation_from_window_title("My Untitled Research Window")
@@ -321,10 +385,11 @@ class TestCitationParsing:
         citation = parse_generic_citation("Book Title — Okular")
         assert citation is None
 
-    @patch("obsidian_clipper.utils.retry.time.sleep")
     @patch("obsidian_clipper.capture.citation.get_active_window_title")
-    def test_get_citation_skips_transient_titles(self, mock_title, mock_sleep):
+    def test_get_citation_skips_transient_titles(self, mock_title, monkeypatch):
         """Test citation detection retries through transient tool window titles."""
+        sleeps = []
+        monkeypatch.setattr(retry_module.time, "sleep", sleeps.append)
         mock_title.side_effect = [
             "Flameshot",
             "GNOME Shell",
@@ -337,23 +402,30 @@ class TestCitationParsing:
         assert citation.title == "Paper.pdf"
         assert citation.page == "10"
         assert citation.source_type == SourceType.PDF
+        assert len(sleeps) == 2
+
+    @patch("obsidian_clipper.capture.citation.get_active_window_title")
+    def test_get_citation_wait_budget(self, mock_title, monkeypatch):
+        """Test giving up on a transient window waits no longer than 0.6s."""
+        sleeps = []
+        monkeypatch.setattr(retry_module.time, "sleep", sleeps.append)
+        mock_title.return_value = "Flameshot"
+
+        assert get_citation() is None
+        assert sum(sleeps) <= 0.6
 
 
 class TestScreenshot:
     """Tests for screenshot functions."""
 
-    @patch("obsidian_clipper.capture.screenshot.os.path.getsize")
-    @patch("obsidian_clipper.capture.screenshot.os.path.exists")
-    @patch("obsidian_clipper.capture.screenshot.Path.exists")
+    @patch("obsidian_clipper.capture.screenshot._file_has_content")
     @patch("obsidian_clipper.capture.screenshot.run_command_safely")
     @patch("obsidian_clipper.capture.screenshot.subprocess.run")
     def test_take_screenshot_flameshot_failure(
         self,
         mock_subprocess,
         mock_run,
-        mock_path_exists,
-        mock_os_exists,
-        mock_os_getsize,
+        mock_has_content,
     ):
         """Test flameshot failure raises error."""
         # Make all subprocess calls fail with realistic exception types
@@ -362,26 +434,20 @@ class TestScreenshot:
 
         mock_subprocess.side_effect = subprocess.SubprocessError("Subprocess failed")
         mock_run.side_effect = CommandError("Command failed")
-        mock_os_exists.return_value = False
-        mock_os_getsize.return_value = 0
+        mock_has_content.return_value = False
 
         with pytest.raises(ScreenshotError):
             take_screenshot("/tmp/test.png", tool="flameshot")
 
     @patch("obsidian_clipper.capture.screenshot.get_config")
-    @patch("obsidian_clipper.capture.screenshot.Path.exists")
     @patch("obsidian_clipper.capture.screenshot.run_command_safely")
-    def test_ocr_image_success(self, mock_run, mock_exists, mock_config):
+    def test_ocr_image_success(self, mock_run, mock_config, img_file, eng_ocr_config):
         """Test successful OCR."""
-        mock_config_obj = MagicMock()
-        mock_config_obj.ocr_language = "eng"
-        mock_config.return_value = mock_config_obj
-        mock_exists.return_value = True
-        mock_result = MagicMock()
-        mock_result.stdout = "Extracted text"
+        mock_config.return_value = eng_ocr_config
+        mock_result = SimpleNamespace(stdout="Extracted text")
         mock_run.return_value = mock_result
 
-        result = ocr_image("/tmp/test.png")
+        result = ocr_image(img_file)
         assert result == "Extracted text"
 
     def test_ocr_image_file_not_found(self, tmp_path):
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from argparse import Namespace
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
@@ -11,9 +14,112 @@ from obsidian_clipper.capture import Citation, SourceType
 from obsidian_clipper.cli.args import parse_args
 from obsidian_clipper.cli.main import main, validate_config
 from obsidian_clipper.exceptions import ConfigurationError
+from obsidian_clipper.obsidian import ObsidianClient
 from obsidian_clipper.workflow import CaptureSession, prepare_capture_session
 
 
+def make_args(**overrides: object) -> Namespace:
+    """Build parsed CLI arguments with the parser's defaults."""
+    defaults: dict[str, object] = {
+        "screenshot": False,
+        "ocr": True,
+        "no_ocr": False,
+        "note": None,
+        "tags": None,
+        "template": None,
+        "ocr_lang": None,
+        "image_format": "png",
+        "image_quality": 85,
+        "annotate": False,
+        "screenshot_tool": "auto",
+    }
+    return Namespace(**{**defaults, **overrides})
+
+
+@dataclass
+class ConfigStub:
+    """The slice of Config read by the CLI, with canned validation errors."""
+
+    default_note: str = "Notes.md"
+    base_url: str = "https://127.0.0.1:27124"
+    errors: list[str] = field(default_factory=list)
+
+    def validate(self) -> list[str]:
+        return list(self.errors)
+
+
+# Screenshot path handed around by mocked captures; never touched on disk
+FAKE_CAPTURE_PATH = Path("/tmp/capture.png")
+
+# Attribute names of ObsidianClient, computed once. A name-list spec skips the
+# per-instance dir() walk and coroutine introspection of a class spec.
+_CLIENT_SPEC = dir(ObsidianClient)
+
+
+class StubClient:
+    """ObsidianClient stand-in returning fixed results without recording calls.
+
+    Use it where a test never inspects client calls; keyword arguments
+    override the result of the named method.
+    """
+
+    def __init__(self, **results: bool) -> None:
+        self._results = results
+
+    def __enter__(self) -> StubClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def _result(self, method: str) -> bool:
+        return self._results.get(method, True)
+
+    def check_connection(self) -> bool:
+        return self._result("check_connection")
+
+    def ensure_note_exists(self, *args: object, **kwargs: object) -> bool:
+        return self._result("ensure_note_exists")
+
+    def create_note(self, *args: object, **kwargs: object) -> bool:
+        return self._result("create_note")
+
+    def append_to_note(self, *args: object, **kwargs: object) -> bool:
+        return self._result("append_to_note")
+
+    def append_periodic_note(self, *args: object, **kwargs: object) -> bool:
+        return self._result("append_periodic_note")
+
+    def upload_image(self, *args: object, **kwargs: object) -> bool:
+        return self._result("upload_image")
+
+    def open_note(self, *args: object, **kwargs: object) -> bool:
+        return self._result("open_note")
+
+
+@pytest.fixture
+def make_client():
+    """Factory for ObsidianClient mocks whose API calls succeed by default.
+
+    Keyword arguments override the return value of the named method, e.g.
+    ``make_client(check_connection=False)``.
+    """
+
+    def _make(**results: bool) -> MagicMock:
+        client = MagicMock(spec=_CLIENT_SPEC)
+        for method in (
+            "check_connection",
+            "ensure_note_exists",
+            "create_note",
+            "append_to_note",
+            "append_periodic_note",
+        ):
+            getattr(client, method).return_value = results.get(method, True)
+        return client
+
+    return _make
+
+
 class TestCaptureSession:
     """Tests for CaptureSession dataclass."""
 
@@ -29,7 +135,7 @@ class TestCaptureSession:
 
     def test_has_content_with_screenshot_path(self):
         """Test has_content returns True when screenshot is captured pre-upload."""
-        session = CaptureSession(screenshot_path=Path("/tmp/capture.png"))
+        session = CaptureSession(screenshot_path=FAKE_CAPTURE_PATH)
         assert session.has_content() is True
 
     def test_has_content_with_ocr(self):
@@ -42,58 +148,45 @@ class TestCaptureSession:
         session = CaptureSession()
         assert session.has_content() is False
 
-    def test_to_markdown_basic(self):
-        """Test basic markdown generation."""
-        session = CaptureSession(
-            timestamp="2024-01-15 10:30:00",
-            text="Selected text",
-        )
-
-        md = session.to_markdown()
-
-        assert "2024-01-15" in md
-        assert "> Selected text" in md
-
-    def test_to_markdown_with_citation(self):
-        """Test markdown with citation."""
-        session = CaptureSession(
-            text="Quote",
-            citation=Citation(
-                title="Book.pdf",
-                page="42",
-                source="Evince",
-                source_type=SourceType.PDF,
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            pytest.param(
+                {"timestamp": "2024-01-15 10:30:00", "text": "Selected text"},
+                ["2024-01-15", "> Selected text"],
+                id="basic",
             ),
-        )
-
-        md = session.to_markdown()
-
-        assert "> Quote" in md
-        assert "Book.pdf" in md
-        assert "p.42" in md
-        assert "Evince" in md
-
-    def test_to_markdown_with_screenshot(self):
-        """Test markdown with screenshot."""
-        session = CaptureSession(
-            screenshot_success=True,
-            img_filename="capture_20240115.png",
-        )
-
-        md = session.to_markdown()
-
-        assert "![[capture_20240115.png]]" in md
-
-    def test_to_markdown_with_ocr(self):
-        """Test markdown with OCR text."""
-        session = CaptureSession(
-            ocr_text="Extracted content",
-        )
-
-        md = session.to_markdown()
+            pytest.param(
+                {
+                    "text": "Quote",
+                    "citation": Citation(
+                        title="Book.pdf",
+                        page="42",
+                        source="Evince",
+                        source_type=SourceType.PDF,
+                    ),
+                },
+                ["> Quote", "Book.pdf", "p.42", "Evince"],
+                id="citation",
+            ),
+            pytest.param(
+                {"screenshot_success": True, "img_filename": "capture_20240115.png"},
+                ["![[capture_20240115.png]]"],
+                id="screenshot",
+            ),
+            pytest.param(
+                {"ocr_text": "Extracted content"},
+                ["> Extracted content"],
+                id="ocr",
+            ),
+        ],
+    )
+    def test_to_markdown(self, fields, expected):
+        """Test markdown generation contains the expected fragments."""
+        md = CaptureSession(**fields).to_markdown()
 
-        # OCR text is now in blockquote format
-        assert "> Extracted content" in md
+        for fragment in expected:
+            assert fragment in md
 
     def test_get_preview_text(self):
         """Test preview from text."""
@@ -120,6 +213,12 @@ class TestCaptureSession:
         preview = session.get_preview()
         assert preview == "Screenshot"
 
+    def test_get_preview_screenshot_not_truncated(self):
+        """Test the Screenshot placeholder ignores max_length."""
+        session = CaptureSession()
+        preview = session.get_preview(max_length=5)
+        assert preview == "Screenshot"
+
 
 class TestParseArgs:
     """Tests for argument parsing."""
@@ -134,41 +233,28 @@ class TestParseArgs:
             assert args.note is None
             assert args.screenshot_tool == "auto"
 
-    def test_screenshot_flag(self):
-        """Test -s flag."""
-        with patch("sys.argv", ["clipper", "-s"]):
-            args = parse_args()
-            assert args.screenshot is True
-
-    def test_note_option(self):
-        """Test -n option."""
-        with patch("sys.argv", ["clipper", "-n", "Custom/Note.md"]):
-            args = parse_args()
-            assert args.note == "Custom/Note.md"
-
-    def test_ocr_lang_option(self):
-        """Test --ocr-lang option."""
-        with patch("sys.argv", ["clipper", "--ocr-lang", "deu"]):
-            args = parse_args()
-            assert args.ocr_lang == "deu"
-
-    def test_no_ocr_flag(self):
-        """Test --no-ocr flag."""
-        with patch("sys.argv", ["clipper", "-s", "--no-ocr"]):
-            args = parse_args()
-            assert args.no_ocr is True
-
-    def test_verbose_flag(self):
-        """Test -v flag."""
-        with patch("sys.argv", ["clipper", "-v"]):
-            args = parse_args()
-            assert args.verbose is True
-
-    def test_debug_flag(self):
-        """Test --debug flag."""
-        with patch("sys.argv", ["clipper", "--debug"]):
-            args = parse_args()
-            assert args.debug is True
+    def test_make_args_matches_parser_defaults(self):
+        """Test the make_args helper stays in sync with the real parser."""
+        with patch("sys.argv", ["clipper"]):
+            parsed = vars(parse_args())
+        helper = vars(make_args())
+        assert {key: parsed[key] for key in helper} == helper
+
+    @pytest.mark.parametrize(
+        ("argv", "attr", "expected"),
+        [
+            (["-s"], "screenshot", True),
+            (["-n", "Custom/Note.md"], "note", "Custom/Note.md"),
+            (["--ocr-lang", "deu"], "ocr_lang", "deu"),
+            (["-s", "--no-ocr"], "no_ocr", True),
+            (["-v"], "verbose", True),
+            (["--debug"], "debug", True),
+        ],
+    )
+    def test_flag(self, argv, attr, expected):
+        """Test each flag sets its argument."""
+        args = parse_args(argv)
+        assert getattr(args, attr) == expected
 
 
 class TestValidateConfig:
@@ -177,9 +263,7 @@ class TestValidateConfig:
     @patch("obsidian_clipper.cli.main.get_config")
     def test_valid_config(self, mock_get_config):
         """Test validation passes with valid config."""
-        mock_config = MagicMock()
-        mock_config.validate.return_value = []
-        mock_get_config.return_value = mock_config
+        mock_get_config.return_value = ConfigStub()
 
         # Should not raise
         validate_config()
@@ -187,9 +271,7 @@ class TestValidateConfig:
     @patch("obsidian_clipper.cli.main.get_config")
     def test_invalid_config(self, mock_get_config):
         """Test validation fails with invalid config."""
-        mock_config = MagicMock()
-        mock_config.validate.return_value = ["API key is required"]
-        mock_get_config.return_value = mock_config
+        mock_get_config.return_value = ConfigStub(errors=["API key is required"])
 
         with pytest.raises(ConfigurationError):
             validate_config()
@@ -198,240 +280,170 @@ class TestValidateConfig:
 class TestPrepareCaptureSession:
     """Tests for capture session preparation."""
 
-    @patch("obsidian_clipper.workflow.capture.ScreenshotCapture")
-    @patch("obsidian_clipper.workflow.capture.parse_citation_from_window_title")
-    @patch("obsidian_clipper.workflow.capture.get_active_window_title")
-    @patch("obsidian_clipper.workflow.capture.get_citation")
-    def test_screenshot_mode_retries_citation_after_capture(
-        self,
-        mock_get_citation,
-        mock_get_active_window_title,
-        mock_parse_from_title,
-        mock_capture_class,
-    ):
-        """Test screenshot mode retries citation when initial detection misses."""
-        args = MagicMock()
-        args.screenshot = True
-        args.ocr = True
-        args.no_ocr = False
-        args.screenshot_tool = "auto"
-        args.ocr_lang = None
-
-        mock_get_active_window_title.return_value = "Transient overlay title"
-        mock_parse_from_title.return_value = None
-        mock_get_citation.return_value = Citation(
-            title="Doc.pdf",
-            page="12",
-            source="Okular",
-            source_type=SourceType.PDF,
-        )
-
-        mock_capture = MagicMock()
-        mock_capture.capture.return_value = (Path("/tmp/capture.png"), "OCR text")
-        mock_capture_class.return_value = mock_capture
-
-        session = prepare_capture_session(args)
-
-        assert session.citation is not None
-        assert session.citation.page == "12"
-        assert mock_get_citation.call_count == 1
-
-    @patch("obsidian_clipper.workflow.capture.ScreenshotCapture")
-    @patch("obsidian_clipper.workflow.capture.parse_citation_from_window_title")
-    @patch("obsidian_clipper.workflow.capture.get_active_window_title")
-    @patch("obsidian_clipper.workflow.capture.get_citation")
-    def test_screenshot_mode_uses_pre_capture_window_title(
-        self,
-        mock_get_citation,
-        mock_get_active_window_title,
-        mock_parse_from_title,
-        mock_capture_class,
-    ):
-        """Test screenshot mode captures citation from active window before flameshot."""
-        args = MagicMock()
-        args.screenshot = True
-        args.ocr = True
-        args.no_ocr = False
-        args.screenshot_tool = "auto"
-        args.ocr_lang = None
-
-        mock_get_active_window_title.return_value = "CBT made simple — Page 44 — Okular"
-        mock_parse_from_title.return_value = Citation(
-            title="CBT made simple",
-            page="44",
-            source="Okular",
-            source_type=SourceType.PDF,
-        )
-
-        mock_capture = MagicMock()
-        mock_capture.capture.return_value = (Path("/tmp/capture.png"), "OCR text")
-        mock_capture_class.return_value = mock_capture
-
-        session = prepare_capture_session(args)
-
-        assert session.citation is not None
-        assert session.citation.page == "44"
-        mock_get_citation.assert_not_called()
-
-    @patch("obsidian_clipper.workflow.capture.ScreenshotCapture")
-    @patch("obsidian_clipper.workflow.capture.parse_citation_from_window_title")
-    @patch("obsidian_clipper.workflow.capture.get_active_window_title")
-    @patch("obsidian_clipper.workflow.capture.get_citation")
-    def test_screenshot_mode_uses_fallback_window_citation_when_none(
-        self,
-        mock_get_citation,
-        mock_get_active_window_title,
-        mock_parse_from_title,
-        mock_capture_class,
+    @pytest.fixture
+    def workflow_mocks(self):
+        """Patch window detection, citation lookup and screenshot capture."""
+        with patch.multiple(
+            "obsidian_clipper.workflow.capture",
+            ScreenshotCapture=DEFAULT,
+            parse_citation_from_window_title=DEFAULT,
+            get_active_window_title=DEFAULT,
+            get_citation=DEFAULT,
+        ) as mocks:
+            capture = mocks["ScreenshotCapture"].return_value
+            capture.capture.return_value = (FAKE_CAPTURE_PATH, "")
+            capture.wait_ocr.return_value = "OCR text"
+            yield mocks
+
+    @pytest.mark.parametrize(
+        ("window_title", "parsed", "retried", "expected", "retries"),
+        [
+            pytest.param(
+                "Transient overlay title",
+                None,
+                Citation(
+                    title="Doc.pdf",
+                    page="12",
+                    source="Okular",
+                    source_type=SourceType.PDF,
+                ),
+                ("Doc.pdf", "12", "Okular", SourceType.PDF),
+                1,
+                id="retries-citation-after-capture",
+            ),
+            pytest.param(
+                "CBT made simple — Page 44 — Okular",
+                Citation(
+                    title="CBT made simple",
+                    page="44",
+                    source="Okular",
+                    source_type=SourceType.PDF,
+                ),
+                None,
+                ("CBT made simple", "44", "Okular", SourceType.PDF),
+                0,
+                id="uses-pre-capture-window-title",
+            ),
+            pytest.param(
+                "Interesting Article - Zen Browser",
+                None,
+                None,
+                (
+                    "Interesting Article - Zen Browser",
+                    None,
+                    "Window",
+                    SourceType.UNKNOWN,
+                ),
+                1,
+                id="falls-back-to-window-title",
+            ),
+        ],
+    )
+    def test_screenshot_mode_citation(
+        self, workflow_mocks, window_title, parsed, retried, expected, retries
     ):
-        """Test screenshot mode creates unknown citation from window title fallback."""
-        args = MagicMock()
-        args.screenshot = True
-        args.ocr = True
-        args.no_ocr = False
-        args.screenshot_tool = "auto"
-        args.ocr_lang = None
-
-        mock_get_active_window_title.side_effect = [
-            "Interesting Article - Zen Browser",
-            "Interesting Article - Zen Browser",
-        ]
-        mock_parse_from_title.return_value = None
-        mock_get_citation.return_value = None
+        """Test screenshot mode resolves the citation before and after capture."""
+        args = make_args(screenshot=True)
 
-        mock_capture = MagicMock()
-        mock_capture.capture.return_value = (Path("/tmp/capture.png"), "OCR text")
-        mock_capture_class.return_value = mock_capture
+        workflow_mocks["get_active_window_title"].return_value = window_title
+        workflow_mocks["parse_citation_from_window_title"].return_value = parsed
+        workflow_mocks["get_citation"].return_value = retried
 
         session = prepare_capture_session(args)
 
         assert session.citation is not None
-        assert session.citation.title == "Interesting Article - Zen Browser"
-        assert session.citation.source == "Window"
-        assert session.citation.source_type == SourceType.UNKNOWN
+        citation = session.citation
+        assert (
+            citation.title,
+            citation.page,
+            citation.source,
+            citation.source_type,
+        ) == expected
+        assert workflow_mocks["get_citation"].call_count == retries
+        assert session.ocr_text == "OCR text"
+        capture = workflow_mocks["ScreenshotCapture"].return_value
+        capture.capture.assert_called_once_with(blocking=False)
 
 
 class TestMain:
     """Tests for main function."""
 
-    @patch("obsidian_clipper.cli.main.validate_config")
-    @patch("obsidian_clipper.cli.main.ObsidianClient")
-    @patch("obsidian_clipper.cli.main.get_config")
+    @pytest.fixture(autouse=True)
+    def main_mocks(self):
+        """Patch the CLI's config, client and notification hooks once per test."""
+        with patch.multiple(
+            "obsidian_clipper.cli.main",
+            validate_config=DEFAULT,
+            ObsidianClient=DEFAULT,
+            get_config=DEFAULT,
+            notify_error=DEFAULT,
+            notify_success=DEFAULT,
+        ) as mocks:
+            mocks["get_config"].return_value = ConfigStub()
+            yield mocks
+
+    @staticmethod
+    def _use_client(main_mocks, client):
+        """Make ``ObsidianClient(...)`` return *client*, its own context manager."""
+        main_mocks["ObsidianClient"].return_value = client
+
     @patch("obsidian_clipper.workflow.capture.get_citation")
     @patch("obsidian_clipper.workflow.capture.get_selected_text")
-    @patch("obsidian_clipper.cli.main.notify_success")
     def test_main_text_capture_success(
-        self,
-        mock_notify,
-        mock_get_text,
-        mock_get_citation,
-        mock_get_config,
-        mock_client_class,
-        mock_validate,
+        self, mock_get_text, mock_get_citation, main_mocks
     ):
         """Test successful text capture."""
         mock_get_text.return_value = "Test text"
         mock_get_citation.return_value = None
-        mock_config = MagicMock()
-        mock_config.default_note = "Notes.md"
-        mock_get_config.return_value = mock_config
-
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = True
-        mock_client.ensure_note_exists.return_value = True
-        mock_client.create_note.return_value = True
-        mock_client_class.return_value.__enter__.return_value = mock_client
+
+        self._use_client(main_mocks, StubClient())
 
         with patch("sys.argv", ["clipper"]):
             result = main()
 
         assert result == 0
-        mock_notify.assert_called()
+        main_mocks["notify_success"].assert_called()
 
-    @patch("obsidian_clipper.cli.main.validate_config")
-    @patch("obsidian_clipper.cli.main.ObsidianClient")
-    @patch("obsidian_clipper.cli.main.get_config")
-    @patch("obsidian_clipper.cli.main.notify_error")
-    def test_main_connection_failure(
-        self,
-        mock_notify_error,
-        mock_get_config,
-        mock_client_class,
-        mock_validate,
-    ):
+    @patch("obsidian_clipper.workflow.capture.get_citation", return_value=None)
+    @patch("obsidian_clipper.workflow.capture.get_selected_text", return_value="")
+    def test_main_connection_failure(self, _mock_get_text, _mock_citation, main_mocks):
         """Test connection failure handling."""
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = False
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        self._use_client(main_mocks, StubClient(check_connection=False))
 
         with patch("sys.argv", ["clipper"]):
             result = main()
 
         assert result == 1
-        mock_notify_error.assert_called()
+        main_mocks["notify_error"].assert_called()
 
-    @patch("obsidian_clipper.cli.main.validate_config")
-    @patch("obsidian_clipper.cli.main.ObsidianClient")
-    @patch("obsidian_clipper.cli.main.get_config")
     @patch("obsidian_clipper.workflow.capture.get_citation")
     @patch("obsidian_clipper.workflow.capture.get_selected_text")
-    @patch("obsidian_clipper.cli.main.notify_error")
-    def test_main_no_text(
-        self,
-        mock_notify_error,
-        mock_get_text,
-        mock_get_citation,
-        mock_get_config,
-        mock_client_class,
-        mock_validate,
-    ):
+    def test_main_no_text(self, mock_get_text, mock_get_citation, main_mocks):
         """Test handling when no text selected."""
         mock_get_text.return_value = ""
         mock_get_citation.return_value = None
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = True
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        self._use_client(main_mocks, StubClient())
 
         with patch("sys.argv", ["clipper"]):
             result = main()
 
         assert result == 1
-        mock_notify_error.assert_called()
+        main_mocks["notify_error"].assert_called()
 
-    @patch("obsidian_clipper.cli.main.validate_config")
-    @patch("obsidian_clipper.cli.main.notify_error")
-    def test_main_config_error(self, mock_notify_error, mock_validate):
+    def test_main_config_error(self, main_mocks):
         """Test configuration error handling."""
-        mock_validate.side_effect = ConfigurationError("Invalid config")
+        main_mocks["validate_config"].side_effect = ConfigurationError("Invalid config")
 
         with patch("sys.argv", ["clipper"]):
             result = main()
 
         assert result == 1
-        mock_notify_error.assert_called()
+        main_mocks["notify_error"].assert_called()
 
-    @patch("obsidian_clipper.cli.main.validate_config")
-    @patch("obsidian_clipper.cli.main.ObsidianClient")
-    @patch("obsidian_clipper.cli.main.get_config")
     @patch("obsidian_clipper.cli.main.prepare_capture_session")
-    @patch("obsidian_clipper.cli.main.notify_error")
-    def test_main_pdf_citation_without_page_fails(
-        self,
-        mock_notify_error,
-        mock_prepare,
-        mock_get_config,
-        mock_client_class,
-        mock_validate,
-    ):
+    def test_main_pdf_citation_without_page_fails(self, mock_prepare, main_mocks):
         """Test capture fails when PDF citation has no page number."""
-        mock_config = MagicMock()
-        mock_config.default_note = "Notes.md"
-        mock_get_config.return_value = mock_config
-
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = True
-        mock_client.ensure_note_exists.return_value = True
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        self._use_client(main_mocks, StubClient())
 
         mock_prepare.return_value = CaptureSession(
             text="Some selected text",
@@ -447,34 +459,15 @@ class TestMain:
             result = main()
 
         assert result == 1
-        mock_notify_error.assert_called()
+        main_mocks["notify_error"].assert_called()
 
-    @patch("obsidian_clipper.cli.main.validate_config")
-    @patch("obsidian_clipper.cli.main.ObsidianClient")
-    @patch("obsidian_clipper.cli.main.get_config")
     @patch("obsidian_clipper.cli.main.prepare_capture_session")
-    @patch("obsidian_clipper.cli.main.notify_error")
-    def test_main_screenshot_ocr_empty_fails(
-        self,
-        mock_notify_error,
-        mock_prepare,
-        mock_get_config,
-        mock_client_class,
-        mock_validate,
-    ):
+    def test_main_screenshot_ocr_empty_fails(self, mock_prepare, main_mocks):
         """Test screenshot mode fails when OCR is enabled but produces no text."""
-        mock_config = MagicMock()
-        mock_config.default_note = "Notes.md"
-        mock_get_config.return_value = mock_config
-
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = True
-        mock_client.ensure_note_exists.return_value = True
-        mock_client.create_note.return_value = True
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        self._use_client(main_mocks, StubClient())
 
         mock_prepare.return_value = CaptureSession(
-            screenshot_path=Path("/tmp/capture.png"),
+            screenshot_path=FAKE_CAPTURE_PATH,
             ocr_text="",
         )
 
@@ -482,7 +475,7 @@ class TestMain:
             result = main()
 
         assert result == 1
-        mock_notify_error.assert_called()
+        main_mocks["notify_error"].assert_called()
 
 
 class TestURIFallback:
@@ -494,7 +487,7 @@ class TestURIFallback:
         """Test URI fallback succeeds when xdg-open returns 0."""
         from obsidian_clipper.cli.main import _save_via_uri
 
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = SimpleNamespace(returncode=0)
 
         session = CaptureSession(text="Hello world")
         result = _save_via_uri(session, "MyVault")
@@ -510,7 +503,7 @@ class TestURIFallback:
         """Test URI fallback returns False when xdg-open fails."""
         from obsidian_clipper.cli.main import _save_via_uri
 
-        mock_run.return_value = MagicMock(returncode=1)
+        mock_run.return_value = SimpleNamespace(returncode=1)
 
         session = CaptureSession(text="Hello world")
         result = _save_via_uri(session)
@@ -578,17 +571,14 @@ class TestDailyNoteAndOpen:
         mock_get_config,
         mock_client_class,
         mock_validate,
+        make_client,
     ):
         """Test --daily appends to daily note via periodic API."""
         mock_get_text.return_value = "Daily capture text"
         mock_get_citation.return_value = None
-        mock_config = MagicMock()
-        mock_config.default_note = "Notes.md"
-        mock_get_config.return_value = mock_config
+        mock_get_config.return_value = ConfigStub()
 
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = True
-        mock_client.append_periodic_note.return_value = True
+        mock_client = make_client()
         mock_client_class.return_value.__enter__.return_value = mock_client
 
         with patch("sys.argv", ["clipper", "--daily"]):
@@ -614,17 +604,14 @@ class TestDailyNoteAndOpen:
         mock_get_config,
         mock_client_class,
         mock_validate,
+        make_client,
     ):
         """Test --open opens the created note in Obsidian."""
         mock_get_text.return_value = "Test text"
         mock_get_citation.return_value = None
-        mock_config = MagicMock()
-        mock_config.default_note = "Notes.md"
-        mock_get_config.return_value = mock_config
+        mock_get_config.return_value = ConfigStub()
 
-        mock_client = MagicMock()
-        mock_client.check_connection.return_value = True
-        mock_client.create_note.return_value = True
+        mock_client = make_client()
         mock_client_class.return_value.__enter__.return_value = mock_client
 
         with patch("sys.argv", ["clipper", "--open"]):
@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import patch
+import pytest
 
+import obsidian_clipper.config as config_module
 from obsidian_clipper.config import Config, get_config, set_config
 
+VALID_API_KEY = "abcdef1234567890abcdef1234567890"
+
+
+@pytest.fixture
+def bare_config():
+    """Valid Config built without __post_init__, so nothing is read from env."""
+    config = Config.__new__(Config)
+    config._loaded = False
+    config._headers = {}
+    config.api_key = VALID_API_KEY
+    config.base_url = "https://127.0.0.1:27124"
+    config.default_note = "Notes.md"
+    config.timeout = 10
+    return config
+
 
 class TestConfig:
     """Tests for Config class."""
@@ -24,83 +39,42 @@ class TestConfig:
         assert config.timeout == 10
         assert config.ocr_language == "eng"
 
-    def test_headers_property(self):
+    def test_headers_property(self, bare_config):
         """Test headers are generated correctly."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.api_key = "testapikey1234567890abcdef"
-        config._headers = {}
-
-        headers = config.headers
-        assert headers["Authorization"] == "Bearer testapikey1234567890abcdef"
+        headers = bare_config.headers
+        assert headers["Authorization"] == f"Bearer {VALID_API_KEY}"
 
-    def test_headers_cached(self):
+    def test_headers_cached(self, bare_config):
         """Test headers are cached."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.api_key = "abcdef1234567890abcdef1234567890"
-        config._headers = {}
-
-        headers1 = config.headers
-        headers2 = config.headers
+        headers1 = bare_config.headers
+        headers2 = bare_config.headers
         assert headers1 is headers2
 
-    def test_validate_missing_api_key(self):
-        """Test validation fails without API key."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.api_key = ""
-        config.base_url = "https://127.0.0.1:27124"
-        config.default_note = "Notes.md"
-        config.timeout = 10
-
-        errors = config.validate()
-        assert len(errors) == 1
-        assert "API key" in errors[0]
-
-    def test_validate_missing_base_url(self):
-        """Test validation fails without base URL."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.api_key = "abcdef1234567890abcdef1234567890"
-        config.base_url = ""
-        config.default_note = "Notes.md"
-        config.timeout = 10
-        config.ocr_language = "eng"
-
-        errors = config.validate()
-        assert len(errors) == 1
-        assert "Base URL" in errors[0]
-
-    def test_validate_invalid_timeout(self):
-        """Test validation fails with invalid timeout."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.api_key = "abcdef1234567890abcdef1234567890"
-        config.base_url = "https://127.0.0.1:27124"
-        config.default_note = "Notes.md"
-        config.timeout = 0
+    @pytest.mark.parametrize(
+        ("field", "value", "error"),
+        [
+            ("api_key", "", "API key"),
+            ("base_url", "", "Base URL"),
+            ("timeout", 0, "Timeout"),
+        ],
+    )
+    def test_validate_invalid_field(self, bare_config, field, value, error):
+        """Test validation reports the single invalid field."""
+        setattr(bare_config, field, value)
 
-        errors = config.validate()
+        errors = bare_config.validate()
         assert len(errors) == 1
-        assert "Timeout" in errors[0]
+        assert error in errors[0]
 
-    def test_validate_valid(self):
+    def test_validate_valid(self, bare_config):
         """Test validation passes with valid config."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.api_key = "abcdef1234567890abcdef1234567890"
-        config.base_url = "https://127.0.0.1:27124"
-        config.default_note = "Notes.md"
-        config.timeout = 10
-
-        errors = config.validate()
+        errors = bare_config.validate()
         assert len(errors) == 0
-        assert config.is_valid()
+        assert bare_config.is_valid()
 
-    @patch.dict(os.environ, {"OBSIDIAN_API_KEY": "env-key"})
-    def test_load_from_environment(self):
+    def test_load_from_environment(self, monkeypatch):
         """Test loading API key from environment."""
+        monkeypatch.setenv("OBSIDIAN_API_KEY", "env-key")
         config = Config.__new__(Config)
         config.api_key = ""
         config._loaded = False
@@ -109,18 +83,16 @@ class TestConfig:
 
         assert config.api_key == "env-key"
 
-    @patch.dict(
-        os.environ,
-        {
+    def test_load_all_from_environment(self, monkeypatch):
+        """Test loading all config from environment."""
+        for key, value in {
             "OBSIDIAN_API_KEY": "key",
             "OBSIDIAN_BASE_URL": "http://127.0.0.1:27124",
             "OBSIDIAN_DEFAULT_NOTE": "Custom/Note.md",
             "OBSIDIAN_VERIFY_SSL": "true",
             "OBSIDIAN_TIMEOUT": "30",
-        },
-    )
-    def test_load_all_from_environment(self):
-        """Test loading all config from environment."""
+        }.items():
+            monkeypatch.setenv(key, value)
         config = Config.__new__(Config)
         config._loaded = False
         config.load()
@@ -131,18 +103,10 @@ class TestConfig:
         assert config.verify_ssl is True
         assert config.timeout == 30
 
-    @patch.dict(os.environ, {"OBSIDIAN_OCR_LANGUAGE": "eng, tam"})
-    def test_load_ocr_language_comma_separated(self):
-        """Test OCR language normalization from comma-separated env value."""
-        config = Config.__new__(Config)
-        config._loaded = False
-        config.load()
-
-        assert config.ocr_language == "eng+tam"
-
-    @patch.dict(os.environ, {"OBSIDIAN_OCR_LANGUAGE": "eng tam"})
-    def test_load_ocr_language_space_separated(self):
-        """Test OCR language normalization from space-separated env value."""
+    @pytest.mark.parametrize("raw", ["eng, tam", "eng tam"])
+    def test_load_ocr_language_normalized(self, monkeypatch, raw):
+        """Test OCR language normalization from comma/space-separated values."""
+        monkeypatch.setenv("OBSIDIAN_OCR_LANGUAGE", raw)
         config = Config.__new__(Config)
         config._loaded = False
         config.load()
@@ -153,13 +117,13 @@ class TestConfig:
 class TestGlobalConfig:
     """Tests for global config functions."""
 
+    @pytest.fixture(autouse=True)
+    def skip_dotenv(self, monkeypatch):
+        """Read configuration from the environment only, not .env files."""
+        monkeypatch.setattr(config_module, "load_dotenv", None)
+
     def test_get_config_singleton(self):
         """Test get_config returns same instance."""
-        # Reset global config
-        import obsidian_clipper.config as config_module
-
-        config_module._config = None
-
         config1 = get_config()
         config2 = get_config()
 
@@ -167,10 +131,6 @@ class TestGlobalConfig:
 
     def test_get_config_reload(self):
         """Test get_config with reload creates new instance."""
-        import obsidian_clipper.config as config_module
-
-        config_module._config = None
-
         config1 = get_config()
         config2 = get_config(reload=True)
 
@@ -178,10 +138,6 @@ class TestGlobalConfig:
 
     def test_set_config(self):
         """Test set_config updates global config."""
-        import obsidian_clipper.config as config_module
-
-        config_module._config = None
-
         custom_config = Config.__new__(Config)
         custom_config.api_key = "aabbccdd11223344"
         custom_config._loaded = False
@@ -33,6 +33,8 @@ class TestSetupLogging:
             assert log_file.parent.exists()
             assert len(logger.handlers) >= 2
         finally:
+            for handler in logger.handlers:
+                handler.close()
             logger.handlers = old_handlers
 
     def test_clears_existing_handlers(self):
@@ -211,6 +211,12 @@ class TestTemplatePlaceholders:
         md = session.to_markdown()
         assert "At: 2024-01-15 10:30:00" in md
 
+    def test_placeholder_syntax_in_values_is_not_expanded(self):
+        session = CaptureSession(text="literal {{ocr}}", ocr_text="OCR")
+        session.template = "{{text}} / {{ocr}} / {{unknown}}"
+        md = session.to_markdown()
+        assert "literal {{ocr}} / OCR / {{unknown}}" in md
+
 
 class TestTemplateConditionals:
     """Tests for {{#unless}} and {{#each}} template features."""
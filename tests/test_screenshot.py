@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
+import io
+import os
 import subprocess
+import sys
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+import obsidian_clipper.capture.screenshot as screenshot_module
 from obsidian_clipper.capture.screenshot import (
     ScreenshotCapture,
     _capture_with_flameshot,
     _capture_with_flameshot_raw,
     _capture_with_grim,
+    _preprocess_for_ocr,
     _save_clipboard_image,
+    _SelectionCancelledError,
+    _tesseract_api,
     _wait_for_file,
     create_temp_screenshot,
     ocr_image,
@@ -22,16 +33,34 @@ from obsidian_clipper.capture.screenshot import (
 from obsidian_clipper.exceptions import OCRError, ScreenshotError
 from obsidian_clipper.utils.command import CommandError
 
+# Patch target for the helper that spawns every screenshot tool
+RUN_COMMAND_TARGET = "obsidian_clipper.capture.screenshot.run_command_safely"
 
+
+def _stub(monkeypatch, name, result):
+    """Replace a screenshot module function and record its positional args.
+
+    ``result`` is returned from every call, or raised if it is an exception.
+    """
+    calls = []
+
+    def fake(*args, **kwargs):
+        calls.append(args)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    monkeypatch.setattr(screenshot_module, name, fake)
+    return calls
+
+
+@pytest.mark.timing
 class TestWaitForFile:
     """Tests for _wait_for_file function."""
 
-    def test_wait_for_file_exists_immediately(self, tmp_path):
+    def test_wait_for_file_exists_immediately(self, img_file):
         """Test returns True when file exists immediately."""
-        test_file = tmp_path / "test.png"
-        test_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-
-        result = _wait_for_file(test_file, timeout=1.0)
+        result = _wait_for_file(img_file, timeout=1.0)
 
         assert result is True
 
@@ -52,7 +81,7 @@ class TestWaitForFile:
 
         assert result is False
 
-    def test_wait_for_file_appears_later(self, tmp_path):
+    def test_wait_for_file_appears_later(self, tmp_path, png_bytes):
         """Test waits for file to appear."""
         import threading
         import time
@@ -61,7 +90,7 @@ class TestWaitForFile:
 
         def create_file_later():
             time.sleep(0.1)
-            test_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+            test_file.write_bytes(png_bytes)
 
         thread = threading.Thread(target=create_file_later)
         thread.start()
@@ -71,127 +100,262 @@ class TestWaitForFile:
 
         assert result is True
 
-    def test_wait_for_file_with_string_path(self, tmp_path):
+    def test_wait_for_file_with_string_path(self, img_file):
         """Test works with string path."""
-        test_file = tmp_path / "test.png"
-        test_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-
-        result = _wait_for_file(str(test_file), timeout=1.0)
+        result = _wait_for_file(str(img_file), timeout=1.0)
 
         assert result is True
 
+    def test_wait_for_file_moved_into_place(self, tmp_path, png_bytes):
+        """Test wakes when the file is renamed into place."""
+        import threading
 
-class TestTakeScreenshot:
-    """Tests for take_screenshot function."""
+        staging = tmp_path / "staging.tmp"
+        test_file = tmp_path / "moved.png"
 
-    @patch("obsidian_clipper.capture.screenshot.Path.exists")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot")
-    def test_take_screenshot_auto_uses_flameshot_first(
-        self, mock_flameshot, mock_exists
-    ):
-        """Test auto mode tries flameshot first."""
-        mock_flameshot.return_value = True
-        mock_exists.return_value = True
+        def move_file_later():
+            staging.write_bytes(png_bytes)
+            staging.rename(test_file)
 
-        result = take_screenshot("/tmp/test.png", tool="auto")
+        timer = threading.Timer(0.05, move_file_later)
+        timer.start()
+
+        result = _wait_for_file(test_file, timeout=1.0)
+        timer.join()
 
         assert result is True
-        mock_flameshot.assert_called_once_with("/tmp/test.png")
 
-    @patch("obsidian_clipper.capture.screenshot.Path.exists")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_grim")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot")
-    def test_take_screenshot_auto_falls_back_to_grim(
-        self, mock_flameshot, mock_grim, mock_exists
-    ):
-        """Test auto mode falls back to grim if flameshot fails."""
-        mock_flameshot.return_value = False
-        mock_grim.return_value = True
-        mock_exists.return_value = True
+    def test_wait_for_file_polls_without_inotify(self, monkeypatch, tmp_path):
+        """Test falls back to polling when no inotify watch can be set up."""
+        monkeypatch.setattr(screenshot_module, "_inotify_watch", lambda _: None)
+        polls = _stub(monkeypatch, "_poll_for_file", True)
+        test_file = tmp_path / "test.png"
 
-        result = take_screenshot("/tmp/test.png", tool="auto")
+        assert _wait_for_file(test_file, timeout=1.0) is True
+        assert polls == [(test_file, 1.0)]
 
-        assert result is True
-        mock_flameshot.assert_called_once()
-        mock_grim.assert_called_once()
+    def test_wait_for_file_missing_directory(self, tmp_path):
+        """Test a missing parent directory falls back to polling."""
+        result = _wait_for_file(tmp_path / "missing" / "test.png", timeout=0.1)
 
-    @patch("obsidian_clipper.capture.screenshot._capture_with_grim")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot")
-    def test_take_screenshot_auto_all_fail_raises_error(
-        self, mock_flameshot, mock_grim
-    ):
-        """Test auto mode raises error when all tools fail."""
-        mock_flameshot.return_value = False
-        mock_grim.return_value = False
-
-        with pytest.raises(ScreenshotError, match="No compatible screenshot tool"):
-            take_screenshot("/tmp/test.png", tool="auto")
-
-    @patch("obsidian_clipper.capture.screenshot.Path.exists")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot")
-    def test_take_screenshot_flameshot_mode(self, mock_flameshot, mock_exists):
-        """Test explicit flameshot mode."""
-        mock_flameshot.return_value = True
-        mock_exists.return_value = True
+        assert result is False
 
-        result = take_screenshot("/tmp/test.png", tool="flameshot")
 
-        assert result is True
+class TestPollForFile:
+    """Tests for _poll_for_file, run on a fake clock."""
+
+    @pytest.mark.parametrize(
+        ("content", "appears_at", "timeout", "expected"),
+        [
+            (b"png", 0.0, 1.0, True),
+            (None, None, 1.0, False),
+            (b"", 0.0, 1.0, False),
+            (b"png", 0.3, 1.0, True),
+            (b"png", 1.5, 1.0, False),
+        ],
+        ids=["present", "never", "empty", "appears-in-time", "appears-too-late"],
+    )
+    def test_poll_for_file(
+        self, tmp_path, fake_clock, content, appears_at, timeout, expected
+    ):
+        test_file = tmp_path / "test.png"
 
-    @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot")
-    def test_take_screenshot_flameshot_fails_raises_error(self, mock_flameshot):
-        """Test flameshot failure raises appropriate error."""
-        mock_flameshot.return_value = False
+        def sleep(seconds):
+            fake_clock.sleep(seconds)
+            if appears_at is not None and fake_clock.now >= appears_at:
+                test_file.write_bytes(content)
 
-        with pytest.raises(ScreenshotError, match="Flameshot capture failed"):
-            take_screenshot("/tmp/test.png", tool="flameshot")
+        if appears_at == 0.0:
+            test_file.write_bytes(content)
 
-    @patch("obsidian_clipper.capture.screenshot.Path.exists")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_grim")
-    def test_take_screenshot_grim_mode(self, mock_grim, mock_exists):
-        """Test explicit grim mode."""
-        mock_grim.return_value = True
-        mock_exists.return_value = True
+        result = screenshot_module._poll_for_file(
+            test_file, timeout, clock=fake_clock.monotonic, sleep=sleep
+        )
 
-        result = take_screenshot("/tmp/test.png", tool="grim")
+        assert result is expected
+        assert fake_clock.now <= timeout
 
-        assert result is True
+    def test_poll_for_file_single_stat_per_poll(
+        self, monkeypatch, tmp_path, fake_clock
+    ):
+        """Test each poll costs one stat and the wait follows the given clock."""
+        stats = []
+        real_stat = os.stat
+        test_file = tmp_path / "never.png"
+
+        def counting_stat(path, *args, **kwargs):
+            if Path(path) == test_file:
+                stats.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(screenshot_module.os, "stat", counting_stat)
+
+        assert (
+            screenshot_module._poll_for_file(
+                test_file, 1.0, clock=fake_clock.monotonic, sleep=fake_clock.sleep
+            )
+            is False
+        )
+
+        assert len(stats) == len(fake_clock.sleeps) + 1
+        assert sum(fake_clock.sleeps) == pytest.approx(1.0)
+
+    def test_poll_for_file_backs_off(self, tmp_path, fake_clock):
+        """Test poll intervals grow by half each time up to 500ms."""
+        screenshot_module._poll_for_file(
+            tmp_path / "never.png",
+            2.0,
+            clock=fake_clock.monotonic,
+            sleep=fake_clock.sleep,
+        )
+
+        assert fake_clock.sleeps[:3] == pytest.approx([0.05, 0.075, 0.1125])
+        assert max(fake_clock.sleeps) == 0.5
+
+
+# (tool, display server, capture helper results, expected error). Helpers not
+# listed return False and must not be called.
+TAKE_SCREENSHOT_CASES = [
+    pytest.param(
+        "auto", "x11", {"_capture_with_flameshot": True}, None, id="auto_flameshot"
+    ),
+    pytest.param(
+        "auto",
+        "x11",
+        {"_capture_with_flameshot": False, "_capture_with_grim": True},
+        None,
+        id="auto_falls_back_to_grim",
+    ),
+    pytest.param(
+        "auto",
+        "wayland",
+        {"_capture_with_grim": True},
+        None,
+        id="auto_wayland_grim",
+    ),
+    pytest.param(
+        "auto",
+        "x11",
+        {
+            "_capture_with_flameshot": False,
+            "_capture_with_grim": False,
+            "_capture_with_scrot": False,
+        },
+        "No compatible screenshot tool",
+        id="auto_all_fail",
+    ),
+    pytest.param(
+        "flameshot", "x11", {"_capture_with_flameshot": True}, None, id="flameshot"
+    ),
+    pytest.param(
+        "flameshot",
+        "x11",
+        {"_capture_with_flameshot": False},
+        "Flameshot capture failed",
+        id="flameshot_fails",
+    ),
+    pytest.param("grim", "x11", {"_capture_with_grim": True}, None, id="grim"),
+    pytest.param(
+        "grim",
+        "x11",
+        {"_capture_with_grim": False},
+        "grim/slurp capture failed",
+        id="grim_fails",
+    ),
+    pytest.param("unknown", "x11", {}, "Unknown screenshot tool", id="unknown_tool"),
+]
+
+CAPTURE_HELPERS = (
+    "_capture_with_flameshot",
+    "_capture_with_grim",
+    "_capture_with_scrot",
+)
 
-    @patch("obsidian_clipper.capture.screenshot._capture_with_grim")
-    def test_take_screenshot_grim_fails_raises_error(self, mock_grim):
-        """Test grim failure raises appropriate error."""
-        mock_grim.return_value = False
 
-        with pytest.raises(ScreenshotError, match="grim/slurp capture failed"):
-            take_screenshot("/tmp/test.png", tool="grim")
+class TestTakeScreenshot:
+    """Tests for take_screenshot function."""
 
-    def test_take_screenshot_unknown_tool_raises_error(self):
-        """Test unknown tool raises error."""
-        with pytest.raises(ScreenshotError, match="Unknown screenshot tool"):
-            take_screenshot("/tmp/test.png", tool="unknown")
+    @pytest.fixture(autouse=True)
+    def all_tools_installed(self, monkeypatch):
+        monkeypatch.setattr(
+            screenshot_module, "find_executable", lambda name: f"/usr/bin/{name}"
+        )
+
+    @pytest.mark.parametrize(
+        ("tool", "display", "results", "error"), TAKE_SCREENSHOT_CASES
+    )
+    def test_take_screenshot(self, monkeypatch, tool, display, results, error):
+        monkeypatch.setattr(
+            screenshot_module, "_detect_display_server", lambda: display
+        )
+        calls = {
+            name: _stub(monkeypatch, name, results.get(name, False))
+            for name in CAPTURE_HELPERS
+        }
+
+        if error is None:
+            assert take_screenshot("/tmp/test.png", tool=tool) is True
+        else:
+            with pytest.raises(ScreenshotError, match=error):
+                take_screenshot("/tmp/test.png", tool=tool)
+
+        for name, helper_calls in calls.items():
+            expected = [("/tmp/test.png",)] if name in results else []
+            assert helper_calls == expected, name
+
+    @pytest.mark.parametrize("tool", ["auto", "grim"])
+    def test_cancelled_selection_stops_fallback(self, monkeypatch, tool):
+        """Test a dismissed selection is not followed by another tool's prompt."""
+        monkeypatch.setattr(
+            screenshot_module, "_detect_display_server", lambda: "wayland"
+        )
+        _stub(monkeypatch, "_capture_with_grim", _SelectionCancelledError("slurp"))
+        flameshot_calls = _stub(monkeypatch, "_capture_with_flameshot", True)
+
+        with pytest.raises(ScreenshotError, match="Screenshot cancelled"):
+            take_screenshot("/tmp/test.png", tool=tool)
+
+        assert flameshot_calls == []
+
+    @pytest.mark.parametrize(
+        ("missing", "used"),
+        [
+            ({"flameshot"}, "_capture_with_grim"),
+            ({"flameshot", "slurp"}, "_capture_with_scrot"),
+        ],
+        ids=["no_flameshot", "no_flameshot_no_slurp"],
+    )
+    def test_auto_skips_missing_tools(self, monkeypatch, missing, used):
+        """Test auto mode never calls a helper whose programs are missing."""
+        monkeypatch.setattr(screenshot_module, "_detect_display_server", lambda: "x11")
+        monkeypatch.setattr(
+            screenshot_module,
+            "find_executable",
+            lambda name: None if name in missing else f"/usr/bin/{name}",
+        )
+        calls = {name: _stub(monkeypatch, name, True) for name in CAPTURE_HELPERS}
+
+        assert take_screenshot("/tmp/test.png", tool="auto") is True
+
+        assert {name for name, helper_calls in calls.items() if helper_calls} == {used}
 
 
 class TestCaptureWithFlameshot:
     """Tests for _capture_with_flameshot function."""
 
-    @patch("obsidian_clipper.capture.screenshot._save_clipboard_image")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
-    @patch("obsidian_clipper.capture.screenshot.os.path.getsize")
-    @patch("obsidian_clipper.capture.screenshot.os.path.exists")
-    @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot_raw")
-    def test_flameshot_uses_raw_capture_first(
-        self, mock_raw, mock_exists, mock_size, mock_run, mock_clipboard
-    ):
+    @patch(
+        "obsidian_clipper.capture.screenshot._capture_with_flameshot_raw",
+        return_value=True,
+    )
+    def test_flameshot_uses_raw_capture_first(self, mock_raw):
         """Test flameshot tries raw capture first."""
-        mock_raw.return_value = True
-
         result = _capture_with_flameshot("/tmp/test.png")
 
         assert result is True
         mock_raw.assert_called_once_with("/tmp/test.png")
 
     @patch("obsidian_clipper.capture.screenshot._wait_for_file")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
+    @patch(RUN_COMMAND_TARGET)
     @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot_raw")
     def test_flameshot_gui_mode_success(self, mock_raw, mock_run, mock_wait):
         """Test flameshot GUI mode when raw capture fails."""
@@ -203,9 +367,12 @@ class TestCaptureWithFlameshot:
         assert result is True
         mock_run.assert_called_once()
 
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
+    @patch("obsidian_clipper.capture.screenshot._wait_for_file", return_value=True)
+    @patch(RUN_COMMAND_TARGET)
     @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot_raw")
-    def test_flameshot_fallback_on_accept_on_select_error(self, mock_raw, mock_run):
+    def test_flameshot_fallback_on_accept_on_select_error(
+        self, mock_raw, mock_run, _mock_wait
+    ):
         """Test flameshot falls back when --accept-on-select fails."""
         mock_raw.return_value = False
         # First call fails, second call succeeds
@@ -217,7 +384,7 @@ class TestCaptureWithFlameshot:
 
     @patch("obsidian_clipper.capture.screenshot._save_clipboard_image")
     @patch("obsidian_clipper.capture.screenshot._wait_for_file")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
+    @patch(RUN_COMMAND_TARGET)
     @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot_raw")
     def test_flameshot_uses_clipboard_fallback(
         self, mock_raw, mock_run, mock_wait, mock_clipboard
@@ -232,7 +399,7 @@ class TestCaptureWithFlameshot:
         assert result is True
         mock_clipboard.assert_called_once_with("/tmp/test.png")
 
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
+    @patch(RUN_COMMAND_TARGET)
     @patch("obsidian_clipper.capture.screenshot._capture_with_flameshot_raw")
     def test_flameshot_all_methods_fail(self, mock_raw, mock_run):
         """Test flameshot returns False when all methods fail."""
@@ -244,76 +411,182 @@ class TestCaptureWithFlameshot:
         assert result is False
 
 
+class FakeFlameshot:
+    """Stand-in for the flameshot Popen, writing *stdout* into a real pipe.
+
+    *stdout* is written from a thread, so payloads larger than the pipe
+    buffer only complete if the reader keeps draining. With ``hang=True``
+    the write end stays open, as if flameshot were still waiting for the
+    user to select an area.
+    """
+
+    def __init__(self, stdout=b"", returncode=0, hang=False):
+        read_fd, self._write_fd = os.pipe()
+        self._writer = threading.Thread(target=self._write, args=(stdout, hang))
+        self._writer.start()
+        self.stdout = os.fdopen(read_fd, "rb")
+        self.returncode = None
+        self._exit_code = returncode
+        self.killed = False
+
+    def _write(self, stdout, hang):
+        with contextlib.suppress(BrokenPipeError):
+            os.write(self._write_fd, stdout)
+        if not hang:
+            os.close(self._write_fd)
+            self._write_fd = None
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stdout.close()
+        self._writer.join()
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self.returncode = self._exit_code
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+
+
 class TestCaptureWithFlameshotRaw:
     """Tests for _capture_with_flameshot_raw function."""
 
-    @patch("obsidian_clipper.capture.screenshot.os.path.getsize")
-    @patch("obsidian_clipper.capture.screenshot.os.path.exists")
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_raw_capture_success(self, mock_run, mock_exists, mock_getsize, tmp_path):
-        """Test successful raw capture."""
-        png_data = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = png_data
-        mock_run.return_value = mock_result
-        mock_exists.return_value = True
-        mock_getsize.return_value = len(png_data)
+    def _use(self, monkeypatch, process):
+        monkeypatch.setattr(screenshot_module.subprocess, "Popen", process)
+        return process
 
+    def test_raw_capture_success(self, monkeypatch, tmp_path, png_bytes):
+        """Test successful raw capture streams stdout to the file."""
+        self._use(monkeypatch, FakeFlameshot(png_bytes))
         output_file = tmp_path / "test.png"
+
         result = _capture_with_flameshot_raw(str(output_file))
 
         assert result is True
+        assert output_file.read_bytes() == png_bytes
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_raw_capture_nonzero_returncode(self, mock_run):
-        """Test raw capture with non-zero return code."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = b""
-        mock_run.return_value = mock_result
+    def test_raw_capture_drains_large_pipe(self, monkeypatch, tmp_path, png_bytes):
+        """Test a capture far larger than the pipe buffer is copied whole."""
+        payload = png_bytes + os.urandom(16 * 1024 * 1024)
+        self._use(monkeypatch, FakeFlameshot(payload))
+        output_file = tmp_path / "test.png"
 
-        result = _capture_with_flameshot_raw("/tmp/test.png")
+        result = _capture_with_flameshot_raw(str(output_file))
+
+        assert result is True
+        assert output_file.read_bytes() == payload
+
+    @pytest.mark.skipif(not hasattr(os, "splice"), reason="splice is Linux-only")
+    def test_raw_capture_uses_splice_when_available(
+        self, monkeypatch, tmp_path, png_bytes
+    ):
+        """Test the body is spliced into the file from an enlarged pipe."""
+        real_splice = os.splice
+        pipe_sizes = []
+        splices = []
+
+        def recording_splice(src, dst, count, *args, **kwargs):
+            pipe_sizes.append(fcntl.fcntl(src, fcntl.F_GETPIPE_SZ))
+            splices.append(count)
+            return real_splice(src, dst, count, *args, **kwargs)
+
+        monkeypatch.setattr(screenshot_module.os, "splice", recording_splice)
+        self._use(monkeypatch, FakeFlameshot(png_bytes))
+        output_file = tmp_path / "test.png"
+
+        result = _capture_with_flameshot_raw(str(output_file))
+
+        assert result is True
+        assert output_file.read_bytes() == png_bytes
+        assert splices
+        assert pipe_sizes[0] == screenshot_module._RAW_PIPE_SIZE
+
+    def test_raw_capture_without_splice(self, monkeypatch, tmp_path, png_bytes):
+        """Test raw capture falls back to read/write where splice is missing."""
+        monkeypatch.delattr(screenshot_module.os, "splice", raising=False)
+        monkeypatch.setattr(screenshot_module, "_RAW_CHUNK_SIZE", 16)
+        self._use(monkeypatch, FakeFlameshot(png_bytes))
+        output_file = tmp_path / "test.png"
+
+        result = _capture_with_flameshot_raw(str(output_file))
+
+        assert result is True
+        assert output_file.read_bytes() == png_bytes
+
+    def test_raw_capture_nonzero_returncode(self, monkeypatch, tmp_path, png_bytes):
+        """Test raw capture with non-zero return code removes the output."""
+        self._use(monkeypatch, FakeFlameshot(png_bytes, returncode=1))
+        output_file = tmp_path / "test.png"
+
+        result = _capture_with_flameshot_raw(str(output_file))
 
         assert result is False
+        assert not output_file.exists()
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_raw_capture_empty_stdout(self, mock_run):
+    def test_raw_capture_empty_stdout(self, monkeypatch, tmp_path):
         """Test raw capture with empty stdout."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = b""
-        mock_run.return_value = mock_result
+        self._use(monkeypatch, FakeFlameshot(b""))
+        output_file = tmp_path / "test.png"
 
-        result = _capture_with_flameshot_raw("/tmp/test.png")
+        result = _capture_with_flameshot_raw(str(output_file))
 
         assert result is False
+        assert not output_file.exists()
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_raw_capture_invalid_png_header(self, mock_run):
-        """Test raw capture rejects non-PNG data."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = b"NOT A PNG FILE"
-        mock_run.return_value = mock_result
+    def test_raw_capture_invalid_png_header(self, monkeypatch, tmp_path):
+        """Test raw capture rejects non-PNG data and stops flameshot."""
+        process = self._use(monkeypatch, FakeFlameshot(b"NOT A PNG FILE", hang=True))
+        output_file = tmp_path / "test.png"
 
-        result = _capture_with_flameshot_raw("/tmp/test.png")
+        result = _capture_with_flameshot_raw(str(output_file))
+
+        assert result is False
+        assert process.killed
+        assert not output_file.exists()
+
+    @pytest.mark.parametrize(
+        "stdout",
+        [b"\x89PNG\r\n\x1a\x00" + b"\x00" * 100, b"\xff\xd8\xff\xe0" + b"\x00" * 100],
+        ids=["last-byte-differs", "jpeg"],
+    )
+    def test_raw_capture_rejects_near_miss_header(self, monkeypatch, tmp_path, stdout):
+        """Test only an exact PNG signature is accepted from flameshot."""
+        self._use(monkeypatch, FakeFlameshot(stdout))
+        output_file = tmp_path / "test.png"
+
+        result = _capture_with_flameshot_raw(str(output_file))
 
         assert result is False
+        assert not output_file.exists()
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_raw_capture_timeout(self, mock_run):
-        """Test raw capture handles timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired("flameshot", 60)
+    def test_raw_capture_timeout(self, monkeypatch, tmp_path, png_bytes):
+        """Test raw capture gives up and cleans up when flameshot stalls."""
+        monkeypatch.setattr(screenshot_module, "_RAW_CAPTURE_TIMEOUT", 0.05)
+        process = self._use(monkeypatch, FakeFlameshot(png_bytes, hang=True))
+        output_file = tmp_path / "test.png"
 
-        result = _capture_with_flameshot_raw("/tmp/test.png")
+        result = _capture_with_flameshot_raw(str(output_file))
 
         assert result is False
+        assert process.killed
+        assert not output_file.exists()
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_raw_capture_os_error(self, mock_run):
+    @patch("obsidian_clipper.capture.screenshot.subprocess.Popen")
+    def test_raw_capture_os_error(self, mock_popen):
         """Test raw capture handles OS errors."""
-        mock_run.side_effect = OSError("Command not found")
+        mock_popen.side_effect = OSError("Command not found")
 
         result = _capture_with_flameshot_raw("/tmp/test.png")
 
@@ -323,201 +596,365 @@ class TestCaptureWithFlameshotRaw:
 class TestSaveClipboardImage:
     """Tests for _save_clipboard_image function."""
 
-    @patch("obsidian_clipper.capture.screenshot.os.path.getsize")
-    @patch("obsidian_clipper.capture.screenshot.os.path.exists")
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_save_clipboard_success(self, mock_run, mock_exists, mock_getsize):
+    def test_save_clipboard_success(self, fake_subprocess, tmp_path, png_bytes):
         """Test successful clipboard save."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-        mock_exists.return_value = True
-        mock_getsize.return_value = 100
+        fake_subprocess.register("xclip", stdout=png_bytes)
+        output_file = tmp_path / "test.png"
 
-        result = _save_clipboard_image("/tmp/test.png")
+        result = _save_clipboard_image(str(output_file))
 
         assert result is True
+        assert output_file.read_bytes() == png_bytes
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_save_clipboard_nonzero_returncode(self, mock_run):
-        """Test clipboard save with non-zero return code."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_run.return_value = mock_result
+    def test_save_clipboard_nonzero_returncode(self, fake_subprocess, tmp_path):
+        """Test clipboard save with non-zero return code removes the file."""
+        fake_subprocess.register("xclip", returncode=1, stdout=b"")
+        output_file = tmp_path / "test.png"
 
-        with patch(
-            "obsidian_clipper.capture.screenshot.os.path.exists", return_value=False
-        ):
-            result = _save_clipboard_image("/tmp/test.png")
+        result = _save_clipboard_image(str(output_file))
 
         assert result is False
+        assert not output_file.exists()
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_save_clipboard_timeout(self, mock_run):
+    def test_save_clipboard_timeout(self, fake_subprocess, tmp_path):
         """Test clipboard save handles timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired("xclip", 5)
+        fake_subprocess.register("xclip", raises=subprocess.TimeoutExpired("xclip", 5))
 
-        result = _save_clipboard_image("/tmp/test.png")
+        result = _save_clipboard_image(str(tmp_path / "test.png"))
 
         assert result is False
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_save_clipboard_os_error(self, mock_run):
-        """Test clipboard save handles OS errors."""
-        mock_run.side_effect = OSError("Command not found")
-
-        result = _save_clipboard_image("/tmp/test.png")
+    def test_save_clipboard_os_error(self, fake_subprocess, tmp_path):
+        """Test clipboard save handles a missing xclip."""
+        result = _save_clipboard_image(str(tmp_path / "test.png"))
 
         assert result is False
 
 
+class FakeTool:
+    """Popen stand-in for one end of the ``slurp | grim -g -`` pipeline.
+
+    Writes *stdout* into the pipe it is given and, on ``wait``, reads its
+    stdin pipe to EOF into ``stdin_data``. With ``hang=True`` it never
+    finishes, as if the user were still selecting an area.
+    """
+
+    def __init__(self, returncode=0, stdout=b"", stderr="", hang=False):
+        self._exit_code = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+        self._hang = hang
+        self._stdin = None
+        self.args = None
+        self.returncode = None
+        self.stdin_data = None
+        self.killed = False
+
+    def spawn(self, args, stdin=None, stdout=None, **kwargs):
+        self.args = args
+        # Descriptors are non-negative; PIPE and DEVNULL are negative markers
+        if isinstance(stdout, int) and stdout >= 0:
+            os.write(stdout, self._stdout)
+        if isinstance(stdin, int) and stdin >= 0:
+            # Popen hands the child its own copy of the descriptor
+            self._stdin = os.dup(stdin)
+        return self
+
+    def _finish(self, timeout):
+        if self._stdin is not None:
+            with os.fdopen(self._stdin, "rb") as stdin:
+                self.stdin_data = stdin.read()
+            self._stdin = None
+        if self._hang:
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        self.returncode = self._exit_code
+
+    def communicate(self, timeout=None):
+        self._finish(timeout)
+        return None, self._stderr
+
+    def wait(self, timeout=None):
+        if self.returncode is None:
+            self._finish(timeout)
+        return self.returncode
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+        if self._stdin is not None:
+            os.close(self._stdin)
+            self._stdin = None
+
+
 class TestCaptureWithGrim:
     """Tests for _capture_with_grim function."""
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    @patch("obsidian_clipper.capture.screenshot.os.path.exists")
-    def test_grim_success(self, mock_exists, mock_run):
-        """Test successful grim capture."""
-        mock_slurp = MagicMock()
-        mock_slurp.returncode = 0
-        mock_slurp.stdout = "100,100 200x200"
+    def _use(self, monkeypatch, **tools):
+        def popen(args, **kwargs):
+            if args[0] not in tools:
+                raise FileNotFoundError(args[0])
+            return tools[args[0]].spawn(args, **kwargs)
 
-        mock_grim = MagicMock()
-        mock_grim.returncode = 0
+        monkeypatch.setattr(screenshot_module.subprocess, "Popen", popen)
 
-        mock_run.side_effect = [mock_slurp, mock_grim]
-        mock_exists.return_value = True
+    def test_grim_success(self, monkeypatch):
+        """Test slurp's selection is piped into grim."""
+        grim = FakeTool()
+        self._use(monkeypatch, slurp=FakeTool(stdout=b"100,100 200x200\n"), grim=grim)
+        monkeypatch.setattr(screenshot_module, "_file_has_content", lambda path: True)
 
         result = _capture_with_grim("/tmp/test.png")
 
         assert result is True
+        assert grim.args == ["grim", "-g", "-", "/tmp/test.png"]
+        assert grim.stdin_data == b"100,100 200x200\n"
+
+    def test_grim_slurp_cancelled(self, monkeypatch):
+        """Test grim reports a dismissed slurp selection as a cancellation."""
+        self._use(
+            monkeypatch,
+            slurp=FakeTool(returncode=1, stderr="selection cancelled\n"),
+            grim=FakeTool(returncode=1),
+        )
+
+        with pytest.raises(_SelectionCancelledError):
+            _capture_with_grim("/tmp/test.png")
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_grim_slurp_cancelled(self, mock_run):
-        """Test grim when user cancels slurp selection."""
-        mock_slurp = MagicMock()
-        mock_slurp.returncode = 1
-        mock_slurp.stdout = ""
-        mock_run.return_value = mock_slurp
+    def test_grim_cancelled_when_geom_empty(self, monkeypatch):
+        """Test an empty selection fails rather than capturing the screen."""
+        grim = FakeTool(returncode=1)
+        self._use(monkeypatch, slurp=FakeTool(), grim=grim)
 
         result = _capture_with_grim("/tmp/test.png")
 
         assert result is False
+        assert grim.stdin_data == b""
+
+    def test_grim_slurp_unsupported(self, monkeypatch):
+        """Test grim returns False when slurp fails for another reason."""
+        self._use(
+            monkeypatch,
+            slurp=FakeTool(
+                returncode=1,
+                stderr="compositor doesn't support wlr-layer-shell-unstable-v1\n",
+            ),
+            grim=FakeTool(returncode=1),
+        )
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_grim_timeout(self, mock_run):
-        """Test grim handles timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired("slurp", 60)
+        result = _capture_with_grim("/tmp/test.png")
+
+        assert result is False
+
+    def test_grim_timeout(self, monkeypatch):
+        """Test grim stops both tools when the selection times out."""
+        slurp = FakeTool(hang=True)
+        grim = FakeTool()
+        self._use(monkeypatch, slurp=slurp, grim=grim)
 
         result = _capture_with_grim("/tmp/test.png")
 
         assert result is False
+        assert slurp.killed
+        assert grim.killed
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    def test_grim_file_not_found(self, mock_run):
+    def test_grim_file_not_found(self, monkeypatch):
         """Test grim handles command not found."""
-        mock_run.side_effect = FileNotFoundError("slurp not found")
+        self._use(monkeypatch)
 
         result = _capture_with_grim("/tmp/test.png")
 
         assert result is False
 
-    @patch("obsidian_clipper.capture.screenshot.subprocess.run")
-    @patch("obsidian_clipper.capture.screenshot.os.path.exists")
-    def test_grim_fails_nonzero_returncode(self, mock_exists, mock_run):
-        """Test grim returns False on non-zero grim returncode."""
-        mock_slurp = MagicMock()
-        mock_slurp.returncode = 0
-        mock_slurp.stdout = "100,100 200x200"
+    def test_grim_missing_stops_slurp(self, monkeypatch):
+        """Test slurp is not left running when grim fails to start."""
+        slurp = FakeTool(hang=True)
+        self._use(monkeypatch, slurp=slurp)
 
-        mock_grim = MagicMock()
-        mock_grim.returncode = 1
+        result = _capture_with_grim("/tmp/test.png")
+
+        assert result is False
+        assert slurp.killed
 
-        mock_run.side_effect = [mock_slurp, mock_grim]
-        mock_exists.return_value = False
+    def test_grim_fails_nonzero_returncode(self, monkeypatch):
+        """Test grim returns False on non-zero grim returncode."""
+        self._use(
+            monkeypatch,
+            slurp=FakeTool(stdout=b"100,100 200x200\n"),
+            grim=FakeTool(returncode=1),
+        )
+        monkeypatch.setattr(screenshot_module, "_file_has_content", lambda path: False)
 
         result = _capture_with_grim("/tmp/test.png")
 
         assert result is False
 
 
+class TestPreprocessForOcr:
+    """Tests for grayscale conversion before OCR."""
+
+    def test_converts_to_8bit_grayscale(self, tmp_path):
+        pil_image = pytest.importorskip("PIL.Image")
+        img_file = tmp_path / "capture.png"
+        img = pil_image.new("RGB", (10, 10), (230, 230, 230))
+        # An anti-aliased edge pixel must keep its intermediate grey level
+        img.putpixel((5, 5), (128, 128, 128))
+        img.save(img_file)
+
+        png = _preprocess_for_ocr(img_file)
+
+        assert png is not None
+        with pil_image.open(io.BytesIO(png)) as result:
+            assert result.mode == "L"
+            assert result.size == (10, 10)
+            assert result.getpixel((0, 0)) == 230
+            assert result.getpixel((5, 5)) == 128
+
+    def test_unreadable_image_returns_none(self, tmp_path):
+        pytest.importorskip("PIL.Image")
+        img_file = tmp_path / "broken.png"
+        img_file.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        assert _preprocess_for_ocr(img_file) is None
+
+
 class TestOcrImage:
     """Tests for ocr_image function."""
 
-    @patch("obsidian_clipper.capture.screenshot.get_config")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
-    def test_ocr_image_success(self, mock_run, mock_get_config, tmp_path):
-        """Test successful OCR."""
-        # Create a dummy image file
-        img_file = tmp_path / "test.png"
-        img_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+    @pytest.fixture(autouse=True)
+    def _stub_get_config(self, monkeypatch, eng_ocr_config):
+        monkeypatch.setattr(screenshot_module, "get_config", lambda: eng_ocr_config)
 
-        mock_config = MagicMock()
-        mock_config.ocr_language = "eng"
-        mock_get_config.return_value = mock_config
-
-        mock_result = MagicMock()
-        mock_result.stdout = "Extracted text from image"
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_success(self, mock_run, img_file):
+        """Test successful OCR."""
+        mock_result = SimpleNamespace(stdout="Extracted text from image")
         mock_run.return_value = mock_result
 
         result = ocr_image(img_file)
 
         assert result == "Extracted text from image"
 
-    @patch("obsidian_clipper.capture.screenshot.get_config")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
-    def test_ocr_image_with_custom_language(self, mock_run, mock_get_config, tmp_path):
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_with_custom_language(self, mock_run, img_file):
         """Test OCR with custom language."""
-        img_file = tmp_path / "test.png"
-        img_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-
-        mock_config = MagicMock()
-        mock_config.ocr_language = "eng"
-        mock_get_config.return_value = mock_config
-
-        mock_result = MagicMock()
-        mock_result.stdout = "Texte extrait"
+        mock_result = SimpleNamespace(stdout="Texte extrait")
         mock_run.return_value = mock_result
 
         result = ocr_image(img_file, language="fra")
 
         assert result == "Texte extrait"
 
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_pipes_preprocessed_image(self, mock_run, tmp_path):
+        """Test the preprocessed image goes to tesseract on stdin, not disk."""
+        pil_image = pytest.importorskip("PIL.Image")
+        img_file = tmp_path / "real.png"
+        pil_image.new("RGB", (8, 8), "white").save(img_file)
+        mock_run.return_value = SimpleNamespace(stdout=b"Piped text\n")
+
+        result = ocr_image(img_file)
+
+        assert result == "Piped text"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["tesseract", "stdin", "stdout"]
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["input_text"].startswith(b"\x89PNG")
+        assert kwargs["text"] is False
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["real.png"]
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_skips_empty_file(self, mock_run, tmp_path):
+        """Test OCR is not attempted on a zero-byte screenshot."""
+        img_file = tmp_path / "empty.png"
+        img_file.write_bytes(b"")
+
+        assert ocr_image(img_file) == ""
+        mock_run.assert_not_called()
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_skips_non_image_file(self, mock_run, tmp_path):
+        """Test OCR is not attempted on a file without an image signature."""
+        img_file = tmp_path / "notes.png"
+        img_file.write_bytes(b"not an image")
+
+        assert ocr_image(img_file) == ""
+        mock_run.assert_not_called()
+
     def test_ocr_image_file_not_found(self, tmp_path):
         """Test OCR with non-existent file returns empty string."""
         result = ocr_image(tmp_path / "nonexistent.png")
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.screenshot.get_config")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
-    def test_ocr_image_failure_raises_error(self, mock_run, mock_get_config, tmp_path):
-        """Test OCR failure raises OCRError."""
-        img_file = tmp_path / "test.png"
-        img_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_timeout_returns_empty(self, mock_run, img_file):
+        """Test a stalled tesseract degrades to no text instead of an error."""
+        mock_run.side_effect = subprocess.TimeoutExpired("tesseract", 5.0)
+
+        assert ocr_image(img_file) == ""
+        mock_run.assert_called_once()
+
+    def test_ocr_timeout_scales_with_pixels(self, tmp_path):
+        """Test the tesseract budget grows with image size up to the cap."""
+        sizes = {"small.png": (100, 100), "large.png": (10000, 10000)}
+        for name, (width, height) in sizes.items():
+            ihdr = b"\x00\x00\x00\x0dIHDR" + width.to_bytes(4, "big")
+            (tmp_path / name).write_bytes(
+                b"\x89PNG\r\n\x1a\n" + ihdr + height.to_bytes(4, "big")
+            )
+
+        assert screenshot_module._ocr_timeout(tmp_path / "small.png") < 6.0
+        assert screenshot_module._ocr_timeout(tmp_path / "large.png") == 30.0
+        assert screenshot_module._ocr_timeout(tmp_path / "missing.png") == 30.0
+
+    def test_ocr_images_runs_in_parallel(self, monkeypatch, tmp_path, png_bytes):
+        """Test every image gets its own concurrent tesseract, order kept."""
+        paths = [tmp_path / f"region{i}.png" for i in range(3)]
+        for path in paths:
+            path.write_bytes(png_bytes)
+        # Only passes if all three tesseract runs are in flight together
+        barrier = threading.Barrier(len(paths), timeout=5)
+
+        def fake_run(cmd, **kwargs):
+            barrier.wait()
+            return SimpleNamespace(stdout=f"text of {Path(cmd[1]).stem}")
+
+        monkeypatch.setattr(screenshot_module, "run_command_safely", fake_run)
+        monkeypatch.setattr(screenshot_module.os, "cpu_count", lambda: 4)
+
+        result = screenshot_module.ocr_images(paths)
+
+        assert result == ["text of region0", "text of region1", "text of region2"]
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_images_single_image_runs_inline(self, mock_run, img_file):
+        """Test a single image skips the thread pool."""
+        threads = []
+
+        def fake_run(cmd, **kwargs):
+            threads.append(threading.current_thread())
+            return SimpleNamespace(stdout="Only region")
 
-        mock_config = MagicMock()
-        mock_config.ocr_language = "eng"
-        mock_get_config.return_value = mock_config
+        mock_run.side_effect = fake_run
 
+        assert screenshot_module.ocr_images([img_file]) == ["Only region"]
+        assert threads == [threading.main_thread()]
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_failure_raises_error(self, mock_run, img_file):
+        """Test OCR failure raises OCRError."""
         mock_run.side_effect = Exception("OCR failed")
 
         with pytest.raises(OCRError, match="OCR processing failed"):
             ocr_image(img_file)
 
-    @patch("obsidian_clipper.capture.screenshot.get_config")
-    @patch("obsidian_clipper.capture.screenshot.run_command_safely")
-    def test_ocr_image_with_tessconfig(self, mock_run, mock_get_config, tmp_path):
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_with_tessconfig(self, mock_run, img_file):
         """Test OCR with tessconfig parameter."""
-        img_file = tmp_path / "test.png"
-        img_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-
-        mock_config = MagicMock()
-        mock_config.ocr_language = "eng"
-        mock_get_config.return_value = mock_config
-
-        mock_result = MagicMock()
-        mock_result.stdout = "Text with config"
+        mock_result = SimpleNamespace(stdout="Text with config")
         mock_run.return_value = mock_result
 
         result = ocr_image(img_file, tessconfig="--psm 6")
@@ -528,40 +965,152 @@ class TestOcrImage:
         assert "--psm 6" in call_args
 
 
+class FakeTessBaseAPI:
+    """Stand-in for tesserocr.PyTessBaseAPI that counts model loads."""
+
+    loads: list[str] = []
+
+    def __init__(self, lang):
+        if lang == "missing":
+            raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+        self.loads.append(lang)
+        self.images = []
+
+    def SetVariable(self, name, value):  # noqa: N802
+        return True
+
+    def SetImage(self, image):  # noqa: N802
+        self.images.append(image)
+
+    def SetImageFile(self, path):  # noqa: N802
+        self.images.append(path)
+
+    def GetUTF8Text(self):  # noqa: N802
+        return f"text {len(self.images)}\n"
+
+
+class TestTesseractApi:
+    """Tests for OCR through the optional tesserocr binding."""
+
+    @pytest.fixture(autouse=True)
+    def fake_tesserocr(self, monkeypatch, eng_ocr_config):
+        monkeypatch.setattr(screenshot_module, "get_config", lambda: eng_ocr_config)
+        monkeypatch.setattr(FakeTessBaseAPI, "loads", [])
+        monkeypatch.setitem(
+            sys.modules, "tesserocr", SimpleNamespace(PyTessBaseAPI=FakeTessBaseAPI)
+        )
+        # Undo the conftest stub so the real cached loader runs
+        monkeypatch.setattr(screenshot_module, "_tesseract_api", _tesseract_api)
+        _tesseract_api.cache_clear()
+        yield
+        _tesseract_api.cache_clear()
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_reuses_api_across_calls(self, mock_run, img_file):
+        """Test the language model is loaded once and tesseract never spawned."""
+        assert ocr_image(img_file) == "text 1"
+        assert ocr_image(img_file) == "text 2"
+
+        assert FakeTessBaseAPI.loads == ["eng"]
+        mock_run.assert_not_called()
+
+    def test_ocr_image_hands_api_a_grayscale_image(self, monkeypatch, tmp_path):
+        """Test the API gets a PIL image directly, with no PNG round trip."""
+        pil_image = pytest.importorskip("PIL.Image")
+        img_file = tmp_path / "real.png"
+        pil_image.new("RGB", (8, 8), "white").save(img_file)
+        monkeypatch.setattr(
+            screenshot_module,
+            "_preprocess_for_ocr",
+            lambda path: pytest.fail("encoded a PNG for the in-process path"),
+        )
+
+        assert ocr_image(img_file) == "text 1"
+
+        (image,) = _tesseract_api("eng").images
+        assert image.mode == "L"
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_loads_each_language_once(self, mock_run, img_file):
+        """Test every OCR language keeps its own loaded model."""
+        ocr_image(img_file, language="deu")
+        ocr_image(img_file, language="eng")
+        ocr_image(img_file, language="deu")
+
+        assert FakeTessBaseAPI.loads == ["deu", "eng"]
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_falls_back_to_cli(self, mock_run, img_file):
+        """Test languages tesserocr cannot load still go through the CLI."""
+        mock_run.return_value = SimpleNamespace(stdout="CLI text")
+
+        assert ocr_image(img_file, language="missing") == "CLI text"
+        mock_run.assert_called_once()
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_image_tessconfig_uses_cli(self, mock_run, img_file):
+        """Test a custom tesseract config is passed to the CLI."""
+        mock_run.return_value = SimpleNamespace(stdout="CLI text")
+
+        assert ocr_image(img_file, tessconfig="--psm 6") == "CLI text"
+        assert FakeTessBaseAPI.loads == []
+
+    @patch(RUN_COMMAND_TARGET)
+    def test_ocr_images_batch_uses_cli(self, mock_run, tmp_path, png_bytes):
+        """Test a batch runs tesseract processes rather than the locked API."""
+        mock_run.return_value = SimpleNamespace(stdout="CLI text")
+        paths = [tmp_path / f"region{i}.png" for i in range(2)]
+        for path in paths:
+            path.write_bytes(png_bytes)
+
+        assert screenshot_module.ocr_images(paths) == ["CLI text", "CLI text"]
+        assert mock_run.call_count == 2
+        assert FakeTessBaseAPI.loads == []
+
+
 class TestScreenshotCapture:
     """Tests for ScreenshotCapture class."""
 
-    @patch("obsidian_clipper.capture.screenshot.take_screenshot")
-    @patch("obsidian_clipper.capture.screenshot.ocr_image")
-    def test_capture_success_with_ocr(self, mock_ocr, mock_take):
+    def test_capture_success_with_ocr(self, monkeypatch):
         """Test successful capture with OCR."""
-        mock_take.return_value = True
-        mock_ocr.return_value = "OCR text"
+        _stub(monkeypatch, "take_screenshot", True)
+        ocr_calls = _stub(monkeypatch, "ocr_image", "OCR text")
 
         capture = ScreenshotCapture(perform_ocr=True)
         path, ocr_text = capture.capture()
 
         assert path is not None
         assert ocr_text == "OCR text"
-        mock_ocr.assert_called_once()
+        assert len(ocr_calls) == 1
 
-    @patch("obsidian_clipper.capture.screenshot.take_screenshot")
-    @patch("obsidian_clipper.capture.screenshot.ocr_image")
-    def test_capture_success_without_ocr(self, mock_ocr, mock_take):
+    def test_capture_success_without_ocr(self, monkeypatch):
         """Test capture without OCR."""
-        mock_take.return_value = True
+        _stub(monkeypatch, "take_screenshot", True)
+        ocr_calls = _stub(monkeypatch, "ocr_image", "OCR text")
 
         capture = ScreenshotCapture(perform_ocr=False)
         path, ocr_text = capture.capture()
 
         assert path is not None
         assert ocr_text == ""
-        mock_ocr.assert_not_called()
+        assert ocr_calls == []
+
+    def test_capture_non_blocking_defers_ocr(self, monkeypatch):
+        """Test non-blocking capture hands OCR text out via wait_ocr."""
+        _stub(monkeypatch, "take_screenshot", True)
+        _stub(monkeypatch, "ocr_image", "OCR text")
+
+        capture = ScreenshotCapture(perform_ocr=True)
+        path, ocr_text = capture.capture(blocking=False)
+
+        assert path is not None
+        assert ocr_text == ""
+        assert capture.wait_ocr() == "OCR text"
+        assert capture.wait_ocr() == ""
 
-    @patch("obsidian_clipper.capture.screenshot.take_screenshot")
-    def test_capture_failure_returns_none(self, mock_take):
+    def test_capture_failure_returns_none(self, monkeypatch):
         """Test capture failure returns None."""
-        mock_take.side_effect = ScreenshotError("Failed")
+        _stub(monkeypatch, "take_screenshot", ScreenshotError("Failed"))
 
         capture = ScreenshotCapture()
         path, ocr_text = capture.capture()
@@ -569,10 +1118,9 @@ class TestScreenshotCapture:
         assert path is None
         assert ocr_text == ""
 
-    @patch("obsidian_clipper.capture.screenshot.take_screenshot")
-    def test_capture_returns_false_not_raises(self, mock_take):
+    def test_capture_returns_false_not_raises(self, monkeypatch):
         """Test capture handles take_screenshot returning False."""
-        mock_take.return_value = False
+        _stub(monkeypatch, "take_screenshot", False)
 
         capture = ScreenshotCapture()
         path, ocr_text = capture.capture()
@@ -617,12 +1165,10 @@ class TestScreenshotCapture:
 
         mock_cleanup.assert_called_once()
 
-    @patch("obsidian_clipper.capture.screenshot.take_screenshot")
-    @patch("obsidian_clipper.capture.screenshot.ocr_image")
-    def test_context_manager_full_usage(self, mock_ocr, mock_take):
+    def test_context_manager_full_usage(self, monkeypatch):
         """Test using ScreenshotCapture as context manager."""
-        mock_take.return_value = True
-        mock_ocr.return_value = "OCR text"
+        _stub(monkeypatch, "take_screenshot", True)
+        _stub(monkeypatch, "ocr_image", "OCR text")
 
         with ScreenshotCapture() as capture:
             path, ocr_text = capture.capture()
@@ -633,20 +1179,58 @@ class TestScreenshotCapture:
 class TestCreateTempScreenshot:
     """Tests for create_temp_screenshot function."""
 
+    @pytest.fixture(autouse=True)
+    def fixed_tempdir(self, monkeypatch):
+        """Pin the temp dir so no probe file is written to the real one."""
+        monkeypatch.setattr(screenshot_module.tempfile, "gettempdir", lambda: "/tmp")
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
     def test_creates_path_in_temp_dir(self):
         """Test that path is in temp directory."""
         path = create_temp_screenshot()
 
-        assert "tmp" in str(path) or "TMP" in str(path).upper()
+        assert path.parent == Path("/tmp")
 
     def test_uses_custom_prefix(self):
         """Test custom prefix in filename."""
         path = create_temp_screenshot(prefix="custom_prefix")
 
-        assert "custom_prefix" in path.name
+        assert path.name.startswith("custom_prefix_")
 
     def test_filename_has_png_extension(self):
         """Test filename has .png extension."""
         path = create_temp_screenshot()
 
         assert path.suffix == ".png"
+
+    def test_prefers_runtime_dir(self, monkeypatch, tmp_path):
+        """Test screenshots go to a private directory under XDG_RUNTIME_DIR."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        path = create_temp_screenshot()
+
+        assert path.parent == tmp_path / "obsidian-clipper"
+        assert path.parent.stat().st_mode & 0o777 == 0o700
+
+    def test_missing_runtime_dir_uses_temp_dir(self, monkeypatch, tmp_path):
+        """Test a stale XDG_RUNTIME_DIR falls back to the temp dir."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "gone"))
+
+        path = create_temp_screenshot()
+
+        assert path.parent == Path("/tmp")
+
+
+def test_import_defers_optional_modules():
+    """Test importing the capture code leaves ctypes and friends unloaded."""
+    deferred = ["ctypes", "concurrent.futures", "logging.handlers"]
+    code = (
+        "import sys, obsidian_clipper.capture.screenshot; "
+        f"print(*[name for name in {deferred!r} if name in sys.modules])"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == []
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from obsidian_clipper.workflow.session import CaptureSession
 
 
@@ -61,3 +63,13 @@ class TestGetNoteFilename:
         session = CaptureSession(ocr_text="OCR result")
         result = session.get_note_filename()
         assert "OCR result" in result
+
+
+class TestSlots:
+    """Tests for CaptureSession's slotted layout."""
+
+    def test_unknown_attribute_rejected(self):
+        session = CaptureSession()
+        with pytest.raises(AttributeError):
+            session.ocrtext = "typo"
+        assert not hasattr(session, "__dict__")
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import subprocess
+import tracemalloc
 
+import pytest
+
+import obsidian_clipper.capture.text as text_module
 from obsidian_clipper.capture.text import (
     copy_to_clipboard,
     get_active_window_title,
@@ -11,101 +15,156 @@ from obsidian_clipper.capture.text import (
 )
 
 
+@pytest.fixture(autouse=True)
+def all_tools_installed(monkeypatch):
+    """Treat every helper program as installed; subprocess is faked anyway."""
+    monkeypatch.setattr(text_module, "find_executable", lambda name: f"/usr/bin/{name}")
+
+
 class TestGetSelectedText:
     """Tests for get_selected_text function."""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_xclip_success(self, mock_run):
+    @pytest.fixture(autouse=True)
+    def x11_session(self, monkeypatch):
+        """Keep the default xclip-first order regardless of the host session."""
+        monkeypatch.setattr(text_module, "_detect_display_server", lambda: "x11")
+
+    def test_get_selected_text_xclip_success(self, fake_subprocess):
         """Test successful text selection retrieval with xclip."""
-        mock_result = MagicMock()
-        mock_result.stdout = "Selected text content"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xclip", stdout="Selected text content")
 
         result = get_selected_text()
 
         assert result == "Selected text content"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_empty(self, mock_run):
+    def test_get_selected_text_empty(self, fake_subprocess):
         """Test empty selection returns empty string."""
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xclip", stdout="")
+        fake_subprocess.register("wl-paste", stdout="")
 
         result = get_selected_text()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_whitespace_only(self, mock_run):
+    def test_get_selected_text_whitespace_only(self, fake_subprocess):
         """Test whitespace-only selection returns empty string."""
-        mock_result = MagicMock()
-        mock_result.stdout = "   \n\t  "
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xclip", stdout="   \n\t  ")
+        fake_subprocess.register("wl-paste", stdout="")
 
         result = get_selected_text()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_multiline(self, mock_run):
+    def test_get_selected_text_multiline(self, fake_subprocess):
         """Test multiline selection is preserved."""
-        mock_result = MagicMock()
-        mock_result.stdout = "Line 1\nLine 2\nLine 3"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xclip", stdout="Line 1\nLine 2\nLine 3")
 
         result = get_selected_text()
 
         assert result == "Line 1\nLine 2\nLine 3"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_xclip_fails_uses_wlpaste(self, mock_run):
+    def test_get_selected_text_decodes_bytes(self, fake_subprocess):
+        """Test byte output is decoded, replacing invalid UTF-8."""
+        fake_subprocess.register("xclip", stdout=b"  caf\xc3\xa9 \xff  ")
+
+        result = get_selected_text()
+
+        assert result == "café \ufffd"
+
+    @pytest.mark.parametrize(
+        "raw",
+        [b"", b" \t\r\n", b"\n\xc2\xa0 text\xe2\x80\x83 \n", b"\x1ctext\x0b"],
+        ids=["empty", "ascii-blanks", "unicode-blanks", "control-blanks"],
+    )
+    def test_decode_stripped_matches_str_strip(self, raw):
+        """Test the memoryview trim gives the same text as decode+strip."""
+        expected = raw.decode("utf-8", "replace").strip()
+
+        assert text_module._decode_stripped(raw) == expected
+
+    def test_get_selected_text_huge_payload_no_extra_copy(self, fake_subprocess):
+        """Test a large selection is copied once while being decoded."""
+        payload = b"x" * (8 * 1024 * 1024)
+        fake_subprocess.register("xclip", stdout=b"\n  " + payload + b"  \n")
+
+        tracemalloc.start()
+        try:
+            result = get_selected_text()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(result) == len(payload)
+        assert peak < 1.5 * len(payload)
+
+    def test_get_selected_text_xclip_fails_uses_wlpaste(self, fake_subprocess):
         """Test fallback to wl-paste when xclip fails."""
-        import subprocess
+        fake_subprocess.register("xclip", returncode=1, stdout=b"")
+        fake_subprocess.register("wl-paste", stdout="Text from wl-paste")
+
+        result = get_selected_text()
 
-        # First call (xclip) fails
-        mock_xclip = MagicMock()
-        mock_xclip.side_effect = subprocess.CalledProcessError(1, [])
+        assert result == "Text from wl-paste"
+        assert fake_subprocess.programs == ["xclip", "wl-paste"]
+
+    def test_get_selected_text_skips_missing_xclip(self, fake_subprocess, monkeypatch):
+        """Test xclip is not spawned when it is not installed."""
+        monkeypatch.setattr(
+            text_module,
+            "find_executable",
+            lambda name: None if name == "xclip" else f"/usr/bin/{name}",
+        )
+        fake_subprocess.register("wl-paste", stdout="Text from wl-paste")
 
-        # Second call (wl-paste) succeeds
-        mock_wl = MagicMock()
-        mock_wl.stdout = "Text from wl-paste"
-        mock_wl.returncode = 0
+        result = get_selected_text()
 
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xclip"]),
-            mock_wl,
-        ]
+        assert result == "Text from wl-paste"
+        assert fake_subprocess.programs == ["wl-paste"]
+
+    def test_get_selected_text_wayland_tries_wlpaste_first(
+        self, fake_subprocess, monkeypatch
+    ):
+        """Test wl-paste is spawned before xclip on Wayland sessions."""
+        monkeypatch.setattr(text_module, "_detect_display_server", lambda: "wayland")
+        fake_subprocess.register("wl-paste", stdout="Text from wl-paste")
 
         result = get_selected_text()
 
         assert result == "Text from wl-paste"
+        assert fake_subprocess.programs == ["wl-paste"]
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_all_fail(self, mock_run):
+    def test_get_selected_text_all_fail(self, fake_subprocess):
         """Test when all clipboard tools fail."""
-        import subprocess
+        fake_subprocess.register("xclip", returncode=1, stdout=b"")
+        fake_subprocess.register("wl-paste", returncode=1, stdout=b"")
+
+        result = get_selected_text()
+
+        assert result == ""
+        assert fake_subprocess.programs == ["xclip", "wl-paste"]
+
+    def test_get_selected_text_timeout_moves_on(self, fake_subprocess):
+        """Test a stuck selection owner moves on to the next reader."""
+        fake_subprocess.register(
+            "xclip", raises=subprocess.TimeoutExpired(["xclip"], 5)
+        )
+        fake_subprocess.register("wl-paste", stdout=b"Text from wl-paste")
+
+        result = get_selected_text()
 
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xclip"]),
-            subprocess.CalledProcessError(1, ["wl-paste"]),
-        ]
+        assert result == "Text from wl-paste"
+        assert fake_subprocess.programs == ["xclip", "wl-paste"]
 
+    def test_get_selected_text_not_installed(self, fake_subprocess):
+        """Test readers that fail to spawn are skipped quietly."""
         result = get_selected_text()
 
         assert result == ""
+        assert fake_subprocess.programs == ["xclip", "wl-paste"]
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_selected_text_unicode(self, mock_run):
+    def test_get_selected_text_unicode(self, fake_subprocess):
         """Test Unicode content is handled correctly."""
-        mock_result = MagicMock()
-        mock_result.stdout = "Unicode: 你好世界 🌍 مرحبا"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xclip", stdout="Unicode: 你好世界 🌍 مرحبا")
 
         result = get_selected_text()
 
@@ -115,199 +174,149 @@ class TestGetSelectedText:
 class TestGetActiveWindowTitle:
     """Tests for get_active_window_title function."""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_success(self, mock_run):
+    @pytest.fixture(autouse=True)
+    def x11_session(self, monkeypatch):
+        """Keep the default xdotool-first order regardless of the host session."""
+        monkeypatch.delenv("HYPRLAND_INSTANCE_SIGNATURE", raising=False)
+        monkeypatch.delenv("SWAYSOCK", raising=False)
+
+    def test_get_active_window_title_hyprland_asks_hyprctl_first(
+        self, fake_subprocess, monkeypatch
+    ):
+        """Test Hyprland sessions skip the xdotool spawn."""
+        monkeypatch.setenv("HYPRLAND_INSTANCE_SIGNATURE", "abc")
+        fake_subprocess.register("hyprctl", stdout='{"title": "Hyprland Window Title"}')
+
+        result = get_active_window_title()
+
+        assert result == "Hyprland Window Title"
+        assert fake_subprocess.programs == ["hyprctl"]
+
+    def test_get_active_window_title_success(self, fake_subprocess):
         """Test getting window title with xdotool."""
-        mock_result = MagicMock()
-        mock_result.stdout = "Document.pdf — Page 10 — Okular"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xdotool", stdout="Document.pdf — Page 10 — Okular")
 
         result = get_active_window_title()
 
         assert result == "Document.pdf — Page 10 — Okular"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_empty(self, mock_run):
+    def test_get_active_window_title_empty(self, fake_subprocess):
         """Test empty window title."""
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xdotool", stdout="")
 
         result = get_active_window_title()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_whitespace(self, mock_run):
+    def test_get_active_window_title_whitespace(self, fake_subprocess):
         """Test whitespace-only title is stripped."""
-        mock_result = MagicMock()
-        mock_result.stdout = "   \n  "
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xdotool", stdout="   \n  ")
 
         result = get_active_window_title()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_command_fails(self, mock_run):
+    def test_get_active_window_title_command_fails(self, fake_subprocess):
         """Test when xdotool command fails."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, ["xdotool"])
+        fake_subprocess.register("xdotool", returncode=1)
 
         result = get_active_window_title()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_not_found(self, mock_run):
-        """Test when xdotool is not installed."""
-        mock_run.side_effect = FileNotFoundError("xdotool not found")
-
+    def test_get_active_window_title_not_found(self, fake_subprocess):
+        """Test when no window title tool is installed."""
         result = get_active_window_title()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_special_chars(self, mock_run):
+    def test_get_active_window_title_special_chars(self, fake_subprocess):
         """Test window title with special characters."""
-        mock_result = MagicMock()
-        mock_result.stdout = "File (1) — App [v2.0] - Edition"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.register("xdotool", stdout="File (1) — App [v2.0] - Edition")
 
         result = get_active_window_title()
 
         assert result == "File (1) — App [v2.0] - Edition"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_timeout(self, mock_run):
+    def test_get_active_window_title_timeout(self, fake_subprocess):
         """Test when xdotool times out."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired(["xdotool"], 5)
+        fake_subprocess.register(
+            "xdotool", raises=subprocess.TimeoutExpired(["xdotool"], 5)
+        )
 
         result = get_active_window_title()
 
         assert result == ""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_hyprctl_fallback(self, mock_run):
+    def test_get_active_window_title_hyprctl_fallback(self, fake_subprocess):
         """Test hyprctl fallback when xdotool returns empty."""
-
-        xdotool_result = MagicMock()
-        xdotool_result.stdout = "  "
-        xdotool_result.returncode = 0
-
-        hyprctl_result = MagicMock()
-        hyprctl_result.stdout = '{"title": "Hyprland Window Title"}'
-        hyprctl_result.returncode = 0
-
-        mock_run.side_effect = [xdotool_result, hyprctl_result]
+        fake_subprocess.register("xdotool", stdout="  ")
+        fake_subprocess.register("hyprctl", stdout='{"title": "Hyprland Window Title"}')
 
         result = get_active_window_title()
 
         assert result == "Hyprland Window Title"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_hyprctl_xdotool_fails(self, mock_run):
+    def test_get_active_window_title_hyprctl_xdotool_fails(self, fake_subprocess):
         """Test hyprctl fallback when xdotool fails entirely."""
-        import subprocess
-
-        hyprctl_result = MagicMock()
-        hyprctl_result.stdout = '{"title": "My App"}'
-        hyprctl_result.returncode = 0
-
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xdotool"]),
-            hyprctl_result,
-        ]
+        fake_subprocess.register("xdotool", returncode=1)
+        fake_subprocess.register("hyprctl", stdout='{"title": "My App"}')
 
         result = get_active_window_title()
 
         assert result == "My App"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_swaymsg_fallback(self, mock_run):
+    def test_get_active_window_title_swaymsg_fallback(self, fake_subprocess):
         """Test swaymsg fallback when xdotool and hyprctl both fail."""
-        import subprocess
-
-        sway_result = MagicMock()
-        sway_result.stdout = '{"nodes": [{"focused": true, "name": "Sway Window"}]}'
-        sway_result.returncode = 0
-
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xdotool"]),
-            subprocess.CalledProcessError(1, ["hyprctl"]),
-            sway_result,
-        ]
+        fake_subprocess.register("xdotool", returncode=1)
+        fake_subprocess.register("hyprctl", returncode=1)
+        fake_subprocess.register(
+            "swaymsg",
+            stdout='{"nodes": [{"focused": true, "name": "Sway Window"}]}',
+        )
 
         result = get_active_window_title()
 
         assert result == "Sway Window"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_swaymsg_nested(self, mock_run):
+    def test_get_active_window_title_swaymsg_nested(self, fake_subprocess):
         """Test swaymsg fallback with nested window tree."""
-        import subprocess
-
-        sway_result = MagicMock()
-        sway_result.stdout = (
-            '{"nodes": [{"focused": false, "nodes": ['
-            '{"focused": true, "name": "Nested Window"}]'
-            "}]} "
+        fake_subprocess.register("xdotool", returncode=1)
+        fake_subprocess.register("hyprctl", returncode=1)
+        fake_subprocess.register(
+            "swaymsg",
+            stdout=(
+                '{"nodes": [{"focused": false, "nodes": ['
+                '{"focused": true, "name": "Nested Window"}]'
+                "}]} "
+            ),
         )
-        sway_result.returncode = 0
-
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xdotool"]),
-            subprocess.CalledProcessError(1, ["hyprctl"]),
-            sway_result,
-        ]
 
         result = get_active_window_title()
 
         assert result == "Nested Window"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_swaymsg_floating(self, mock_run):
+    def test_get_active_window_title_swaymsg_floating(self, fake_subprocess):
         """Test swaymsg fallback finds focused in floating_nodes."""
-        import subprocess
-
-        sway_result = MagicMock()
-        sway_result.stdout = (
-            '{"nodes": [{"focused": false}], '
-            '"floating_nodes": [{"focused": true, "name": "Floating Window"}]}'
+        fake_subprocess.register("xdotool", returncode=1)
+        fake_subprocess.register("hyprctl", returncode=1)
+        fake_subprocess.register(
+            "swaymsg",
+            stdout=(
+                '{"nodes": [{"focused": false}], '
+                '"floating_nodes": [{"focused": true, "name": "Floating Window"}]}'
+            ),
         )
-        sway_result.returncode = 0
-
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xdotool"]),
-            subprocess.CalledProcessError(1, ["hyprctl"]),
-            sway_result,
-        ]
 
         result = get_active_window_title()
 
         assert result == "Floating Window"
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_get_active_window_title_hyprctl_bad_json(self, mock_run):
+    def test_get_active_window_title_hyprctl_bad_json(self, fake_subprocess):
         """Test graceful handling of malformed hyprctl JSON."""
-        import subprocess
-
-        bad_json_result = MagicMock()
-        bad_json_result.stdout = "not json"
-        bad_json_result.returncode = 0
-
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xdotool"]),
-            bad_json_result,
-            subprocess.CalledProcessError(1, ["swaymsg"]),
-        ]
+        fake_subprocess.register("xdotool", returncode=1)
+        fake_subprocess.register("hyprctl", stdout="not json")
+        fake_subprocess.register("swaymsg", returncode=1)
 
         result = get_active_window_title()
 
@@ -317,72 +326,45 @@ class TestGetActiveWindowTitle:
 class TestCopyToClipboard:
     """Tests for copy_to_clipboard function."""
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_copy_with_xclip_success(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+    def test_copy_with_xclip_success(self, fake_subprocess):
+        fake_subprocess.register("xclip")
 
         result = copy_to_clipboard("Hello world")
 
         assert result is True
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[0] == "xclip"
-        assert args[1] == "-selection"
-        assert args[2] == "clipboard"
+        assert fake_subprocess.calls == [["xclip", "-selection", "clipboard"]]
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_copy_falls_back_to_wl_copy(self, mock_run):
-        import subprocess
-
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xclip"]),
-            MagicMock(returncode=0),
-        ]
+    def test_copy_falls_back_to_wl_copy(self, fake_subprocess):
+        fake_subprocess.register("xclip", returncode=1)
+        fake_subprocess.register("wl-copy")
 
         result = copy_to_clipboard("Hello")
 
         assert result is True
-        assert mock_run.call_count == 2
-
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_copy_both_fail(self, mock_run):
-        import subprocess
+        assert fake_subprocess.programs == ["xclip", "wl-copy"]
 
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xclip"]),
-            subprocess.CalledProcessError(1, ["wl-copy"]),
-        ]
+    def test_copy_both_fail(self, fake_subprocess):
+        fake_subprocess.register("xclip", returncode=1)
+        fake_subprocess.register("wl-copy", returncode=1)
 
         result = copy_to_clipboard("Hello")
 
         assert result is False
 
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_copy_primary_selection(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+    def test_copy_primary_selection(self, fake_subprocess):
+        fake_subprocess.register("xclip")
 
         result = copy_to_clipboard("Hello", clipboard="primary")
 
         assert result is True
-        args = mock_run.call_args[0][0]
-        assert args[2] == "primary"
-
-    @patch("obsidian_clipper.capture.text.subprocess.run")
-    def test_copy_primary_wl_copy_flag(self, mock_run):
-        import subprocess
+        assert fake_subprocess.calls[0][2] == "primary"
 
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, ["xclip"]),
-            MagicMock(returncode=0),
-        ]
+    def test_copy_primary_wl_copy_flag(self, fake_subprocess):
+        fake_subprocess.register("xclip", returncode=1)
+        fake_subprocess.register("wl-copy")
 
         result = copy_to_clipboard("Hello", clipboard="primary")
 
         assert result is True
         # Second call should be wl-copy --primary
-        wl_call = mock_run.call_args_list[1]
-        assert "--primary" in wl_call[0][0]
+        assert "--primary" in fake_subprocess.calls[1]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from obsidian_clipper.cli.tui import ConfigTUI, launch_config_ui
@@ -70,14 +71,10 @@ class TestConfigTUISave:
 
         app = ConfigTUI(env_file)
         # Mock the Textual query_one and exit
-        mock_api_key = MagicMock()
-        mock_api_key.value = "newkey123"
-        mock_base_url = MagicMock()
-        mock_base_url.value = "http://localhost:9999"
-        mock_note_path = MagicMock()
-        mock_note_path.value = "Inbox/"
-        mock_attach_dir = MagicMock()
-        mock_attach_dir.value = "Files/"
+        mock_api_key = SimpleNamespace(value="newkey123")
+        mock_base_url = SimpleNamespace(value="http://localhost:9999")
+        mock_note_path = SimpleNamespace(value="Inbox/")
+        mock_attach_dir = SimpleNamespace(value="Files/")
 
         def mock_query(selector, widget_type=None):
             mapping = {
@@ -106,14 +103,10 @@ class TestConfigTUISave:
         # Don't create the parent dirs
 
         app = ConfigTUI(env_file)
-        mock_api_key = MagicMock()
-        mock_api_key.value = ""
-        mock_base_url = MagicMock()
-        mock_base_url.value = "http://127.0.0.1:27124"
-        mock_note_path = MagicMock()
-        mock_note_path.value = ""
-        mock_attach_dir = MagicMock()
-        mock_attach_dir.value = ""
+        mock_api_key = SimpleNamespace(value="")
+        mock_base_url = SimpleNamespace(value="http://127.0.0.1:27124")
+        mock_note_path = SimpleNamespace(value="")
+        mock_attach_dir = SimpleNamespace(value="")
 
         def mock_query(selector, widget_type=None):
             mapping = {
@@ -2,94 +2,225 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
 from obsidian_clipper.utils import (
     CommandError,
+    find_executable,
     notify,
     notify_error,
     notify_success,
     notify_warning,
+    retry_with_backoff,
     run_command_safely,
+    spawn_options,
 )
+from obsidian_clipper.utils import command as command_module
+from obsidian_clipper.utils import notification as notification_module
 
 
 class TestRunCommandSafely:
     """Tests for run_command_safely function."""
 
-    @patch("obsidian_clipper.utils.command.subprocess.run")
+    @pytest.fixture(autouse=True)
+    def mock_run(self, monkeypatch):
+        """Stand in for subprocess.run in every test of this class."""
+        mock = MagicMock()
+        monkeypatch.setattr(command_module.subprocess, "run", mock)
+        return mock
+
     def test_success(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.stdout = "output"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = SimpleNamespace(stdout="output", returncode=0)
 
         result = run_command_safely(["echo", "test"])
         assert result.stdout == "output"
 
-    @patch("obsidian_clipper.utils.command.subprocess.run")
     def test_check_raises_on_error(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "error"
-        mock_run.return_value = mock_result
+        mock_run.return_value = SimpleNamespace(returncode=1, stderr="error")
 
         with pytest.raises(CommandError) as exc_info:
             run_command_safely(["test"], check=True)
         assert exc_info.value.returncode == 1
 
-    @patch("obsidian_clipper.utils.command.subprocess.run")
     def test_timeout_expired(self, mock_run):
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="test", timeout=1)
+        expired = subprocess.TimeoutExpired(cmd="test", timeout=1)
+        mock_run.side_effect = expired
 
-        with pytest.raises(subprocess.TimeoutExpired):
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
             run_command_safely(["test"], timeout=1)
+        assert exc_info.value is expired
+        assert mock_run.call_args.kwargs["timeout"] == 1
 
-    def test_file_not_found(self):
+    def test_file_not_found(self, fake_subprocess):
         with pytest.raises(FileNotFoundError):
             run_command_safely(["nonexistent_command_xyz"], check=True)
+        assert fake_subprocess.programs == ["nonexistent_command_xyz"]
 
 
-class TestNotifications:
-    """Tests for notification functions."""
+class TestSpawnOptions:
+    """Tests for spawn_options function."""
 
-    @patch("obsidian_clipper.utils.notification.run_command_safely")
-    def test_notify_success(self, mock_run):
-        result = notify("Title", "Message")
-        assert result is True
-        mock_run.assert_called_once()
+    def test_resolves_executable_and_keeps_fds(self):
+        options = spawn_options(["echo", "test"])
 
-    @patch("obsidian_clipper.utils.notification.run_command_safely")
-    def test_notify_fallback_to_print(self, mock_run, capsys):
-        mock_run.side_effect = FileNotFoundError()
-        result = notify("Title", "Message")
+        assert options == {"executable": shutil.which("echo"), "close_fds": False}
 
-        assert result is False
-        captured = capsys.readouterr()
-        assert "[NORMAL]" in captured.out
-        assert "Title" in captured.out
+    def test_long_lived_program_closes_fds(self):
+        options = spawn_options(["echo", "test"], long_lived=True)
 
-    @patch("obsidian_clipper.utils.notification.notify")
-    def test_notify_success_helper(self, mock_notify):
-        notify_success("Title", "Message")
-        mock_notify.assert_called_once_with("Title", "Message", "normal", icon=None)
+        assert options == {"executable": shutil.which("echo")}
 
-    @patch("obsidian_clipper.utils.notification.notify")
-    def test_notify_error_helper(self, mock_notify):
-        notify_error("Title", "Message")
-        mock_notify.assert_called_once_with("Title", "Message", "critical")
+    def test_missing_program_uses_defaults(self):
+        assert spawn_options(["nonexistent_command_xyz"]) == {}
 
-    @patch("obsidian_clipper.utils.notification.notify")
-    def test_notify_warning_helper(self, mock_notify):
-        notify_warning("Title", "Message")
-        mock_notify.assert_called_once_with("Title", "Message", "low")
+    @pytest.mark.skipif(
+        not getattr(subprocess, "_USE_POSIX_SPAWN", False),
+        reason="platform has no posix_spawn fast path",
+    )
+    def test_spawns_with_posix_spawn(self, monkeypatch):
+        calls = []
+        real_posix_spawn = os.posix_spawn
+
+        def recording_posix_spawn(path, argv, *args, **kwargs):
+            calls.append((path, argv))
+            return real_posix_spawn(path, argv, *args, **kwargs)
+
+        monkeypatch.setattr(os, "posix_spawn", recording_posix_spawn)
+
+        result = run_command_safely(["echo", "test"])
+
+        assert result.stdout == "test\n"
+        assert calls == [(shutil.which("echo"), ["echo", "test"])]
+
+    def test_find_executable_looks_up_once(self, monkeypatch):
+        lookups = []
+        monkeypatch.setattr(
+            shutil, "which", lambda name: lookups.append(name) or f"/opt/{name}"
+        )
+        find_executable.cache_clear()
+        try:
+            assert find_executable("grim") == "/opt/grim"
+            assert find_executable("grim") == "/opt/grim"
+        finally:
+            find_executable.cache_clear()
+
+        assert lookups == ["grim"]
+
+
+class TestNotifications:
+    """Tests for notification functions."""
+
+    @pytest.fixture(autouse=True)
+    def mock_run(self, monkeypatch):
+        """Stand in for notify-send in every test of this class."""
+        mock = MagicMock()
+        monkeypatch.setattr(notification_module, "run_command_safely", mock)
+        return mock
+
+    @pytest.fixture
+    def mock_notify(self, monkeypatch):
+        """Record what the notify_* helpers pass on to notify()."""
+        mock = MagicMock()
+        monkeypatch.setattr(notification_module, "notify", mock)
+        return mock
+
+    @pytest.mark.parametrize(
+        ("side_effect", "expected", "printed"),
+        [
+            (None, True, ""),
+            (FileNotFoundError(), False, "[NORMAL] Title: Message\n"),
+            (CommandError("no daemon", 1), False, "[NORMAL] Title: Message\n"),
+        ],
+        ids=["sent", "not-installed", "send-failed"],
+    )
+    def test_notify(self, mock_run, capsys, side_effect, expected, printed):
+        mock_run.side_effect = side_effect
+
+        assert notify("Title", "Message") is expected
+        mock_run.assert_called_once()
+        assert capsys.readouterr().out == printed
+
+    @pytest.mark.parametrize(
+        ("helper", "expected_args", "expected_kwargs"),
+        [
+            (notify_success, ("Title", "Message", "normal"), {"icon": None}),
+            (notify_error, ("Title", "Message", "critical"), {}),
+            (notify_warning, ("Title", "Message", "low"), {}),
+        ],
+        ids=["success", "error", "warning"],
+    )
+    def test_notify_helpers(self, mock_notify, helper, expected_args, expected_kwargs):
+        helper("Title", "Message")
+        mock_notify.assert_called_once_with(*expected_args, **expected_kwargs)
 
-    @patch("obsidian_clipper.utils.notification.run_command_safely")
     def test_notify_string_urgency(self, mock_run):
         result = notify("Title", "Message", urgency="critical")
         assert result is True
         call_args = mock_run.call_args[0][0]
         assert "critical" in call_args
+
+
+class TestRetryWithBackoff:
+    """Tests for retry_with_backoff function."""
+
+    @pytest.fixture
+    def sleeps(self):
+        """Collect the delays a retry would have slept for."""
+        return []
+
+    @pytest.fixture
+    def retry(self, sleeps):
+        """Return retry_with_backoff bound to the recording sleep."""
+        return lambda func, **kwargs: retry_with_backoff(
+            func, sleep=sleeps.append, **kwargs
+        )
+
+    @pytest.mark.parametrize(
+        ("results", "max_attempts", "expected", "calls"),
+        [
+            (["done"], 3, "done", 1),
+            ([None, "", "done"], 5, "done", 3),
+            ([None, None, "late"], 2, None, 2),
+            ([0, [], ""], 3, "", 3),
+        ],
+        ids=["first-try", "third-try", "exhausted", "last-falsy-returned"],
+    )
+    def test_retries_until_truthy(
+        self, retry, sleeps, results, max_attempts, expected, calls
+    ):
+        func = MagicMock(side_effect=results)
+
+        result = retry(func, max_attempts=max_attempts, delay=0.01)
+
+        assert result == expected
+        assert func.call_count == calls
+        assert len(sleeps) == calls - 1
+
+    def test_should_retry_overrides_truthiness(self, retry):
+        func = MagicMock(side_effect=["", "retry-me", "ok"])
+
+        result = retry(func, delay=0.01, should_retry=lambda r: r == "retry-me")
+
+        assert result == ""
+        assert func.call_count == 1
+
+    def test_backoff_capped_by_max_delay(self, retry, sleeps):
+        func = MagicMock(return_value=None)
+
+        result = retry(func, max_attempts=6, delay=0.01, backoff=2.0, max_delay=0.05)
+
+        assert result is None
+        assert sleeps == pytest.approx([0.01, 0.02, 0.04, 0.05, 0.05])
+
+    def test_retries_after_errors_then_raises(self, retry, sleeps):
+        func = MagicMock(side_effect=OSError("busy"))
+
+        with pytest.raises(OSError):
+            retry(func, max_attempts=3, delay=0.5)
+        assert sleeps == [0.5, 0.5]